@@ -0,0 +1,194 @@
+from typing import Dict, List, Set, Tuple
+
+from Automaton.Automaton import Automaton
+from Automaton.Slicer import Slicer
+from Automaton.Simplifier import Simplifier
+
+
+class BatchAnalyser:
+    # the options are keyword only, so that new ones can be added in any
+    # place without callers passing them to the wrong parameter
+    def __init__(self, automaton, *, method="interval", slice=True,
+                 simplify=False, collapsed=True, max_fragments=None,
+                 summaries=False, encoding="z3", solvers=None,
+                 disjunctive=False, real=False, booleans=False, seed=False,
+                 simulation_budget=0, simulator="breadth-first",
+                 bounded_steps=0, simulation_seed=0):
+        self.automaton: Automaton = automaton
+        self.method = method
+        self.encoding = encoding
+        self.solvers = solvers
+        self.disjunctive = disjunctive
+        self.real = real
+        self.booleans = booleans
+        self.seed = seed
+        self.bounded_steps = bounded_steps
+        self.collapsed = collapsed
+        self.max_fragments = max_fragments
+
+        # the number of states the concrete simulation explores before the
+        # analysis of each configuration, 0 to not simulate
+        self.simulation_budget = simulation_budget
+        self.simulator = simulator
+        self.simulation_seed = simulation_seed
+
+        # whether configurations that only differ in their initial value
+        # are answered from the summaries of a single backward analysis
+        # rather than a separate forward analysis each
+        self.summaries = summaries and method == "interval"
+
+        # the visible Q nodes represent the lines of code
+        self.targets: List[str] = [node for node in
+                                   automaton.get_visible_nodes()
+                                   if node[0] == "Q"]
+
+        # map each source line to the Q nodes representing it
+        # a line is reachable as soon as one of its nodes is reachable
+        self.lines: Dict[str, List[str]] = dict()
+        for node in self.targets:
+            label = automaton.get_node_label(node)
+            if label is None:
+                continue
+            line = label.split(".")[0]
+            if line not in self.lines:
+                self.lines[line] = list()
+            self.lines[line].append(node)
+
+        # slicing and simplifying only depend on the graph, so this work
+        # is shared by all configurations
+        self.analysed: Automaton = automaton
+        if slice:
+            self.analysed = Slicer(self.analysed).slice(self.targets)
+
+        self.simplifier = None
+        if simplify:
+            self.simplifier = Simplifier(self.analysed, self.targets)
+            self.analysed = self.simplifier.simplify()
+
+        # the compiled transfers of the interval engine are shared as well
+        # these are compiled by the first configuration
+        self.transfers = None
+
+    def get_lines(self) -> List[str]:
+        return list(self.lines.keys())
+
+    # get the node of the analysed automaton that decides the reachability
+    # of the given node, None if the node got sliced away
+    def get_analysed_node(self, node):
+        if self.simplifier is not None:
+            node = self.simplifier.get_representative(node)
+        if node is None or not self.analysed.node_exists(node):
+            return None
+        return node
+
+    def get_analysed_targets(self) -> List[str]:
+        targets = list()
+        for target in self.targets:
+            node = self.get_analysed_node(target)
+            if node is not None:
+                targets.append(node)
+        return targets
+
+    # analyse every configuration, given as (start, low, high) tuples
+    # the result maps each configuration to the verdict of each line
+    def analyse(self, configurations) -> Dict[Tuple, Dict[str, bool]]:
+        table = dict()
+        summary_managers = dict()
+        for configuration in configurations:
+            start, low, high = configuration
+            if not self.summaries:
+                table[configuration] = self.analyse_configuration(start, low,
+                                                                  high)
+                continue
+
+            if (low, high) not in summary_managers:
+                summary_managers[(low, high)] = \
+                    self.create_summary_manager(low, high)
+            manager = summary_managers[(low, high)]
+            table[configuration] = self.get_verdicts(
+                lambda node: manager.is_reachable(node, start))
+        return table
+
+    def create_summary_manager(self, low, high):
+        # imported here so that the formula method does not pay for it
+        from Reach.SummaryManager import SummaryManager
+
+        self.analysed.set_lower_bound(low)
+        self.analysed.set_upper_bound(high)
+        return SummaryManager(self.analysed, collapsed=self.collapsed,
+                              max_fragments=self.max_fragments)
+
+    def get_verdicts(self, is_reachable) -> Dict[str, bool]:
+        verdicts = dict()
+        for line in self.lines:
+            verdicts[line] = False
+            for node in self.lines[line]:
+                node = self.get_analysed_node(node)
+                if node is not None and is_reachable(node):
+                    verdicts[line] = True
+                    break
+        return verdicts
+
+    def analyse_configuration(self, start, low, high) -> Dict[str, bool]:
+        self.analysed.set_initial_value(start)
+        self.analysed.set_lower_bound(low)
+        self.analysed.set_upper_bound(high)
+
+        simulated = self.simulate()
+        if self.method == "interval":
+            reachable = self.find_reachable_with_interval(simulated)
+        else:
+            reachable = self.find_reachable_with_formula(simulated)
+
+        return self.get_verdicts(lambda node: node in reachable)
+
+    # the nodes reached by concrete runs, these are left out of the analysis
+    def simulate(self) -> Set[str]:
+        if self.simulation_budget <= 0:
+            return set()
+
+        # imported here so that the analysis without simulation does not
+        # pay for it
+        from Reach.Simulator import create_simulator
+
+        # the formula excludes the bounds of the automaton, the simulation
+        # must not reach a node only by taking these
+        simulator = create_simulator(self.analysed, self.simulation_budget,
+                                     self.simulator,
+                                     self.method == "formula",
+                                     self.simulation_seed)
+        simulator.set_targets(self.get_analysed_targets())
+        return simulator.run()
+
+    def find_reachable_with_interval(self, simulated):
+        # imported here so that the formula method does not pay for it
+        from Reach.ReachManager import ReachManager
+
+        manager = ReachManager(self.analysed, collapsed=self.collapsed,
+                               max_fragments=self.max_fragments,
+                               transfers=self.transfers)
+        self.transfers = manager.get_transfers()
+
+        manager.set_targets([target for target in self.get_analysed_targets()
+                             if target not in simulated])
+        while not manager.is_finished():
+            manager.update_automaton()
+
+        return {node for node in self.get_analysed_targets()
+                if node in simulated or manager.is_reachable(node)}
+
+    def find_reachable_with_formula(self, simulated):
+        # the formula is only needed if the simulation left a line undecided
+        if set(self.get_analysed_targets()) <= simulated:
+            return simulated
+
+        # the solver stack pulls in z3, only load it when it is used
+        from Equations.EquationSolver import EquationSolver
+
+        solver = EquationSolver(self.analysed, encoding=self.encoding,
+                                solvers=self.solvers,
+                                disjunctive=self.disjunctive,
+                                real=self.real, booleans=self.booleans,
+                                seed=self.seed,
+                                bounded_steps=self.bounded_steps)
+        return set(solver.analyse(known_reachable=simulated))
@@ -0,0 +1,68 @@
+import json
+
+from typing import Dict, List, Set
+
+from Automaton.Automaton import Automaton
+
+
+class VerdictWriter:
+    def __init__(self, stream, automaton: Automaton, file, function):
+        self.stream = stream              # the stream the verdicts go to
+        self.file = file                  # the analysed code file
+        self.function = function          # the analysed function
+
+        # map each source line to the visible Q nodes representing it
+        # a line is reachable as soon as one of its nodes is reachable
+        self.lines: Dict[str, List[str]] = dict()
+        self.node_lines: Dict[str, str] = dict()
+        for node in automaton.get_visible_nodes():
+            if node[0] != "Q":
+                continue
+            label = automaton.get_node_label(node)
+            if label is None:
+                continue
+            line = label.split(".")[0]
+            if line not in self.lines:
+                self.lines[line] = list()
+            self.lines[line].append(node)
+            self.node_lines[node] = line
+
+        # track the lines for which a verdict was already written
+        self.decided: Set[str] = set()
+        self.fully_reachable = True
+
+    def get_undecided_nodes(self) -> List[str]:
+        result = list()
+        for line in self.lines:
+            if line not in self.decided:
+                result += self.lines[line]
+        return result
+
+    def node_reachable(self, node):
+        if node in self.node_lines:
+            self.write(self.node_lines[node], True)
+
+    def finish(self):
+        # every line that has not been proven reachable by now is not
+        for line in self.lines:
+            self.write(line, False)
+
+    def write(self, line, reachable):
+        if line in self.decided:
+            return
+
+        self.decided.add(line)
+        if not reachable:
+            self.fully_reachable = False
+
+        verdict = {
+            "file": self.file,
+            "function": self.function,
+            "line": line,
+            "reachable": reachable
+        }
+        self.stream.write(json.dumps(verdict) + "\n")
+        self.stream.flush()
+
+    def is_fully_reachable(self) -> bool:
+        return self.fully_reachable
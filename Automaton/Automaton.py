@@ -165,6 +165,9 @@ class Automaton:
     def get_initial_node(self):
         return self.initial_node
 
+    def set_initial_node(self, node):
+        self.initial_node = node
+
     def get_lower_bound(self) -> int:
         return self.lower_bound
 
@@ -185,6 +188,9 @@ class Automaton:
     def get_loops(self) -> List[Loop]:
         return self.loops
 
+    def set_loops(self, loops: List[Loop]):
+        self.loops = loops
+
     def set_initial_value(self, initial):
         self.initial_value = initial
 
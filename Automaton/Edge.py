@@ -2,6 +2,8 @@ from Automaton.Expression import Expression
 
 
 class Edge:
+    __slots__ = ("start", "end", "label", "operation")
+
     def __init__(self, start, end):
         self.start = start
         self.end = end
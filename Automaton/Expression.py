@@ -2,18 +2,21 @@ import operator
 
 
 class Expression:
+    __slots__ = ("op", "const")
+
+    # shared by all expressions
+    op_to_string = {
+        operator.le: "<=",
+        operator.ge: ">=",
+        operator.eq: "=",
+        operator.add: "+",
+        operator.sub: "-"
+    }
+
     def __init__(self, op, const):
         self.op = op
         self.const = const
 
-        self.op_to_string = {
-            operator.le: "<=",
-            operator.ge: ">=",
-            operator.eq: "=",
-            operator.add: "+",
-            operator.sub: "-"
-        }
-
     def apply(self, val) -> int:
         return self.op(val, self.const)
 
@@ -106,6 +106,11 @@ class LoopFinder:
 
 
 class Loop:
+    __slots__ = ("nodes", "max_bound", "max_bounded_node",
+                 "max_preceding_node", "min_bound", "min_bounded_node",
+                 "min_preceding_node", "expanded_up", "expanded_down",
+                 "contains_sub", "contains_add")
+
     def __init__(self, nodes):
         self.nodes: List[str] = nodes
 
@@ -1,4 +1,6 @@
 class Node:
+    __slots__ = ("name", "label", "condition", "invisible")
+
     def __init__(self, name):
         self.name = name
         self.label = None
@@ -0,0 +1,219 @@
+import operator
+
+from typing import Dict, List, Set
+
+from Automaton.Automaton import Automaton
+from Automaton.Expression import Expression
+
+
+class Simplifier:
+    def __init__(self, automaton, targets=None):
+        self.automaton: Automaton = automaton
+
+        # the nodes of which the reachability must remain known
+        # if None, this holds for all visible nodes
+        if targets is None:
+            targets = automaton.get_visible_nodes().keys()
+        self.targets: Set[str] = set(targets)
+
+        # working copy of the graph, every edge is stored as its operation
+        # where None represents an edge without operation
+        self.successors: Dict[str, Dict[str, Expression]] = dict()
+        self.predecessors: Dict[str, Set[str]] = dict()
+        self.labels: Dict[str, Dict[str, str]] = dict()
+        self.removed: Set[str] = set()
+
+        # map every removed node to the node that has the exact same
+        # reachability within the simplified automaton
+        self.representatives: Dict[str, str] = dict()
+
+        # the inverse of the above, map every node of the simplified
+        # automaton to all the original nodes it represents
+        self.represented: Dict[str, List[str]] = dict()
+
+    def initialise_graph(self):
+        for node in self.automaton.get_nodes():
+            self.successors[node] = dict()
+            self.predecessors[node] = set()
+            self.labels[node] = dict()
+
+        for start in self.automaton.get_nodes():
+            for end, edge in self.automaton.get_outgoing_edges(start).items():
+                self.add_edge(start, end, edge.get_operation(),
+                              edge.get_label())
+
+    def add_edge(self, start, end, operation, label=None):
+        self.successors[start][end] = operation
+        self.predecessors[end].add(start)
+        self.labels[start][end] = label
+
+    def remove_edge(self, start, end):
+        self.successors[start].pop(end)
+        self.predecessors[end].discard(start)
+        self.labels[start].pop(end)
+
+    def simplify(self) -> Automaton:
+        self.initialise_graph()
+
+        changed = True
+        while changed:
+            changed = False
+            for node in self.automaton.get_nodes():
+                if node in self.removed or not self.is_removable(node):
+                    continue
+                if self.fold_identity_edge(node):
+                    changed = True
+                elif self.merge_chain(node):
+                    changed = True
+
+        for node in self.automaton.get_nodes():
+            representative = self.get_representative(node)
+            if representative is None:
+                continue
+            if representative not in self.represented:
+                self.represented[representative] = list()
+            self.represented[representative].append(node)
+
+        return self.build_automaton()
+
+    # only unguarded visible nodes that are not the initial node can be
+    # removed, as these do not restrict the counter in any way
+    def is_removable(self, node) -> bool:
+        if self.automaton.is_invisible(node):
+            return False
+        if self.automaton.is_initial(node):
+            return False
+        return self.automaton.get_node_condition(node) is None
+
+    @staticmethod
+    def get_value(operation):
+        if operation is None:
+            return 0
+        value = operation.get_value()
+        if type(value) is not int:
+            return None
+        return value
+
+    @staticmethod
+    def create_operation(value):
+        if value > 0:
+            return Expression(operator.add, value)
+        else:
+            return Expression(operator.sub, -value)
+
+    # merge a node into its only predecessor if the edge between them
+    # does not alter the counter, both then have the exact same reach
+    def fold_identity_edge(self, node) -> bool:
+        if len(self.predecessors[node]) != 1:
+            return False
+
+        start = next(iter(self.predecessors[node]))
+        if start == node or self.automaton.is_invisible(start):
+            return False
+
+        if self.get_value(self.successors[start][node]) != 0:
+            return False
+
+        # the moved edges may not clash with an existing different edge
+        for end, operation in self.successors[node].items():
+            if end in self.successors[start]:
+                if str(self.successors[start][end]) != str(operation):
+                    return False
+
+        self.remove_edge(start, node)
+        for end in list(self.successors[node].keys()):
+            operation = self.successors[node][end]
+            label = self.labels[node][end]
+            self.remove_edge(node, end)
+            if end not in self.successors[start]:
+                self.add_edge(start, end, operation, label)
+
+        self.removed.add(node)
+        self.representatives[node] = start
+        return True
+
+    # replace u -a-> node -b-> w by u -(a+b)-> w
+    # the continuous counter can increase by anything in (0, a] and then
+    # by anything in (0, b], which is exactly an increase in (0, a+b]
+    # this only holds if both operations share the same sign
+    def merge_chain(self, node) -> bool:
+        if len(self.predecessors[node]) != 1:
+            return False
+        if len(self.successors[node]) != 1:
+            return False
+
+        start = next(iter(self.predecessors[node]))
+        end = next(iter(self.successors[node]))
+        if node in [start, end] or start == end:
+            return False
+        if end in self.successors[start]:
+            return False
+
+        first = self.get_value(self.successors[start][node])
+        second = self.get_value(self.successors[node][end])
+        if first is None or second is None:
+            return False
+        if first * second <= 0:
+            return False
+
+        # the end node is only an exact representative if it has no
+        # other predecessor and does not restrict the counter
+        exact = len(self.predecessors[end]) == 1 and \
+            self.automaton.get_node_condition(end) is None
+        if node in self.targets and not exact:
+            return False
+
+        self.remove_edge(start, node)
+        self.remove_edge(node, end)
+        self.add_edge(start, end, self.create_operation(first + second))
+
+        self.removed.add(node)
+        if exact:
+            self.representatives[node] = end
+        return True
+
+    def build_automaton(self) -> Automaton:
+        simplified = Automaton(self.automaton.name,
+                               self.automaton.get_lower_bound(),
+                               self.automaton.get_upper_bound())
+        simplified.set_initial_value(self.automaton.get_initial_value())
+
+        for node_name in self.automaton.get_nodes():
+            if node_name in self.removed:
+                continue
+            node = self.automaton.get_node(node_name)
+            simplified.create_new_node(node_name)
+            simplified.add_label_to_node(node_name, node.get_label())
+            simplified.add_condition_to_node(node_name, node.get_condition())
+            if node.is_invisible():
+                simplified.set_node_invisible(node_name)
+
+        for start in self.successors:
+            if start in self.removed:
+                continue
+            for end, operation in self.successors[start].items():
+                simplified.create_new_edge(start, end)
+                simplified.add_label_to_edge(start, end,
+                                             self.labels[start][end])
+                simplified.add_operation_to_edge(start, end, operation)
+
+        simplified.set_initial_node(self.automaton.get_initial_node())
+        simplified.initialize_loops()
+
+        return simplified
+
+    # get the node of the simplified automaton that has the same
+    # reachability as the given node of the original automaton
+    # None is returned for removed nodes without such a node
+    def get_representative(self, node):
+        while node in self.removed:
+            if node not in self.representatives:
+                return None
+            node = self.representatives[node]
+        return node
+
+    # get all nodes of the original automaton represented by the given node
+    def get_represented_nodes(self, node) -> List[str]:
+        if node in self.represented:
+            return self.represented[node]
+        return list()
@@ -0,0 +1,100 @@
+from typing import Dict, List, Set
+
+from Automaton.Automaton import Automaton
+
+
+class Slicer:
+    def __init__(self, automaton):
+        self.automaton: Automaton = automaton
+
+        # map every node to the nodes with an edge towards it
+        self.predecessors: Dict[str, List[str]] = dict()
+        self.initialise_predecessors()
+
+    def initialise_predecessors(self):
+        for node in self.automaton.get_nodes():
+            self.predecessors[node] = list()
+
+        for start in self.automaton.get_nodes():
+            for end in self.automaton.get_outgoing_edges(start):
+                self.predecessors[end].append(start)
+
+    def find_forward_reachable(self) -> Set[str]:
+        visited = set()
+        stack = [self.automaton.get_initial_node()]
+        while stack:
+            node = stack.pop()
+            if node in visited:
+                continue
+            visited.add(node)
+            stack += self.automaton.get_outgoing_edges(node).keys()
+        return visited
+
+    def find_backward_reachable(self, targets) -> Set[str]:
+        visited = set()
+        stack = [target for target in targets
+                 if self.automaton.node_exists(target)]
+        while stack:
+            node = stack.pop()
+            if node in visited:
+                continue
+            visited.add(node)
+            stack += self.predecessors[node]
+        return visited
+
+    # get the nodes that lie on a path from the initial node to one of
+    # the targets, the counter values are not taken into account so any
+    # node outside of this set can never influence the reach of a target
+    def find_relevant_nodes(self, targets) -> Set[str]:
+        relevant = self.find_forward_reachable()
+        relevant &= self.find_backward_reachable(targets)
+        relevant.add(self.automaton.get_initial_node())
+        return relevant
+
+    def slice(self, targets) -> Automaton:
+        relevant = self.find_relevant_nodes(targets)
+        initial = self.automaton.get_initial_node()
+
+        sliced = Automaton(self.automaton.name,
+                           self.automaton.get_lower_bound(),
+                           self.automaton.get_upper_bound())
+        sliced.set_initial_value(self.automaton.get_initial_value())
+
+        # keep the invisible nodes that point to the initial node
+        # as these mark the initial node
+        kept = set(relevant)
+        for node in self.predecessors[initial]:
+            if self.automaton.is_invisible(node):
+                kept.add(node)
+
+        for node_name in self.automaton.get_nodes():
+            if node_name not in kept:
+                continue
+            node = self.automaton.get_node(node_name)
+            sliced.create_new_node(node_name)
+            sliced.add_label_to_node(node_name, node.get_label())
+            sliced.add_condition_to_node(node_name, node.get_condition())
+            if node.is_invisible():
+                sliced.set_node_invisible(node_name)
+
+        for start in self.automaton.get_nodes():
+            if start not in kept:
+                continue
+            for end, edge in self.automaton.get_outgoing_edges(start).items():
+                if end not in relevant:
+                    continue
+                sliced.create_new_edge(start, end)
+                sliced.add_label_to_edge(start, end, edge.get_label())
+                sliced.add_operation_to_edge(start, end, edge.get_operation())
+
+        sliced.set_initial_node(initial)
+
+        # all nodes of a loop reach each other, so a loop is either
+        # completely part of the slice or not at all
+        loops = list()
+        for loop in self.automaton.get_loops():
+            if loop.get_nodes()[0] in relevant:
+                loops.append(loop)
+        sliced.set_loops(loops)
+
+        return sliced
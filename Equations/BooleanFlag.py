@@ -0,0 +1,79 @@
+import z3
+
+
+# an inclusivity flag encoded as two booleans rather than an integer
+# the integer values map to
+#   0 -> exclusive, 1 -> inclusive, 2 -> infinite
+# the flag is infinite if inf holds, incl is meaningless in that case
+# comparisons with integers and other flags behave as for the integer flag
+class BooleanFlag:
+    __slots__ = ("encoder", "inf", "incl")
+
+    def __init__(self, encoder, name):
+        self.encoder = encoder
+        self.inf = encoder.Bool("{}_inf".format(name))
+        self.incl = encoder.Bool("{}_incl".format(name))
+
+    def is_value(self, value):
+        if value == 2:
+            return self.inf
+        if value == 1:
+            return self.encoder.And(self.encoder.Not(self.inf), self.incl)
+        if value == 0:
+            return self.encoder.And(self.encoder.Not(self.inf),
+                                    self.encoder.Not(self.incl))
+        return False
+
+    def is_at_most(self, value):
+        if isinstance(value, BooleanFlag):
+            return value.is_at_least(self)
+        if value >= 2:
+            return True
+        if value == 1:
+            return self.encoder.Not(self.inf)
+        return self.is_value(value)
+
+    def is_at_least(self, value):
+        if isinstance(value, BooleanFlag):
+            return self.encoder.Or(
+                self.inf,
+                self.encoder.And(self.encoder.Not(value.inf),
+                                 self.encoder.Or(self.encoder.Not(value.incl),
+                                                 self.incl)))
+        if value <= 0:
+            return True
+        if value == 1:
+            return self.encoder.Or(self.inf, self.incl)
+        return self.is_value(value)
+
+    def __eq__(self, other):
+        if isinstance(other, BooleanFlag):
+            return self.encoder.And(
+                self.inf == other.inf,
+                self.encoder.Or(self.inf, self.incl == other.incl))
+        return self.is_value(other)
+
+    def __ne__(self, other):
+        return self.encoder.Not(self == other)
+
+    def __le__(self, other):
+        return self.is_at_most(other)
+
+    def __ge__(self, other):
+        return self.is_at_least(other)
+
+    def __lt__(self, other):
+        return self.encoder.Not(self.is_at_least(other))
+
+    def __gt__(self, other):
+        return self.encoder.Not(self.is_at_most(other))
+
+    __hash__ = None
+
+    # the integer value of the flag within the given model
+    def evaluate(self, model):
+        if z3.is_true(model[self.inf]):
+            return 2
+        if z3.is_true(model[self.incl]):
+            return 1
+        return 0
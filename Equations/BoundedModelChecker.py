@@ -0,0 +1,198 @@
+from z3 import sat
+from typing import Dict, List
+
+
+# searches for runs of at most a given number of steps that reach the nodes
+# the automaton is unrolled step by step, every step only holds the node and
+# the value of the counter, so the formula stays small for short runs
+# the counter is continuous as in the interval analysis, an increment by z
+# allows any increase in (0, z] and a decrement by z any decrease in (0, z]
+# every node found is reachable, but a node that is not found within the
+# bound can still be reachable
+class BoundedModelChecker:
+    def __init__(self, automaton, encoder, debug=False, max_steps=16,
+                 solver=None):
+        self.automaton = automaton
+        self.debug = debug
+
+        # the bound on the length of the runs, the runs are searched with a
+        # bound that doubles from 1 until it reaches max_steps
+        self.max_steps = max_steps
+
+        # the counter is continuous, so the encoder should use reals
+        # the solver of the encoder is used unless another one is given,
+        # such as a ProcessSolver for external solvers
+        self.encoder = encoder
+        if solver is None:
+            solver = self.encoder.create_solver()
+        self.s = solver
+
+        self.nodes = list(self.automaton.get_visible_nodes().keys())
+        self.node_indexes: Dict[str, int] = \
+            {node: i for i, node in enumerate(self.nodes)}
+
+        # the node and the value of the counter after each step
+        # a node is given by its index
+        self.positions = list()
+        self.values = list()
+
+        # keep track of the found parameters
+        # the same variable is used every time we refer to a parameter
+        self.vars = dict()
+
+        self.add_initial_condition()
+
+    def get_variable(self, name):
+        if name not in self.vars:
+            self.vars[name] = self.encoder.Variable(name)
+        return self.vars[name]
+
+    # the condition that the counter holds the value within the node
+    def is_allowed(self, node, value):
+        node_condition = self.automaton.get_node_condition(node)
+        if node_condition is None:
+            return True
+
+        bound = node_condition.get_value()
+        if type(bound) is not int:
+            bound = self.get_variable(bound)
+
+        operation = node_condition.get_operation()
+        if operation == "<=":
+            return value <= bound
+        if operation == ">=":
+            return value >= bound
+        return value == bound
+
+    # the condition that the counter lies within the bounds of the
+    # automaton, these exclude the bounds themselves as in the full
+    # encoding, so that every run found is also found by that encoding
+    def is_in_bounds(self, value):
+        condition = list()
+
+        lower_bound = self.automaton.get_lower_bound()
+        if lower_bound != -float('inf'):
+            condition.append(value > lower_bound)
+        upper_bound = self.automaton.get_upper_bound()
+        if upper_bound != float('inf'):
+            condition.append(value < upper_bound)
+
+        return self.encoder.And(condition)
+
+    # the condition that the edge moves the counter from value to next
+    def is_moved(self, operation, value, next_value):
+        shift = 0 if operation is None else operation.get_value()
+
+        if type(shift) is int:
+            if shift > 0:
+                return self.encoder.And(next_value > value,
+                                        next_value <= value + shift)
+            if shift < 0:
+                return self.encoder.And(next_value >= value + shift,
+                                        next_value < value)
+            return next_value == value
+
+        shift = self.get_variable(shift)
+        return self.encoder.Or(
+            self.encoder.And(shift > 0, next_value > value,
+                             next_value <= value + shift),
+            self.encoder.And(shift < 0, next_value >= value + shift,
+                             next_value < value),
+            self.encoder.And(shift == 0, next_value == value))
+
+    def add_initial_condition(self):
+        position = self.encoder.Variable("p_0")
+        value = self.encoder.Variable("v_0")
+        self.positions.append(position)
+        self.values.append(value)
+
+        initial = self.automaton.get_initial_node()
+        self.s.add(position == self.node_indexes[initial])
+        self.s.add(value == self.automaton.get_initial_value())
+
+        # as in the full encoding the initial value is only bounded by the
+        # condition of the initial node
+        self.s.add(self.is_allowed(initial, value))
+
+    # unroll the automaton by one more step
+    def add_step(self):
+        step = len(self.positions)
+        position = self.positions[-1]
+        value = self.values[-1]
+        next_position = self.encoder.Variable("p_{}".format(step))
+        next_value = self.encoder.Variable("v_{}".format(step))
+        self.positions.append(next_position)
+        self.values.append(next_value)
+
+        # a run may also stop, so that every shorter run is part of a run
+        # of the full length
+        choices = [self.encoder.And(next_position == position,
+                                    next_value == value)]
+        for start in self.nodes:
+            outgoing = self.automaton.get_outgoing_edges(start)
+            for end, edge in outgoing.items():
+                if end not in self.node_indexes:
+                    continue
+                choices.append(self.encoder.And(
+                    position == self.node_indexes[start],
+                    next_position == self.node_indexes[end],
+                    self.is_moved(edge.get_operation(), value, next_value),
+                    self.is_in_bounds(next_value),
+                    self.is_allowed(end, next_value)))
+        self.s.add(self.encoder.Or(choices))
+
+    def unroll(self, steps):
+        while len(self.positions) <= steps:
+            self.add_step()
+
+    # the condition that the run visits the node within the unrolled steps
+    def is_visited(self, node):
+        index = self.node_indexes[node]
+        return self.encoder.Or([position == index
+                                for position in self.positions])
+
+    # find the nodes reached by runs of at most max_steps steps, every run
+    # found marks all the nodes it visits
+    # only the nodes in unchecked_nodes are searched for, all by default
+    def analyse(self, on_reachable=None, unchecked_nodes=None) -> List[str]:
+        if unchecked_nodes is None:
+            unchecked_nodes = self.nodes
+        unchecked_nodes = [node for node in unchecked_nodes
+                           if node in self.node_indexes]
+        reachable_nodes = list()
+
+        steps = 1
+        while unchecked_nodes:
+            self.unroll(steps)
+
+            # ask for a run through any of the unchecked nodes, until
+            # there is none within the current bound
+            while unchecked_nodes:
+                self.s.push()
+                self.s.add(self.encoder.Or([self.is_visited(node)
+                                            for node in unchecked_nodes]))
+                result = self.s.check()
+                if result == sat:
+                    model = self.s.model()
+                    visited = {model[position].as_long()
+                               for position in self.positions}
+                    for node in list(unchecked_nodes):
+                        if self.node_indexes[node] in visited:
+                            unchecked_nodes.remove(node)
+                            reachable_nodes.append(node)
+                            if on_reachable is not None:
+                                on_reachable(node)
+                self.s.pop()
+
+                if result != sat:
+                    break
+
+            if self.debug:
+                print("Found {} reachable nodes within {} steps".format(
+                    len(reachable_nodes), steps))
+
+            if steps >= self.max_steps:
+                break
+            steps = min(2 * steps, self.max_steps)
+
+        return reachable_nodes
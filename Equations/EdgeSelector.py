@@ -0,0 +1,51 @@
+from typing import Dict
+
+import z3
+
+
+# the edge used to generate a sub interval, encoded as one boolean per
+# possible value rather than an integer, where exactly one holds
+# the values are the same as for the integer encoding
+#   -1 -> initial value, -2 -> empty, otherwise the index of the edge
+# comparisons with integers and other selectors behave as for the integer
+class EdgeSelector:
+    __slots__ = ("encoder", "options")
+
+    def __init__(self, encoder, name, values):
+        self.encoder = encoder
+        self.options: Dict[int, object] = dict()
+        for value in values:
+            option_name = "{}_{}".format(name, value).replace("-", "m")
+            self.options[value] = encoder.Bool(option_name)
+
+    # the constraint ensuring that exactly one option is selected
+    def is_one_hot(self):
+        options = list(self.options.values())
+        conditions = [self.encoder.Or(options)]
+        for i in range(len(options)):
+            for j in range(i + 1, len(options)):
+                conditions.append(self.encoder.Not(
+                    self.encoder.And(options[i], options[j])))
+        return self.encoder.And(conditions)
+
+    def __eq__(self, other):
+        if isinstance(other, EdgeSelector):
+            return self.encoder.Or([
+                self.encoder.And(option, other.options[value])
+                for value, option in self.options.items()
+                if value in other.options])
+        if other in self.options:
+            return self.options[other]
+        return False
+
+    def __ne__(self, other):
+        return self.encoder.Not(self == other)
+
+    __hash__ = None
+
+    # the integer value of the selector within the given model
+    def evaluate(self, model):
+        for value, option in self.options.items():
+            if z3.is_true(model[option]):
+                return value
+        return None
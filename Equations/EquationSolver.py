@@ -1,19 +1,83 @@
 from z3 import *
-from typing import List, Dict
+from typing import List, Dict, Set, Tuple
 from Automaton.Edge import Edge
+from Equations.BooleanFlag import BooleanFlag
+from Equations.BoundedModelChecker import BoundedModelChecker
+from Equations.EdgeSelector import EdgeSelector
+from Equations.ProcessSolver import ProcessSolver, get_solver_command
+from Equations.SmtLibEncoder import SmtLibEncoder
+from Equations.Z3Encoder import Z3Encoder
 
 import operator
 
+ENCODERS = {
+    "z3": Z3Encoder,
+    "smtlib": SmtLibEncoder,
+}
+
 
 class EquationSolver:
-    def __init__(self, automaton):
+    # the options after debug are keyword only, so that new ones can be
+    # added in any place without callers passing them to the wrong one
+    def __init__(self, automaton, debug=False, *, encoding="z3", solvers=None,
+                 disjunctive=False, real=False, booleans=False, seed=False,
+                 bounded_steps=0):
         self.automaton = automaton
+        self.debug = debug
+        self.encoding = encoding
+
+        # the bound on the length of the runs searched by bounded model
+        # checking before the full formula is built, the nodes these runs
+        # reach are not queried, 0 to skip the search
+        self.bounded_steps = bounded_steps
+
+        # whether the interval analysis runs first, the nodes it proves
+        # unreachable are not queried and every sub interval of the other
+        # nodes must overlap the values the analysis found for the node
+        self.seed = seed
+
+        # whether the inclusivity flags, the used edges and the
+        # reachability are encoded as booleans rather than as integers,
+        # leaving the case splits over these to the SAT core
+        self.booleans = booleans
+
+        # whether all unchecked nodes are queried at once, every model then
+        # marks some of them reachable until a single unsat check proves
+        # the others unreachable, rather than checking node per node
+        self.disjunctive = disjunctive
         self.initial = self.automaton.get_initial_node()
-        self.s = Solver()
+
+        # the encoder builds the constraints, either as z3 expressions or
+        # as SMT-LIB text that is parsed by z3 in bulk
+        # with real set all variables are reals rather than integers, the
+        # counter is continuous and the flags and edge indexes only take a
+        # few constant values, so this keeps the formula within linear real
+        # arithmetic, which is far cheaper to solve
+        if encoding not in ENCODERS:
+            raise ValueError("unknown encoding {}".format(encoding))
+        self.encoder = ENCODERS[encoding](real)
+
+        # by default z3 solves the formula in this process, otherwise it
+        # is handed to the given external solvers as SMT-LIB script and
+        # the first of these to answer is used
+        self.solver_commands = None
+        if solvers:
+            if encoding != "smtlib":
+                raise ValueError("external solvers require the smtlib "
+                                 "encoding")
+            self.solver_commands = [get_solver_command(name)
+                                    for name in solvers]
+            self.s = ProcessSolver(self.encoder, self.solver_commands)
+        else:
+            self.s = self.encoder.create_solver()
         self.s.set("timeout", 600000)
         self.auxiliary_counter = 0
         self.nodes = list(self.automaton.get_visible_nodes().keys())
 
+        # the position of every node within the list of nodes
+        self.node_indexes: Dict[str, int] = \
+            {node: i for i, node in enumerate(self.nodes)}
+
         # store all the node conditions defined within the automaton
         # this list will be used to trace the bounds implied by the
         # different nodes. Each transition will have a corresponding
@@ -69,46 +133,188 @@ class EquationSolver:
         # track if a node contains a not empty sub interval
         self.reachable = list()
 
-    def analyse(self):
+        # the auxiliary booleans naming whether a sub interval is not
+        # empty, by node and sub interval index
+        self.filled: Dict[Tuple[int, int], BoolRef] = dict()
+
+        # the nodes the interval analysis proved unreachable
+        self.unreachable: Set[str] = set()
+
+        self.is_built = False
+
+    # build the constraints shared by the checks of all nodes
+    def build_formula(self):
+        if self.is_built:
+            return
+        self.is_built = True
+
         self.build_transitions()
         self.build_node_conditions()
         self.build_intervals()
         self.analyse_loops()
         self.add_successor_condition()
         self.add_reachability_condition()
-
+        if self.seed:
+            self.add_seed_condition()
+
+    # write the shared constraints as SMT-LIB2 script
+    def dump_formula(self, file_name):
+        self.build_formula()
+        with open(file_name, "w") as file:
+            file.write(self.s.to_smt2())
+
+    # on_reachable is called with every node as soon as it is found to be
+    # reachable, allowing the caller to report results incrementally
+    # the nodes in known_reachable, for instance found by a simulation, are
+    # reported reachable without being queried
+    def analyse(self, on_reachable=None, known_reachable=()):
         reachable_nodes = list()
 
+        def mark_reachable(reachable_node):
+            reachable_nodes.append(reachable_node)
+            if on_reachable is not None:
+                on_reachable(reachable_node)
+
+        unchecked_nodes = list()
+        for node in self.nodes:
+            if node in known_reachable:
+                mark_reachable(node)
+            else:
+                unchecked_nodes.append(node)
+
+        # short runs are cheaper to find by unrolling the automaton
+        if unchecked_nodes and self.bounded_steps > 0:
+            # the search uses the same solvers as the full formula
+            encoder = ENCODERS[self.encoding](True)
+            solver = None
+            if self.solver_commands:
+                solver = ProcessSolver(encoder, self.solver_commands)
+            checker = BoundedModelChecker(self.automaton, encoder, self.debug,
+                                          self.bounded_steps, solver)
+            found = checker.analyse(mark_reachable, unchecked_nodes)
+            unchecked_nodes = [node for node in unchecked_nodes
+                               if node not in found]
+
+        # the formula is only needed if some node is left to check
+        if unchecked_nodes:
+            self.build_formula()
+
         # start solving for each of the intervals
-        unchecked_nodes = self.nodes.copy()
+        unchecked_nodes = [node for node in unchecked_nodes
+                           if node not in self.unreachable]
+        disjunctive = self.disjunctive
         while unchecked_nodes:
-            cur_node = unchecked_nodes.pop(0)
-            cur_index = self.nodes.index(cur_node)
             self.s.push()
-            self.add_final_condition(cur_index)
-            self.solve()
-            if self.s.check() == sat:
-                reachable_nodes.append(cur_node)
+            if disjunctive:
+                self.add_any_reachable_condition(unchecked_nodes)
+            else:
+                cur_node = unchecked_nodes.pop(0)
+                self.add_final_condition(self.node_indexes[cur_node])
+            result = self.solve()
+            if result == sat:
+                if not disjunctive:
+                    mark_reachable(cur_node)
                 m = self.s.model()
                 for i in range(len(self.reachable)):
-                    if m[self.reachable[i]].as_long():
+                    if self.is_reached_in(m, i):
                         node = self.nodes[i]
                         if node in unchecked_nodes:
-                            reachable_nodes.append(node)
                             unchecked_nodes.remove(node)
+                            mark_reachable(node)
             self.s.pop()
 
+            # none of the remaining nodes is reachable
+            if disjunctive and result == unsat:
+                break
+
+            # the solver gave up, for instance on a timeout, which proves
+            # nothing, so the remaining nodes are checked one by one
+            if disjunctive and result != sat:
+                disjunctive = False
+
         print(reachable_nodes)
 
         return reachable_nodes
 
+    # restrict the formula to the reach sets of the interval analysis
+    # these over-approximate the values of the counter under the same
+    # transfers, so a sub interval that does not overlap the reach set of
+    # its node can not hold any of these values
+    def add_seed_condition(self):
+        hulls = self.compute_hulls()
+        if hulls is None:
+            return
+
+        for n, node in enumerate(self.nodes):
+            base_index = n * self.nr_of_intervals * 4
+            base_edge = n * self.nr_of_intervals
+            hull = hulls.get(node)
+            if hull is None:
+                self.unreachable.add(node)
+
+            for i in range(self.nr_of_intervals):
+                if hull is None:
+                    self.s.add(self.used_edges[base_edge + i] == -2)
+                    continue
+
+                index = base_index + i * 4
+                interval = self.intervals[index: index + 4]
+                self.s.add(self.encoder.Or(
+                    self.encoder.Not(self.is_filled(n, i)),
+                    self.overlaps(interval, hull)))
+
+        if self.debug:
+            print("The interval analysis proved {} unreachable".format(
+                sorted(self.unreachable)))
+
+    # run the interval analysis and get the smallest interval holding the
+    # reach set of every reachable node, as vector of bounds and flags
+    # the analysis does not handle parameters, None if there are any
+    def compute_hulls(self):
+        values = self.edges[1::3] + self.conditions[1::2]
+        if any(type(value) is not int for value in values):
+            return None
+
+        # imported here so that an unseeded analysis does not pay for it
+        from Reach.ReachManager import ReachManager
+
+        manager = ReachManager(self.automaton, collapsed=True)
+        while not manager.is_finished():
+            manager.update_automaton()
+
+        hulls = dict()
+        for node in self.nodes:
+            reach = manager.get_reach(node)
+            reach_sets = list()
+            for origin in reach.get_preceding_nodes():
+                reach_set = reach.get_reachable_set(origin)
+                if reach_set is not None and not reach_set.is_empty():
+                    reach_sets.append(reach_set)
+            if not reach_sets:
+                continue
+
+            low = min(reach_set.get_inf() for reach_set in reach_sets)
+            high = max(reach_set.get_sup() for reach_set in reach_sets)
+            hulls[node] = [0 if low == -float('inf') else int(low),
+                           0 if high == float('inf') else int(high),
+                           2 if low == -float('inf') else 1,
+                           2 if high == float('inf') else 1]
+        return hulls
+
+    # ensure that at least one of the given nodes is reachable
+    def add_any_reachable_condition(self, nodes):
+        condition = list()
+        for node in nodes:
+            condition.append(self.is_reached(self.node_indexes[node]))
+        self.s.add(self.encoder.Or(condition))
+
     # ensure that the node under test is not empty
     def add_final_condition(self, cur_node):
         base_index = cur_node * self.nr_of_intervals
         condition = list()
         for i in range(self.nr_of_intervals):
             condition.append(self.used_edges[base_index + i] != -2)
-        self.s.add(Or(condition))
+        self.s.add(self.encoder.Or(condition))
 
     # fetch all edges from the automaton
     # convert each edge to [from, op, end] format
@@ -139,10 +345,10 @@ class EquationSolver:
         bound_lower_loops = list()
 
         # keep track of which edges are part of which type of loop
-        lower_bound_edges = list()
-        upper_bound_edges = list()
-        lower_unbound_edges = list()
-        upper_unbound_edges = list()
+        lower_bound_edges = set()
+        upper_bound_edges = set()
+        lower_unbound_edges = set()
+        upper_unbound_edges = set()
         for loop in self.automaton.get_loops():
             nodes = loop.get_nodes()
             is_bound_lower = True
@@ -154,27 +360,19 @@ class EquationSolver:
                 edge = self.automaton.get_outgoing_edges(node)[next_node]
                 index = self.edge_mapping[edge]
 
-                if loop.has_add() and edge not in upper_unbound_edges:
-                    upper_unbound_edges.append(index)
-                    if index in upper_bound_edges:
-                        upper_bound_edges.remove(index)
+                if loop.has_add():
+                    upper_unbound_edges.add(index)
+                    upper_bound_edges.discard(index)
                     is_bound_upper = False
+                elif index not in upper_unbound_edges:
+                    upper_bound_edges.add(index)
 
-                if not loop.has_add() and \
-                        index not in upper_unbound_edges and \
-                        index not in upper_bound_edges:
-                    upper_bound_edges.append(index)
-
-                if loop.has_sub() and index not in lower_unbound_edges:
-                    lower_unbound_edges.append(index)
-                    if index in lower_bound_edges:
-                        lower_bound_edges.remove(index)
+                if loop.has_sub():
+                    lower_unbound_edges.add(index)
+                    lower_bound_edges.discard(index)
                     is_bound_lower = False
-
-                if not loop.has_sub() and \
-                        index not in lower_unbound_edges and \
-                        index not in lower_bound_edges:
-                    lower_bound_edges.append(index)
+                elif index not in lower_unbound_edges:
+                    lower_bound_edges.add(index)
 
             if is_bound_upper:
                 bound_upper_loops.append(loop)
@@ -195,70 +393,103 @@ class EquationSolver:
 
     # generate the sub conditions for the different loops
     # these sub conditions will be used to specify one big constraint
+    # they are stored by node and offset, for every sub interval
+    #   is_inf: some other sub interval in use has an infinite bound
+    #   is_bounded: the bound is at least that of some other sub interval
+    #               in use
     def generate_loop_conditions(self, is_inf, is_bounded, loop, offset):
         for node in loop.get_nodes():
-            node = self.nodes.index(node)
-            if node in is_inf:
+            node = self.node_indexes[node]
+            key = (node, offset)
+            if key in is_inf:
                 continue
 
-            is_inf[node] = list()
-            is_bounded[node] = dict()
-
             # get the index of the start of the first sub interval
             base_sub_index = node * self.nr_of_intervals * 4
 
             # get the index of the start of the first sub intervals' edge
             base_edge_index = node * self.nr_of_intervals
 
+            used = list()
+            bounds = list()
+            infinite = list()
             for sub in range(self.nr_of_intervals):
-                is_bounded[node][sub] = list()
+                # check if the sub interval is in use
+                edge_val = self.used_edges[base_edge_index + sub]
+                used.append(edge_val != -2)
 
-                # get the incl val of the start of the cur sub interval
-                incl_bound_index = base_sub_index + sub * 4 + 2 + offset
-                incl_bound_val = self.intervals[incl_bound_index]
-
-                # get the val of the edge linked to the cur sub interval
-                edge_index = base_edge_index + sub
-                edge_val = self.used_edges[edge_index]
+                # get the bound val and incl val of the cur sub interval
+                bound_index = base_sub_index + sub * 4 + offset
+                bounds.append(self.intervals[bound_index])
+                incl_bound_val = self.intervals[bound_index + 2]
 
                 # check if this sub interval has an inf bound
-                is_inf[node].append(
-                    And(
-                        incl_bound_val == 2,
-                        edge_val != -2
-                    )
-                )
-
-                # get the bound val of this sub interval
-                low_index = base_sub_index + sub * 4 + offset
-                bound_val = self.intervals[low_index]
-
-                # iterate over all other sub intervals in the cur node
-                for sub2 in range(self.nr_of_intervals):
-                    if sub == sub2:
-                        continue
-
-                    # get the bound val of the second sub interval
-                    low_index2 = base_sub_index + sub2 * 4 + offset
-                    bound_val2 = self.intervals[low_index2]
+                infinite.append(self.encoder.And(incl_bound_val == 2,
+                                                 used[sub]))
+
+            # every other sub interval precedes or follows the current one
+            # so the conditions are the combination of running conditions
+            # in both directions, rather than a comparison of every pair
+            order = list(range(self.nr_of_intervals))
+            name = 'l_{}_{}'.format(offset, node)
+            before = self.generate_running_conditions(
+                '{}_b'.format(name), order, used, bounds, infinite)
+            after = self.generate_running_conditions(
+                '{}_a'.format(name), order[::-1], used, bounds, infinite)
+
+            is_inf[key] = list()
+            is_bounded[key] = list()
+            for sub in order:
+                bounded = list()
+                for exists, minimum, any_inf in (before[sub], after[sub]):
+                    if minimum is not None:
+                        bounded.append(self.encoder.And(
+                            exists, bounds[sub] >= minimum))
+                is_inf[key].append(self.encoder.Or(before[sub][2],
+                                                   after[sub][2]))
+                is_bounded[key].append(self.encoder.Or(bounded))
+
+    # for every sub interval the conditions over the sub intervals that
+    # precede it in the given order, as triple of
+    #   whether any of these is in use
+    #   the smallest bound of those in use, None if there are none
+    #   whether any of these in use has an infinite bound
+    # the conditions are named by auxiliary variables, each defined in
+    # terms of those of the previous sub interval
+    def generate_running_conditions(self, name, order, used, bounds,
+                                    infinite):
+        conditions = dict()
+        exists = False
+        minimum = None
+        any_inf = False
+        for step, sub in enumerate(order):
+            conditions[sub] = (exists, minimum, any_inf)
+            if step == len(order) - 1:
+                break
+
+            next_minimum = self.encoder.Variable('{}_m_{}'.format(name, step))
+            if minimum is None:
+                self.s.add(next_minimum == bounds[sub])
+            else:
+                self.s.add(next_minimum == self.encoder.If(
+                    self.encoder.And(used[sub],
+                                     self.encoder.Or(self.encoder.Not(exists),
+                                                     bounds[sub] < minimum)),
+                    bounds[sub], minimum))
+            minimum = next_minimum
 
-                    # get the linked edge of this second sub interval
-                    edge_index2 = base_edge_index + sub2
-                    edge_val2 = self.used_edges[edge_index2]
+            exists = self.define('{}_e_{}'.format(name, step),
+                                 self.encoder.Or(exists, used[sub]))
+            any_inf = self.define('{}_i_{}'.format(name, step),
+                                  self.encoder.Or(any_inf, infinite[sub]))
 
-                    # check is this node is bounded by the second interval
-                    is_bounded[node][sub].append(
-                        And(
-                            bound_val >= bound_val2,
-                            edge_val2 != -2
-                        )
-                    )
+        return conditions
 
     def apply_loop_conditions(self, is_inf, is_bounded, loop, offset):
         condition = list()
         not_taken = list()
         nodes = loop.get_nodes()
-        indexes = [self.nodes.index(node) for node in nodes]
+        indexes = [self.node_indexes[node] for node in nodes]
 
         # for all sub intervals of all nodes part of this loop
         # if edge equals any edge part of this loop
@@ -296,11 +527,6 @@ class EquationSolver:
                 edge_val = self.used_edges[base_edge_index + j]
                 loop_taken.append(edge_val == edge_index)
 
-                # get the subset of inf conditions that apply here
-                inf_condition = is_inf[index]
-                inf_exists = [x for y, x in enumerate(inf_condition)
-                              if y != j]
-
                 # apply the inf condition
                 #   if any of the other sub intervals reaches inf
                 #   this interval must reach infinity
@@ -308,8 +534,8 @@ class EquationSolver:
                 bound_val = self.intervals[sub_index + offset]
                 bound_incl_val = self.intervals[sub_index + 2 + offset]
                 loop_condition.append(
-                    And(
-                        Or(inf_exists),
+                    self.encoder.And(
+                        is_inf[(index, offset)][j],
                         bound_val == 0,
                         bound_incl_val == 2
                     )
@@ -317,19 +543,17 @@ class EquationSolver:
 
                 # apply the is bounded condition which will ensure that
                 # our bound is higher/lower than the current min/max
-                loop_condition.append(
-                    Or(is_bounded[index][j])
-                )
-                loop_taken.append(Or(loop_condition))
-                or_condition.append(And(loop_taken))
+                loop_condition.append(is_bounded[(index, offset)][j])
+                loop_taken.append(self.encoder.Or(loop_condition))
+                or_condition.append(self.encoder.And(loop_taken))
 
             # the above conditions must hold for one of the nodes of the loop
-            condition.append(Or(or_condition))
+            condition.append(self.encoder.Or(or_condition))
 
         # check if all edges part of this loop are effectively taken
         # if not it makes no sense to apply bounds
-        condition.append(And(not_taken))
-        self.s.add(Or(condition))
+        condition.append(self.encoder.And(not_taken))
+        self.s.add(self.encoder.Or(condition))
 
     # store all node conditions
     def build_node_conditions(self):
@@ -356,15 +580,89 @@ class EquationSolver:
         for n in range(len(self.nodes)):
             for s in range(self.nr_of_intervals):
                 self.intervals += self.generate_interval(n, s)
-                self.used_edges.append(Int('t_{}_{}'.format(n, s)))
+                self.used_edges.append(self.generate_used_edge(n, s))
 
         # initialise the reachability values tracking whether or not
         # the corresponding node is reachable
         for n in range(len(self.nodes)):
-            self.reachable.append(Int('r_{}'.format(n)))
+            if self.booleans:
+                reachable = self.encoder.Bool('r_{}'.format(n))
+            else:
+                reachable = self.encoder.Variable('r_{}'.format(n))
+            self.reachable.append(reachable)
+
+    def generate_used_edge(self, node_index, sub_index):
+        name = 't_{}_{}'.format(node_index, sub_index)
+        if not self.booleans:
+            return self.encoder.Variable(name)
+
+        # a sub interval is either empty, the initial value or generated
+        # by one of the edges ending in its node
+        values = [-2]
+        if self.nodes[node_index] == self.initial:
+            values.append(-1)
+        for edge in range(0, len(self.edges), 3):
+            if self.edges[edge + 2] == node_index:
+                values.append(edge // 3)
+
+        used_edge = EdgeSelector(self.encoder, name, values)
+        self.s.add(used_edge.is_one_hot())
+        return used_edge
+
+    # the condition that the node with the given index is reachable
+    def is_reached(self, node_index):
+        if self.booleans:
+            return self.reachable[node_index]
+        return self.reachable[node_index] == 1
+
+    def is_reached_in(self, model, node_index) -> bool:
+        value = model[self.reachable[node_index]]
+        if self.booleans:
+            return is_true(value)
+        return value.as_long() == 1
+
+    # get the value of a variable within the model, flags and used edges
+    # are given as integers in both encodings
+    @staticmethod
+    def evaluate(model, variable):
+        if isinstance(variable, (BooleanFlag, EdgeSelector)):
+            return variable.evaluate(model)
+        return model[variable]
+
+    # generate a vector of four variables holding a sub interval
+    def generate_vector(self, name):
+        if not self.booleans:
+            return self.encoder.Vector(name, 4)
+
+        vector = self.encoder.Vector(name, 2)
+        vector.append(BooleanFlag(self.encoder, "{}__2".format(name)))
+        vector.append(BooleanFlag(self.encoder, "{}__3".format(name)))
+        return vector
+
+    # name the condition by an auxiliary boolean, so that it is encoded
+    # once and can be referenced without repeating its terms
+    def define(self, name, condition):
+        variable = self.encoder.Bool(name)
+        self.s.add(variable == condition)
+        return variable
+
+    # the condition that the given sub interval is not empty
+    def is_filled(self, node_index, sub_index):
+        key = (node_index, sub_index)
+        if key not in self.filled:
+            index = (node_index * self.nr_of_intervals + sub_index) * 4
+            interval = self.intervals[index: index + 4]
+            self.filled[key] = self.define(
+                'f_{}_{}'.format(node_index, sub_index),
+                self.encoder.Or(self.is_not_empty(interval[0], interval[1],
+                                                  interval[2], interval[3])))
+        return self.filled[key]
 
     # ensure that for the sub intervals of all nodes they are
     # a successor of a preceding node
+    # the conditions shared between the sub intervals are named by
+    # auxiliary booleans, keeping the formula quadratic rather than cubic
+    # in the number of sub intervals
     def add_successor_condition(self):
         # for all nodes in the automaton
         for node in range(len(self.nodes)):
@@ -377,15 +675,23 @@ class EquationSolver:
             cond_value = self.conditions[cond_base_index + 1]
 
             # track the conditions for each of the sub intervals
+            # allow a way out in case the interval is empty, if not every
+            # interval will be forced to be filled
             or_conditions = dict()
             for i in range(self.nr_of_intervals):
-                or_conditions[i] = list()
+                end_index = base_end + i * 4
+                end_interval = self.intervals[end_index: end_index + 4]
+                empty_cond = self.encoder.And(
+                    *self.is_empty(end_interval[0], end_interval[1],
+                                   end_interval[2], end_interval[3]),
+                    self.used_edges[used_edge_base + i] == -2)
+                or_conditions[i] = [empty_cond]
 
             # check if the current node is the initial node
             if self.nodes[node] == self.automaton.get_initial_node():
                 vec_name = 'y{}'.format(self.auxiliary_counter)
                 self.auxiliary_counter += 1
-                y = IntVector(vec_name, 4)
+                y = self.generate_vector(vec_name)
 
                 # initialise the first sub interval of the initial node
                 interval = self.intervals[base_end: base_end + 4]
@@ -393,10 +699,10 @@ class EquationSolver:
                 cond = list()
                 cond += self.assign(interval, init_val, init_val, 1, 1)
 
-                cond.append(And(self.is_in_bounds(interval,
-                                                  (cond_type, cond_value), y)))
+                cond.append(self.encoder.And(
+                    self.is_in_bounds(interval, (cond_type, cond_value), y)))
                 cond.append(self.used_edges[node * self.nr_of_intervals] == -1)
-                or_conditions[0].append(And(cond))
+                or_conditions[0].append(self.encoder.And(cond))
 
             # go over all the edges that end in the current node
             for edge in range(0, len(self.edges), 3):
@@ -410,12 +716,12 @@ class EquationSolver:
 
                 vec_name = 'y{}'.format(self.auxiliary_counter)
                 self.auxiliary_counter += 1
-                y = IntVector(vec_name, 4)
+                y = self.generate_vector(vec_name)
                 self.y += y
 
                 vec_name2 = 'y{}'.format(self.auxiliary_counter)
                 self.auxiliary_counter += 1
-                y2 = IntVector(vec_name2, 4)
+                y2 = self.generate_vector(vec_name2)
                 self.y += y2
 
                 # intersect this with the automaton bound
@@ -439,6 +745,24 @@ class EquationSolver:
 
                 base_start = start * self.nr_of_intervals * 4
 
+                # some sub interval of the start node is not empty and is
+                # moved into y by the update of the edge
+                # this does not depend on the sub interval it ends up in
+                moved = list()
+                for prev_int in range(self.nr_of_intervals):
+                    # get the interval of the start node
+                    start_index = base_start + prev_int * 4
+                    start_interval = self.intervals[start_index:
+                                                    start_index + 4]
+
+                    moved.append(self.encoder.And(
+                        self.is_filled(start, prev_int),
+                        self.update_interval(start_interval, op, y)))
+                moved_cond = self.define('m_{}'.format(edge // 3),
+                                         self.encoder.And(
+                                             y_bound_cond,
+                                             self.encoder.Or(moved)))
+
                 # ensure that there is at least one edge for which
                 # there is a preceding interval from which the current
                 # interval can be generated
@@ -457,7 +781,7 @@ class EquationSolver:
                     # the linked interval
                     used_edge_index = used_edge_base + new_int
                     used_edge_var = self.used_edges[used_edge_index]
-                    edge_cond = used_edge_var == edge / 3
+                    edge_cond = used_edge_var == edge // 3
                     unique_update.append(edge_cond)
 
                     # ensure that only one interval results from this edge
@@ -467,77 +791,35 @@ class EquationSolver:
                         edge_not_used = past_edge_var != used_edge_var
                         unique_update.append(edge_not_used)
 
-                    for prev_int in range(self.nr_of_intervals):
-                        # get the interval of the start node
-                        start_index = base_start + prev_int * 4
-                        start_interval = self.intervals[start_index:
-                                                        start_index + 4]
-
-                        # generate the successor condition
-                        update = self.update_interval(start_interval,
-                                                      op,
-                                                      end_interval,
-                                                      (cond_type, cond_value),
-                                                      y, y2)
-                        update.append(y_bound_cond)
+                    # the result is bounded by the node into the interval
+                    unique_update.append(self.is_filled(node, new_int))
+                    unique_update += self.is_in_bounds(
+                        end_interval, (cond_type, cond_value), y2)
+                    unique_update.append(moved_cond)
 
-                        unique_update.append(And(update))
-
-                        # allow a way out in case the current interval is empty
-                        # if not every interval will be forced to be filled
-                        empty_cond = And(*self.is_empty(end_interval[0],
-                                                        end_interval[1],
-                                                        end_interval[2],
-                                                        end_interval[3]),
-                                         used_edge_var == -2)
-
-                        final_cond = If(And(unique_update), True, empty_cond)
-                        unique_update.pop(-1)
-
-                        or_conditions[new_int].append(final_cond)
+                    or_conditions[new_int].append(
+                        self.encoder.And(unique_update))
 
             for key in or_conditions.keys():
-                condition = or_conditions[key]
-                if condition:
-                    self.s.add(Or(condition))
-                else:
-                    end_index = base_end + key * 4
-                    end_interval = self.intervals[end_index: end_index + 4]
-                    used_edge_index = used_edge_base + key
-                    used_edge_var = self.used_edges[used_edge_index]
-                    empty_cond = And(*self.is_empty(end_interval[0],
-                                                    end_interval[1],
-                                                    end_interval[2],
-                                                    end_interval[3]),
-                                     used_edge_var == -2)
-                    self.s.add(empty_cond)
+                self.s.add(self.encoder.Or(or_conditions[key]))
 
     def add_reachability_condition(self):
         for n in range(len(self.nodes)):
             or_conditions = list()
-            base_index = n * self.nr_of_intervals * 4
-
             for i in range(self.nr_of_intervals):
-                index = base_index + i * 4
-                interval = self.intervals[index: index + 4]
-                cond = self.is_not_empty(interval[0], interval[1],
-                                         interval[2], interval[3])
-                or_conditions.append(Or(cond))
+                or_conditions.append(self.is_filled(n, i))
 
             reachable = self.reachable[n]
-            cond = If(Or(or_conditions), reachable == 1, reachable == 0)
+            if self.booleans:
+                cond = reachable == self.encoder.Or(or_conditions)
+            else:
+                cond = self.encoder.If(self.encoder.Or(or_conditions),
+                                       reachable == 1, reachable == 0)
             self.s.add(cond)
 
-    def update_interval(self, start, z, end, node_cond, y, y2):
+    def update_interval(self, start, z, y):
         update_condition = list()
 
-        condition = Or(self.is_not_empty(start[0], start[1],
-                                         start[2], start[3]))
-        update_condition.append(condition)
-
-        condition = Or(self.is_not_empty(end[0], end[1], end[2], end[3]))
-        update_condition.append(condition)
-
         if type(z) is int:
             # cover the case in which z > 0
             if z > 0:
@@ -552,14 +834,14 @@ class EquationSolver:
             # cover the case in which z = 0
             if z == 0:
                 assign = self.assign(y, start[0], start[1], start[2], start[3])
-                update_condition.append(And(assign))
+                update_condition.append(self.encoder.And(assign))
 
         # cover the case in which z is a variable
         else:
             if z in self.vars:
                 z_val = self.vars[z]
             else:
-                z_val = Int(z)
+                z_val = self.encoder.Variable(z)
                 self.vars[z] = z_val
 
             or_conditions = list()
@@ -567,26 +849,24 @@ class EquationSolver:
             and_conditions = list()
             and_conditions.append(z_val > 0)
             and_conditions.append(self.add_vec(start, [0, z_val, 0, 1], y))
-            or_conditions.append(And(and_conditions))
+            or_conditions.append(self.encoder.And(and_conditions))
 
             and_conditions.clear()
             and_conditions.append(z_val < 0)
             and_conditions.append(self.add_vec(start, [z_val, 0, 1, 0], y))
-            or_conditions.append(And(and_conditions))
+            or_conditions.append(self.encoder.And(and_conditions))
 
             and_conditions.clear()
             and_conditions.append(z_val == 0)
-            and_conditions.append(And(self.assign(y, start[0], start[1],
-                                                  start[2], start[3])))
-            or_conditions.append(And(and_conditions))
-
-            update_condition.append(Or(or_conditions))
+            and_conditions.append(self.encoder.And(
+                self.assign(y, start[0], start[1], start[2], start[3])))
+            or_conditions.append(self.encoder.And(and_conditions))
 
-        # the sum is now stored in y, intersect this interval with both node
-        # and automaton bounds
-        update_condition += self.is_in_bounds(end, node_cond, y2)
+            update_condition.append(self.encoder.Or(or_conditions))
 
-        return update_condition
+        # the sum is now stored in y, it is intersected with both node
+        # and automaton bounds by the caller
+        return self.encoder.And(update_condition)
 
     def is_in_bounds(self, end, node_cond, y2):
         condition = list()
@@ -601,7 +881,7 @@ class EquationSolver:
                 cond_value = self.vars[cond_value]
             else:
                 cond_name = cond_value
-                cond_value = Int(cond_value)
+                cond_value = self.encoder.Variable(cond_value)
                 self.vars[cond_name] = cond_value
 
         interval = []
@@ -616,12 +896,14 @@ class EquationSolver:
         if interval:
             condition.append(self.intersect_vec(y2, interval, end))
         else:
-            condition.append(And(self.assign(end, y2[0], y2[1], y2[2], y2[3])))
+            condition.append(self.encoder.And(
+                self.assign(end, y2[0], y2[1], y2[2], y2[3])))
 
         return condition
 
     def solve(self):
-        if self.s.check() == sat:
+        result = self.s.check()
+        if result == sat:
             print("Solution found")
             m = self.s.model()
 
@@ -639,9 +921,9 @@ class EquationSolver:
                     edge_index = base_edge + j
                     b = m[self.intervals[int_index]]
                     t = m[self.intervals[int_index + 1]]
-                    i_b = m[self.intervals[int_index + 2]]
-                    i_t = m[self.intervals[int_index + 3]]
-                    edge = m[self.used_edges[edge_index]]
+                    i_b = self.evaluate(m, self.intervals[int_index + 2])
+                    i_t = self.evaluate(m, self.intervals[int_index + 3])
+                    edge = self.evaluate(m, self.used_edges[edge_index])
                     if not empty(b, t, i_b, i_t):
                         print("\t\t[{}, {}, {}, {}] using {}".
                               format(b, t, i_b, i_t, edge))
@@ -653,13 +935,19 @@ class EquationSolver:
         else:
             print("No solution found")
 
-    @staticmethod
-    def generate_interval(node_index, sub_index):
+        return result
+
+    def generate_interval(self, node_index, sub_index):
+        name = "i_{}_{}".format(node_index, sub_index)
         interval = list()
-        interval.append(Int("i_{}_{}_b".format(node_index, sub_index)))
-        interval.append(Int("i_{}_{}_t".format(node_index, sub_index)))
-        interval.append(Int("i_{}_{}_i_l".format(node_index, sub_index)))
-        interval.append(Int("i_{}_{}_i_u".format(node_index, sub_index)))
+        interval.append(self.encoder.Variable("{}_b".format(name)))
+        interval.append(self.encoder.Variable("{}_t".format(name)))
+        if self.booleans:
+            interval.append(BooleanFlag(self.encoder, "{}_i_l".format(name)))
+            interval.append(BooleanFlag(self.encoder, "{}_i_u".format(name)))
+        else:
+            interval.append(self.encoder.Variable("{}_i_l".format(name)))
+            interval.append(self.encoder.Variable("{}_i_u".format(name)))
         return interval
 
     def add_vec(self, start, addend, target):
@@ -670,23 +958,25 @@ class EquationSolver:
         and_args += self.is_empty(start[0], start[1], start[2], start[3])
         and_args += self.assign(target,
                                 addend[0], addend[1], addend[2], addend[3])
-        arguments.append(And(and_args))
+        arguments.append(self.encoder.And(and_args))
 
         # if addend is empty -> target = start
         and_args.clear()
         and_args += self.is_empty(addend[0], addend[1], addend[2], addend[3])
         and_args += self.assign(target,
                                 start[0], start[1], start[2], start[3])
-        arguments.append(And(and_args))
+        arguments.append(self.encoder.And(and_args))
 
         # add b and t
         and_args.clear()
 
         and_args.append(
-            Or(self.is_not_empty(addend[0], addend[1], addend[2], addend[3]))
+            self.encoder.Or(self.is_not_empty(addend[0], addend[1],
+                                              addend[2], addend[3]))
         )
         and_args.append(
-            Or(self.is_not_empty(start[0], start[1], start[2], start[3]))
+            self.encoder.Or(self.is_not_empty(start[0], start[1],
+                                              start[2], start[3]))
         )
 
         for i in range(2):
@@ -702,33 +992,32 @@ class EquationSolver:
             and_args.append(
                 self.generate_msum(start_var, addend_var, target_var)
             )
-        arguments.append(And(and_args))
+        arguments.append(self.encoder.And(and_args))
 
-        return Or(arguments)
+        return self.encoder.Or(arguments)
 
-    @staticmethod
-    def generate_msum(x, y, z):
+    def generate_msum(self, x, y, z):
         arguments = list()
 
         # 2 if max(x, y) == 2
         and_arguments = list()
         and_arguments.append(z == 2)
-        and_arguments.append(Or(x == 2, y == 2))
-        arguments.append(And(and_arguments))
+        and_arguments.append(self.encoder.Or(x == 2, y == 2))
+        arguments.append(self.encoder.And(and_arguments))
 
         # x if x <= y
         and_arguments.clear()
         and_arguments.append(z == x)
         and_arguments.append(x <= y)
-        arguments.append(And(and_arguments))
+        arguments.append(self.encoder.And(and_arguments))
 
         # y if y < x
         and_arguments.clear()
         and_arguments.append(z == y)
         and_arguments.append(y < x)
-        arguments.append(And(and_arguments))
+        arguments.append(self.encoder.And(and_arguments))
 
-        return Or(arguments)
+        return self.encoder.Or(arguments)
 
     @staticmethod
     def is_empty(v_b, v_t, v_incl_low, v_incl_high):
@@ -761,129 +1050,39 @@ class EquationSolver:
 
         return arguments
 
-    @staticmethod
-    def overlaps(vector1, vector2):
-        x_b = vector1[0]
-        x_t = vector1[1]
-        x_incl_low = vector1[2]
-        x_incl_high = vector1[3]
-
-        y_b = vector2[0]
-        y_t = vector2[1]
-        y_incl_low = vector2[2]
-        y_incl_high = vector2[3]
-
-        arguments = list()
-
-        # y full infinity
-        and_arguments = list()
-        and_arguments.append(y_incl_low == 2)
-        and_arguments.append(y_incl_high == 2)
-
-        arguments.append(And(and_arguments))
-
-        # x full infinity
-        and_arguments = list()
-        and_arguments.append(x_incl_low == 2)
-        and_arguments.append(x_incl_high == 2)
-
-        arguments.append(And(and_arguments))
-
-        # y_b inside x
-        and_arguments.clear()
-        and_arguments.append(x_b < y_b)
-        and_arguments.append(y_b < x_t)
-        and_arguments.append(y_incl_low != 2)
-
-        arguments.append(And(and_arguments))
-
-        # y_t inside x
-        and_arguments.clear()
-        and_arguments.append(x_b < y_t)
-        and_arguments.append(y_t < x_t)
-        and_arguments.append(y_incl_high != 2)
-
-        arguments.append(And(and_arguments))
-
-        # x_b inside y
-        and_arguments.clear()
-        and_arguments.append(y_b < x_b)
-        and_arguments.append(x_b < y_t)
-        and_arguments.append(x_incl_low != 2)
-
-        arguments.append(And(and_arguments))
-
-        # x_t inside y
-        and_arguments.clear()
-        and_arguments.append(y_b < x_t)
-        and_arguments.append(x_t < y_t)
-        and_arguments.append(x_incl_high != 2)
-
-        arguments.append(And(and_arguments))
-
-        # x stretches over y at infinity on the right side
-        and_arguments.clear()
-        and_arguments.append(x_b <= y_b)
-        and_arguments.append(x_incl_high == 2)
-
-        arguments.append(And(and_arguments))
-
-        # y stretches over x at infinity on the right side
-        and_arguments.clear()
-        and_arguments.append(y_b <= x_b)
-        and_arguments.append(y_incl_high == 2)
-
-        arguments.append(And(and_arguments))
-
-        # x stretches over y at infinity on the left side
-        and_arguments.clear()
-        and_arguments.append(x_t >= y_t)
-        and_arguments.append(x_incl_low == 2)
-
-        arguments.append(And(and_arguments))
-
-        # y stretches over x at infinity on the left side
-        and_arguments.clear()
-        and_arguments.append(y_t >= x_t)
-        and_arguments.append(y_incl_low == 2)
-
-        arguments.append(And(and_arguments))
-
-        # xb == yb
-        and_arguments.clear()
-        and_arguments.append(x_b == y_b)
-        and_arguments.append(x_incl_low == 1)
-        and_arguments.append(y_incl_low == 1)
-
-        arguments.append(And(and_arguments))
-
-        # xb == yt
-        and_arguments.clear()
-        and_arguments.append(x_b == y_t)
-        and_arguments.append(x_incl_low == 1)
-        and_arguments.append(y_incl_high == 1)
-
-        arguments.append(And(and_arguments))
-
-        # xt == yb
-        and_arguments.clear()
-        and_arguments.append(x_t == y_b)
-        and_arguments.append(x_incl_high == 1)
-        and_arguments.append(y_incl_low == 1)
-
-        arguments.append(And(and_arguments))
-
-        # xt == yt
-        and_arguments.clear()
-        and_arguments.append(x_t == y_t)
-        and_arguments.append(x_incl_high == 1)
-        and_arguments.append(y_incl_high == 1)
-
-        arguments.append(And(and_arguments))
+    # check whether the first bound is strictly looser than the second one
+    # bounds are ordered by their value first and their inclusivity second,
+    # an infinite bound is looser than any finite bound
+    # operation is operator.lt for lower bounds and operator.gt for upper
+    # bounds
+    def is_looser(self, x_val, x_bound, y_val, y_bound, operation):
+        return self.encoder.Or(
+            self.encoder.And(x_bound == 2, y_bound != 2),
+            self.encoder.And(
+                x_bound != 2,
+                y_bound != 2,
+                self.encoder.Or(
+                    operation(x_val, y_val),
+                    self.encoder.And(x_val == y_val,
+                                     x_bound == 1,
+                                     y_bound == 0)
+                )
+            )
+        )
 
-        return Or(arguments)
+    # check whether some value lies both above the lower bound and below
+    # the upper bound
+    def is_below(self, low_val, low_bound, high_val, high_bound):
+        return self.encoder.Or(
+            low_bound == 2,
+            high_bound == 2,
+            low_val < high_val,
+            self.encoder.And(low_val == high_val,
+                             low_bound == 1,
+                             high_bound == 1)
+        )
 
-    def no_overlaps(self, vector1, vector2):
+    def overlaps(self, vector1, vector2):
         x_b = vector1[0]
         x_t = vector1[1]
         x_incl_low = vector1[2]
@@ -894,77 +1093,18 @@ class EquationSolver:
         y_incl_low = vector2[2]
         y_incl_high = vector2[3]
 
-        or_arguments = list()
-
-        # x fully left of y
-        and_arguments = list()
-        and_arguments.append(x_t < y_b)
-        and_arguments.append(x_incl_high != 2)
-        and_arguments.append(y_incl_low != 2)
-        or_arguments.append(And(and_arguments))
-
-        # x fully right of y
-        and_arguments.clear()
-        and_arguments.append(y_t < x_b)
-        and_arguments.append(y_incl_high != 2)
-        and_arguments.append(x_incl_low != 2)
-        or_arguments.append(And(and_arguments))
-
-        # x shares lower edge with upper y but not inclusive
-        and_arguments.clear()
-        and_arguments.append(x_b == y_t)
-
-        or_arguments2 = list()
-
-        and_arguments2 = list()
-        and_arguments2.append(x_incl_low == 0)
-        and_arguments2.append(y_incl_high != 2)
-        or_arguments2.append(And(and_arguments2))
-
-        and_arguments2.clear()
-        and_arguments2.append(x_incl_low != 2)
-        and_arguments2.append(y_incl_high == 0)
-        or_arguments2.append(And(and_arguments2))
-
-        and_arguments.append(Or(or_arguments2))
-
-        or_arguments.append(And(and_arguments))
-
-        # y shares upper edge with lower y but not inclusive
-        and_arguments.clear()
-        and_arguments.append(x_t == y_b)
-
-        or_arguments2.clear()
-
-        and_arguments2.clear()
-        and_arguments2.append(x_incl_high == 0)
-        and_arguments2.append(y_incl_low != 2)
-        or_arguments2.append(And(and_arguments2))
-
-        and_arguments2.clear()
-        and_arguments2.append(x_incl_high != 2)
-        and_arguments2.append(y_incl_low == 0)
-        or_arguments2.append(And(and_arguments2))
-
-        and_arguments.append(Or(or_arguments2))
-
-        or_arguments.append(And(and_arguments))
-
-        # x is empty
-        or_arguments.append(
-            And(self.is_empty(x_b, x_t, x_incl_low, x_incl_high))
-        )
-
-        # y is empty
-        or_arguments.append(
-            And(self.is_empty(y_b, y_t, y_incl_low, y_incl_high))
+        # both intervals hold a value and each starts before the other ends
+        return self.encoder.And(
+            self.is_below(x_b, x_incl_low, x_t, x_incl_high),
+            self.is_below(y_b, y_incl_low, y_t, y_incl_high),
+            self.is_below(x_b, x_incl_low, y_t, y_incl_high),
+            self.is_below(y_b, y_incl_low, x_t, x_incl_high)
         )
 
-        return Or(or_arguments)
+    def no_overlaps(self, vector1, vector2):
+        return self.encoder.Not(self.overlaps(vector1, vector2))
 
     def intersect_vec(self, vector1, vector2, target):
-        arguments = list()
-
         x_b = vector1[0]
         x_t = vector1[1]
         x_incl_low = vector1[2]
@@ -980,170 +1120,35 @@ class EquationSolver:
         z_incl_low = target[2]
         z_incl_high = target[3]
 
-        # START: x and y do not overlap
-
-        and_arguments = list()
-        and_arguments.append(self.no_overlaps(vector1, vector2))
-        and_arguments += self.assign(target, 0, 0, 0, 0)
-
-        arguments.append(And(and_arguments))
-
-        # STOP: x and y do not overlap
-        # START: x and y overlap
-
-        and_arguments.clear()
-        and_arguments.append(self.overlaps(vector1, vector2))
-        and_arguments.append(self.intersect_vec_one_bound(x_b, x_incl_low,
-                                                          y_b, y_incl_low,
-                                                          z_b, z_incl_low,
-                                                          operator.lt))
-        and_arguments.append(self.intersect_vec_one_bound(x_t, x_incl_high,
-                                                          y_t, y_incl_high,
-                                                          z_t, z_incl_high,
-                                                          operator.gt))
+        overlap = self.overlaps(vector1, vector2)
 
-        arguments.append(And(and_arguments))
+        # x and y do not overlap
+        no_overlap = self.encoder.And(self.encoder.Not(overlap),
+                                      *self.assign(target, 0, 0, 0, 0))
 
-        # STOP: x and y overlap
+        # x and y overlap, keep the tighter bound on both sides
+        low = self.intersect_vec_one_bound(x_b, x_incl_low,
+                                           y_b, y_incl_low,
+                                           z_b, z_incl_low,
+                                           operator.lt)
+        high = self.intersect_vec_one_bound(x_t, x_incl_high,
+                                            y_t, y_incl_high,
+                                            z_t, z_incl_high,
+                                            operator.gt)
 
-        return Or(arguments)
+        return self.encoder.Or(no_overlap,
+                               self.encoder.And(overlap, low, high))
 
-    @staticmethod
-    def intersect_vec_one_bound(x_val, x_bound,
+    def intersect_vec_one_bound(self, x_val, x_bound,
                                 y_val, y_bound,
                                 z_val, z_bound,
                                 operation):
-        or_arguments = list()
-
-        # START: xv op yv
-
-        and_arguments2 = list()
-        and_arguments2.append(operation(x_val, y_val))
-
-        or_arguments2 = list()
-
-        #  ===== START: yb == 2
-
-        and_arguments3 = list()
-        and_arguments3.append(y_bound == 2)
-        and_arguments3.append(z_bound == x_bound)
-        and_arguments3.append(z_val == x_val)
-
-        or_arguments2.append(And(and_arguments3))
-
-        # ===== STOP: yb == 2
-        # ===== START: yb != 2
-
-        and_arguments3.clear()
-        and_arguments3.append(y_bound != 2)
-        and_arguments3.append(z_bound == y_bound)
-        and_arguments3.append(z_val == y_val)
-
-        or_arguments2.append(And(and_arguments3))
-
-        # ===== STOP: yb != 2
-
-        and_arguments2.append(Or(or_arguments2))
-        or_arguments.append(And(and_arguments2))
-
-        # STOP: xv op yv
-        # START: yv op xv
-
-        and_arguments2.clear()
-        and_arguments2.append(operation(y_val, x_val))
-
-        or_arguments2.clear()
-
-        # ===== START xb == 2
-
-        and_arguments3.clear()
-        and_arguments3.append(x_bound == 2)
-        and_arguments3.append(z_bound == y_bound)
-        and_arguments3.append(z_val == y_val)
-
-        or_arguments2.append(And(and_arguments3))
-
-        # ===== STOP: xb == 2
-        # ===== START: xb != 2
-
-        and_arguments3.clear()
-        and_arguments3.append(x_bound != 2)
-        and_arguments3.append(z_bound == x_bound)
-        and_arguments3.append(z_val == x_val)
-
-        or_arguments2.append(And(and_arguments3))
-
-        # ===== STOP: xb != 2
-
-        and_arguments2.append(Or(or_arguments2))
-        or_arguments.append(And(and_arguments2))
-
-        # STOP: yv op xv
-        # START: xv == yv
-
-        and_arguments2.clear()
-        and_arguments2.append(x_val == y_val)
-
-        or_arguments2.clear()
-
-        # ===== START: xb == 2
-
-        and_arguments3.clear()
-        and_arguments3.append(x_bound == 2)
-        and_arguments3.append(z_bound == y_bound)
-        and_arguments3.append(z_val == y_val)
-
-        or_arguments2.append(And(and_arguments3))
-
-        # ===== STOP: xb == 2
-        # ===== START: yb == 2
-
-        and_arguments3.clear()
-        and_arguments3.append(y_bound == 2)
-        and_arguments3.append(z_bound == x_bound)
-        and_arguments3.append(z_val == x_val)
-
-        or_arguments2.append(And(and_arguments3))
-
-        # ===== STOP: yb == 2
-        # ===== START: xb == 0
-
-        and_arguments3.clear()
-        and_arguments3.append(x_bound == 0)
-        and_arguments3.append(z_bound == 0)
-        and_arguments3.append(z_val == x_val)
-
-        or_arguments2.append(And(and_arguments3))
-
-        # ===== STOP: xb == 0
-        # ===== START: yb == 0
-
-        and_arguments3.clear()
-        and_arguments3.append(y_bound == 0)
-        and_arguments3.append(z_bound == 0)
-        and_arguments3.append(z_val == y_val)
-
-        or_arguments2.append(And(and_arguments3))
-
-        # ===== STOP: yb == 0
-        # ===== START: xb == 1, yb == 1
-
-        and_arguments3.clear()
-        and_arguments3.append(y_bound == 1)
-        and_arguments3.append(x_bound == 1)
-        and_arguments3.append(z_bound == 1)
-        and_arguments3.append(z_val == y_val)
-
-        or_arguments2.append(And(and_arguments3))
-
-        # ===== STOP: xb == 1, yb == 1
-
-        and_arguments2.append(Or(or_arguments2))
-        or_arguments.append(And(and_arguments2))
-
-        # STOP: xv == yv
-
-        return Or(or_arguments)
+        x_looser = self.is_looser(x_val, x_bound, y_val, y_bound, operation)
+        return self.encoder.Or(
+            self.encoder.And(x_looser, z_val == y_val, z_bound == y_bound),
+            self.encoder.And(self.encoder.Not(x_looser),
+                             z_val == x_val, z_bound == x_bound)
+        )
 
     def union_vec(self, vector1, vector2, target):
         x_b = vector1[0]
@@ -1169,7 +1174,7 @@ class EquationSolver:
         empty_arguments += self.is_empty(x_b, x_t, x_incl_b, x_incl_t)
         empty_arguments += self.assign(target, y_b, y_t, y_incl_b, y_incl_t)
 
-        or_arguments.append(And(empty_arguments))
+        or_arguments.append(self.encoder.And(empty_arguments))
 
         # STOP: x is empty
         # START: y is empty
@@ -1178,17 +1183,17 @@ class EquationSolver:
         empty_arguments += self.is_empty(y_b, y_t, y_incl_b, y_incl_t)
         empty_arguments += self.assign(target, x_b, x_t, x_incl_b, x_incl_t)
 
-        or_arguments.append(And(empty_arguments))
+        or_arguments.append(self.encoder.And(empty_arguments))
 
         # STOP: y is empty
         # START: x and y is not empty
 
         not_empty_arguments = list()
         not_empty_arguments.append(
-            Or(self.is_not_empty(x_b, x_t, x_incl_b, x_incl_t))
+            self.encoder.Or(self.is_not_empty(x_b, x_t, x_incl_b, x_incl_t))
         )
         not_empty_arguments.append(
-            Or(self.is_not_empty(y_b, y_t, y_incl_b, y_incl_t))
+            self.encoder.Or(self.is_not_empty(y_b, y_t, y_incl_b, y_incl_t))
         )
 
         expr = self.union_vec_one_bound(x_b, x_incl_b,
@@ -1203,118 +1208,26 @@ class EquationSolver:
                                         operator.gt)
         not_empty_arguments.append(expr)
 
-        or_arguments.append(And(not_empty_arguments))
+        or_arguments.append(self.encoder.And(not_empty_arguments))
 
         # STOP: x and y is not empty
 
-        return Or(or_arguments)
+        return self.encoder.Or(or_arguments)
 
-    @staticmethod
-    def union_vec_one_bound(x_val, x_bound,
+    # keep the looser bound, the value of an infinite bound is 0
+    def union_vec_one_bound(self, x_val, x_bound,
                             y_val, y_bound,
                             z_val, z_bound,
                             operation):
-
-        or_arguments = list()
-
-        # START: xb == 2
-
-        and_arguments = list()
-        and_arguments.append(x_bound == 2)
-        and_arguments.append(z_bound == 2)
-        and_arguments.append(z_val == 0)
-
-        or_arguments.append(And(and_arguments))
-
-        # STOP: xb == 2
-        # START: yb == 2
-
-        and_arguments.clear()
-        and_arguments.append(y_bound == 2)
-        and_arguments.append(z_bound == 2)
-        and_arguments.append(z_val == 0)
-
-        or_arguments.append(And(and_arguments))
-
-        # STOP: yb == 2
-        # START: yb != 2, xb != 2
-
-        outer_and = list()
-        outer_and.append(x_bound != 2)
-        outer_and.append(y_bound != 2)
-
-        outer_or = list()
-
-        # ===== START: xv op yv
-
-        and_arguments.clear()
-        and_arguments.append(operation(x_val, y_val))
-        and_arguments.append(z_bound == x_bound)
-        and_arguments.append(z_val == x_val)
-
-        outer_or.append(And(and_arguments))
-
-        # ===== STOP: xv op yv
-        # ===== START: yv op xv
-
-        and_arguments.clear()
-        and_arguments.append(operation(y_val, x_val))
-        and_arguments.append(z_bound == y_bound)
-        and_arguments.append(z_val == y_val)
-
-        outer_or.append(And(and_arguments))
-
-        # ===== STOP: yv op xv
-        # ===== START: yv == xv
-
-        and_arguments.clear()
-        and_arguments.append(y_val == x_val)
-
-        or_arguments2 = list()
-
-        # ========== START: yb == 1 or xb = 1
-
-        and_arguments2 = list()
-
-        or_arguments3 = list()
-        or_arguments3.append(y_bound == 1)
-        or_arguments3.append(x_bound == 1)
-
-        and_arguments2.append(Or(or_arguments3))
-
-        and_arguments2.append(z_bound == 1)
-        and_arguments2.append(z_val == x_val)
-
-        or_arguments2.append(And(and_arguments2))
-
-        # ========== STOP: yb == 1 or xb == 1
-        # ========== START: yb == 0 and xb == 0
-
-        and_arguments2.clear()
-
-        and_arguments2.append(y_bound == 0)
-        and_arguments2.append(x_bound == 0)
-        and_arguments2.append(z_bound == 0)
-        and_arguments2.append(z_val == x_val)
-
-        or_arguments2.append(And(and_arguments2))
-
-        # ========== STOP: yb == 0 and xb == 0
-
-        and_arguments.append(Or(or_arguments2))
-        outer_or.append(And(and_arguments))
-
-        # ===== STOP: xv == yv
-
-        outer_and.append(Or(outer_or))
-        or_arguments.append(And(outer_and))
-
-        # STOP: yb != 2, xb != 2
-
-        return Or(or_arguments)
+        y_looser = self.is_looser(y_val, y_bound, x_val, x_bound, operation)
+        return self.encoder.Or(
+            self.encoder.And(y_looser,
+                             z_bound == y_bound,
+                             z_val == self.encoder.If(y_bound == 2, 0, y_val)),
+            self.encoder.And(self.encoder.Not(y_looser),
+                             z_bound == x_bound,
+                             z_val == self.encoder.If(x_bound == 2, 0, x_val))
+        )
 
     def get_index_of_node(self, node):
-        for i in range(len(self.nodes)):
-            if self.nodes[i] == node:
-                return i
-        return None
+        return self.node_indexes.get(node)
@@ -0,0 +1,196 @@
+import io
+import re
+import shutil
+import subprocess
+import time
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from fractions import Fraction
+from typing import List, Tuple
+
+import z3
+
+from Equations.SmtLibTerm import to_text
+
+# the command lines of the supported solvers, each reads the script from
+# its standard input
+SOLVER_COMMANDS = {
+    "z3": ["z3", "-in", "-smt2"],
+    "cvc5": ["cvc5", "--lang=smt2"],
+    "yices": ["yices-smt2"],
+}
+
+# the tokens of the answer of a solver
+TOKEN = re.compile(r"\(|\)|\|[^|]*\||[^\s()]+")
+
+
+def get_solver_command(name) -> List[str]:
+    if name not in SOLVER_COMMANDS:
+        raise ValueError("unknown solver {}, must be one of {}"
+                         .format(name, list(SOLVER_COMMANDS.keys())))
+    command = SOLVER_COMMANDS[name]
+    if shutil.which(command[0]) is None:
+        raise ValueError("solver {} is not installed".format(name))
+    return command
+
+
+# parse a numeric value such as 4, 2.5, (- 4) or (/ 1 2)
+# return the value and the index of the token after it
+def parse_value(tokens, index):
+    if tokens[index] != "(":
+        return Fraction(tokens[index]), index + 1
+
+    operation = tokens[index + 1]
+    index += 2
+    arguments = list()
+    while tokens[index] != ")":
+        argument, index = parse_value(tokens, index)
+        arguments.append(argument)
+
+    if operation == "-" and len(arguments) == 1:
+        value = -arguments[0]
+    elif operation == "-":
+        value = arguments[0] - arguments[1]
+    elif operation == "/":
+        value = arguments[0] / arguments[1]
+    else:
+        raise ValueError("unexpected operation {} in model"
+                         .format(operation))
+    return value, index + 1
+
+
+# read the values of the model given as (define-fun x () Int (- 4)) entries
+def parse_model(output):
+    values = dict()
+    tokens = TOKEN.findall(output)
+    for index in range(len(tokens) - 4):
+        if tokens[index] != "define-fun" or tokens[index + 2] != "(":
+            continue
+        name = tokens[index + 1].strip("|")
+        sort = tokens[index + 4]
+        if sort in ["Int", "Real"]:
+            values[name], _ = parse_value(tokens, index + 5)
+        elif sort == "Bool":
+            values[name] = tokens[index + 5] == "true"
+    return values
+
+
+# a solver that writes the formula as an SMT-LIB2 script and runs external
+# solver processes on it
+# with several commands the processes race and the first definite answer
+# is taken, every check runs the complete script again
+class ProcessSolver:
+    def __init__(self, encoder, commands):
+        self.encoder = encoder
+        self.commands: List[List[str]] = commands
+
+        # in seconds, None waits for the answer indefinitely
+        self.timeout = None
+
+        # declarations are kept for all scopes, the assertions per scope
+        self.declarations: List[Tuple[str, str]] = list()
+        self.scopes: List[io.StringIO] = [io.StringIO()]
+
+        self.values = None
+
+    # only the timeout is supported, the other options are specific to z3
+    def set(self, key, value):
+        if key == "timeout":
+            self.timeout = value / 1000
+
+    def add(self, *constraints):
+        self.declarations += self.encoder.take_pending()
+        for constraint in constraints:
+            self.scopes[-1].write("(assert ")
+            self.scopes[-1].write(to_text(constraint))
+            self.scopes[-1].write(")\n")
+
+    def push(self):
+        self.scopes.append(io.StringIO())
+
+    def pop(self):
+        self.scopes.pop(-1)
+
+    def to_smt2(self) -> str:
+        self.declarations += self.encoder.take_pending()
+
+        script = io.StringIO()
+        script.write("(set-option :produce-models true)\n")
+        script.write("(set-logic {})\n".format(self.encoder.logic))
+        for name, sort in self.declarations:
+            script.write("(declare-fun |{}| () {})\n".format(name, sort))
+        for scope in self.scopes:
+            script.write(scope.getvalue())
+        return script.getvalue()
+
+    @staticmethod
+    def run(process, script):
+        try:
+            output, _ = process.communicate(script)
+        except (OSError, ValueError):
+            # the process got killed as another one answered first
+            return z3.unknown, None
+
+        lines = output.split("\n", 1)
+        answer = lines[0].strip()
+        if answer == "sat":
+            return z3.sat, parse_model(lines[1] if len(lines) > 1 else "")
+        if answer == "unsat":
+            return z3.unsat, None
+        return z3.unknown, None
+
+    def check(self):
+        script = self.to_smt2() + "(check-sat)\n(get-model)\n"
+
+        processes = [subprocess.Popen(command, stdin=subprocess.PIPE,
+                                      stdout=subprocess.PIPE,
+                                      stderr=subprocess.DEVNULL,
+                                      universal_newlines=True)
+                     for command in self.commands]
+
+        deadline = None
+        if self.timeout is not None:
+            deadline = time.monotonic() + self.timeout
+
+        result, self.values = z3.unknown, None
+        with ThreadPoolExecutor(len(processes)) as executor:
+            pending = {executor.submit(self.run, process, script)
+                       for process in processes}
+            while pending and result == z3.unknown:
+                remaining = None
+                if deadline is not None:
+                    remaining = max(0.0, deadline - time.monotonic())
+                done, pending = wait(pending, timeout=remaining,
+                                     return_when=FIRST_COMPLETED)
+                if not done:
+                    break
+                for future in done:
+                    answer, values = future.result()
+                    if answer != z3.unknown and result == z3.unknown:
+                        result, self.values = answer, values
+
+            for process in processes:
+                if process.poll() is None:
+                    process.kill()
+
+        return result
+
+    def model(self):
+        return ProcessModel(self.values)
+
+
+# look up the value of a variable in the answer of a solver process
+class ProcessModel:
+    def __init__(self, values):
+        self.values = values
+
+    def __getitem__(self, term):
+        name = to_text(term).strip("|")
+        if name not in self.values:
+            return None
+        value = self.values[name]
+        if isinstance(value, bool):
+            return z3.BoolVal(value)
+        if value.denominator == 1:
+            return z3.IntVal(value.numerator)
+        return z3.RealVal(value)
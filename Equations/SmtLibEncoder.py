@@ -0,0 +1,96 @@
+from typing import List, Set, Tuple
+
+import z3
+
+from Equations.SmtLibTerm import SmtLibTerm, to_symbol, to_text
+from Equations.SmtLibSolver import SmtLibSolver
+
+
+# builds the constraints as SMT-LIB2 text rather than as z3 expressions
+# building a z3 expression crosses into the z3 library for every operator,
+# whereas the text is only handed over when the solver is used
+# the numeric variables are integers, or reals if real is set
+class SmtLibEncoder:
+    def __init__(self, real=False):
+        self.real = real
+        self.sort = "Real" if real else "Int"
+        self.logic = "QF_LRA" if real else "QF_LIA"
+
+        self.declared: Set[str] = set()
+
+        # the declarations not yet handed over to the solver, as pairs of
+        # name and sort
+        self.pending: List[Tuple[str, str]] = list()
+
+    def declare(self, name, sort) -> SmtLibTerm:
+        if name not in self.declared:
+            self.declared.add(name)
+            self.pending.append((name, sort))
+        return SmtLibTerm(to_symbol(name))
+
+    def Variable(self, name) -> SmtLibTerm:
+        return self.declare(name, self.sort)
+
+    def Bool(self, name) -> SmtLibTerm:
+        return self.declare(name, "Bool")
+
+    # named like the variables of z3.IntVector
+    def Vector(self, name, size) -> List[SmtLibTerm]:
+        return [self.Variable("{}__{}".format(name, i)) for i in range(size)]
+
+    @staticmethod
+    def combine(operation, arguments, neutral) -> SmtLibTerm:
+        # as in z3 both a list and separate arguments are accepted
+        if len(arguments) == 1 and isinstance(arguments[0], (list, tuple)):
+            arguments = arguments[0]
+
+        # fold the python booleans left by comparisons of constants
+        if any(isinstance(argument, bool) and to_text(argument) != neutral
+               for argument in arguments):
+            return SmtLibTerm("false" if neutral == "true" else "true")
+        arguments = [argument for argument in arguments
+                     if not isinstance(argument, bool)]
+        if not arguments:
+            return SmtLibTerm(neutral)
+        if len(arguments) == 1:
+            return SmtLibTerm(to_text(arguments[0]))
+        return SmtLibTerm("({} {})".format(operation, " ".join(
+            [to_text(argument) for argument in arguments])))
+
+    def And(self, *arguments) -> SmtLibTerm:
+        return self.combine("and", arguments, "true")
+
+    def Or(self, *arguments) -> SmtLibTerm:
+        return self.combine("or", arguments, "false")
+
+    @staticmethod
+    def Not(argument) -> SmtLibTerm:
+        if isinstance(argument, bool):
+            return SmtLibTerm(to_text(not argument))
+        return SmtLibTerm("(not {})".format(to_text(argument)))
+
+    @staticmethod
+    def If(condition, then_value, else_value) -> SmtLibTerm:
+        if isinstance(condition, bool):
+            return SmtLibTerm(to_text(then_value if condition
+                                      else else_value))
+        return SmtLibTerm("(ite {} {} {})".format(to_text(condition),
+                                                  to_text(then_value),
+                                                  to_text(else_value)))
+
+    @staticmethod
+    def create_constant(name, sort):
+        if sort == "Bool":
+            return z3.Bool(name)
+        if sort == "Real":
+            return z3.Real(name)
+        return z3.Int(name)
+
+    # get the declarations that have not been handed over yet
+    def take_pending(self) -> List[Tuple[str, str]]:
+        pending = self.pending
+        self.pending = list()
+        return pending
+
+    def create_solver(self) -> SmtLibSolver:
+        return SmtLibSolver(self)
@@ -0,0 +1,72 @@
+import io
+
+import z3
+
+from Equations.SmtLibTerm import to_text
+
+
+# a z3 solver that is fed SMT-LIB2 text
+# the added constraints are streamed into a buffer and only parsed, in one
+# call, once the solver state is needed
+class SmtLibSolver:
+    def __init__(self, encoder):
+        self.encoder = encoder
+        self.solver = z3.Solver()
+        self.buffer = io.StringIO()
+
+        # the z3 constants of the variables declared in earlier parses
+        self.constants = dict()
+
+    def set(self, *arguments, **keywords):
+        self.solver.set(*arguments, **keywords)
+
+    def add(self, *constraints):
+        for constraint in constraints:
+            self.buffer.write("(assert ")
+            self.buffer.write(to_text(constraint))
+            self.buffer.write(")\n")
+
+    def flush(self):
+        declarations = self.encoder.take_pending()
+        if not declarations and not self.buffer.tell():
+            return
+
+        script = io.StringIO()
+        for name, sort in declarations:
+            script.write("(declare-fun |{}| () {})\n".format(name, sort))
+        script.write(self.buffer.getvalue())
+        self.buffer = io.StringIO()
+
+        self.solver.add(z3.parse_smt2_string(script.getvalue(),
+                                             decls=self.constants))
+        for name, sort in declarations:
+            self.constants[name] = self.encoder.create_constant(name, sort)
+
+    def push(self):
+        self.flush()
+        self.solver.push()
+
+    def pop(self):
+        self.flush()
+        self.solver.pop()
+
+    def check(self):
+        self.flush()
+        return self.solver.check()
+
+    def to_smt2(self) -> str:
+        self.flush()
+        return self.solver.to_smt2()
+
+    def model(self):
+        return SmtLibModel(self.solver.model(), self.constants)
+
+
+# look up the value of a variable given as SMT-LIB term
+class SmtLibModel:
+    def __init__(self, model, constants):
+        self.model = model
+        self.constants = constants
+
+    def __getitem__(self, term):
+        return self.model[self.constants[to_text(term).strip("|")]]
@@ -0,0 +1,92 @@
+import re
+
+# symbols that can be written as is, all others are quoted
+SIMPLE_SYMBOL = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def to_symbol(name) -> str:
+    if SIMPLE_SYMBOL.match(name):
+        return name
+    return "|{}|".format(name)
+
+
+# convert any operand to its SMT-LIB text
+# python values show up wherever a constant is compared or added to a term
+def to_text(value) -> str:
+    if isinstance(value, SmtLibTerm):
+        return value.text
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError("{} is not an integer".format(value))
+        value = int(value)
+    if isinstance(value, str):
+        value = int(value)
+    if value < 0:
+        return "(- {})".format(-value)
+    return str(value)
+
+
+class SmtLibTerm:
+    __slots__ = ("text",)
+
+    def __init__(self, text):
+        self.text = text
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return self.text
+
+    # comparing terms builds a new term, as in z3, so terms cannot be
+    # used as truth values or hashed
+    def __bool__(self):
+        raise TypeError("the truth value of a term is unknown: "
+                        "{}".format(self.text))
+
+    __hash__ = None
+
+    def apply(self, operation, other):
+        return SmtLibTerm("({} {} {})".format(operation, self.text,
+                                              to_text(other)))
+
+    def apply_reversed(self, operation, other):
+        return SmtLibTerm("({} {} {})".format(operation, to_text(other),
+                                              self.text))
+
+    def __eq__(self, other):
+        return self.apply("=", other)
+
+    def __ne__(self, other):
+        return self.apply("distinct", other)
+
+    def __lt__(self, other):
+        return self.apply("<", other)
+
+    def __le__(self, other):
+        return self.apply("<=", other)
+
+    def __gt__(self, other):
+        return self.apply(">", other)
+
+    def __ge__(self, other):
+        return self.apply(">=", other)
+
+    def __add__(self, other):
+        return self.apply("+", other)
+
+    def __radd__(self, other):
+        return self.apply_reversed("+", other)
+
+    def __sub__(self, other):
+        return self.apply("-", other)
+
+    def __rsub__(self, other):
+        return self.apply_reversed("-", other)
+
+    def __neg__(self):
+        return SmtLibTerm("(- {})".format(self.text))
@@ -0,0 +1,42 @@
+import z3
+
+
+# builds the constraints directly as z3 expressions
+# the numeric variables are integers, or reals if real is set
+class Z3Encoder:
+    def __init__(self, real=False):
+        self.real = real
+
+    def Variable(self, name):
+        if self.real:
+            return z3.Real(name)
+        return z3.Int(name)
+
+    def Vector(self, name, size):
+        if self.real:
+            return z3.RealVector(name, size)
+        return z3.IntVector(name, size)
+
+    @staticmethod
+    def Bool(name):
+        return z3.Bool(name)
+
+    @staticmethod
+    def And(*arguments):
+        return z3.And(*arguments)
+
+    @staticmethod
+    def Or(*arguments):
+        return z3.Or(*arguments)
+
+    @staticmethod
+    def Not(argument):
+        return z3.Not(argument)
+
+    @staticmethod
+    def If(condition, then_value, else_value):
+        return z3.If(condition, then_value, else_value)
+
+    @staticmethod
+    def create_solver():
+        return z3.Solver()
@@ -1,4 +1,6 @@
 class Interval:
+    __slots__ = ("low", "incl_low", "high", "incl_high")
+
     def __init__(self, low, incl_low, high, incl_high):
         self.low = low
         self.incl_low = incl_low
@@ -1,134 +1,147 @@
-from typing import List
+from typing import List, Tuple
 
 from Reach.Interval import Interval
 
 
 class Intervals:
-    def __init__(self, low, incl_low, high, incl_high):
+    # the weak reference allows sets to be interned in an IntervalsPool
+    __slots__ = ("intervals", "__weakref__")
+
+    def __init__(self, low=None, incl_low=None, high=None, incl_high=None):
         # all the sub-intervals of the current interval
         # we make the assumption that this list is ordered
         # so that the lowest values are first in the list
         # and the highest are last
         self.intervals: List[Interval] = list()
 
+        # without bounds, the intervals start out empty
+        if low is None:
+            return
+
         initial_interval = Interval(low, incl_low, high, incl_high)
         self.intervals.append(initial_interval)
 
     def get_intervals(self) -> List[Interval]:
         return self.intervals
 
+    # as the sub-intervals are kept in canonical form, equal sets
+    # have equal keys
+    def get_key(self) -> Tuple:
+        return tuple((interval.get_low_bound(), interval.is_low_inclusive(),
+                      interval.get_high_bound(), interval.is_high_inclusive())
+                     for interval in self.intervals)
+
+    # the sub-intervals are kept in canonical form: ordered, disjoint,
+    # non-empty and no two neighbours touch in a value they both allow
+    # as a consequence, two equal sets always have equal sub-intervals
+    def normalise(self):
+        # empty sub-intervals such as (a, a] or [a, a) are dropped, they
+        # hold no value and do not widen a neighbour touching them
+        intervals = list()
+        for interval in self.intervals:
+            low = interval.get_low_bound()
+            high = interval.get_high_bound()
+            if low > high:
+                continue
+            if low == high and not (interval.is_low_inclusive() and
+                                    interval.is_high_inclusive()):
+                continue
+            intervals.append(interval)
+
+        # sorting is linear in case the list consists of a few sorted runs
+        intervals.sort(key=lambda interval: (
+            interval.get_low_bound(), not interval.is_low_inclusive()))
+
+        normalised = list()
+        for interval in intervals:
+            low = interval.get_low_bound()
+            high = interval.get_high_bound()
+
+            if normalised:
+                last = normalised[-1]
+                last_high = last.get_high_bound()
+                overlaps = low < last_high
+                if low == last_high:
+                    overlaps = last.is_high_inclusive() or \
+                        interval.is_low_inclusive()
+
+                if overlaps:
+                    if high > last_high:
+                        last.update_high(high, interval.is_high_inclusive())
+                    elif high == last_high and interval.is_high_inclusive():
+                        last.set_incl_high(True)
+                    continue
+
+            normalised.append(interval)
+
+        self.intervals = normalised
+
+    # the Minkowski sum, holding every sum of a value of both sets
     def add(self, addends):
+        sums = list()
         for addend in addends.get_intervals():
             for interval in self.intervals:
-                interval.add(addend)
+                sums.append(Interval(
+                    interval.get_low_bound() + addend.get_low_bound(),
+                    interval.is_low_inclusive() and addend.is_low_inclusive(),
+                    interval.get_high_bound() + addend.get_high_bound(),
+                    interval.is_high_inclusive() and
+                    addend.is_high_inclusive()))
 
-    def union(self, uniends):
-        # track if the currently tracked uniend got inserted
-        # this is used to verify whether or not the final uniend got added
-        inserted = True
-        low = None
-        incl_low = None
-        high = None
-        incl_high = None
+        self.intervals = sums
+        self.normalise()
 
+    def union(self, uniends):
+        # both lists are sorted, so this merges two sorted runs
         for uniend in uniends.get_intervals():
-            inserted = False
-            low = uniend.get_low_bound()
-            incl_low = uniend.is_low_inclusive()
-            high = uniend.get_high_bound()
-            incl_high = uniend.is_high_inclusive()
-
-            i = -1
-            while True:
+            self.intervals.append(Interval(uniend.get_low_bound(),
+                                           uniend.is_low_inclusive(),
+                                           uniend.get_high_bound(),
+                                           uniend.is_high_inclusive()))
+        self.normalise()
+
+    # the values held by both sets, both lists are sorted, so the pairs of
+    # overlapping sub-intervals are found in a single sweep
+    def intersect(self, other) -> "Intervals":
+        result = Intervals()
+        mine = self.intervals
+        others = other.get_intervals()
+
+        i = 0
+        j = 0
+        while i < len(mine) and j < len(others):
+            first = mine[i]
+            second = others[j]
+
+            low = max(first.get_low_bound(), second.get_low_bound())
+            incl_low = (first.get_low_bound() < low or
+                        first.is_low_inclusive()) and \
+                (second.get_low_bound() < low or second.is_low_inclusive())
+            high = min(first.get_high_bound(), second.get_high_bound())
+            incl_high = (first.get_high_bound() > high or
+                         first.is_high_inclusive()) and \
+                (second.get_high_bound() > high or
+                 second.is_high_inclusive())
+            result.get_intervals().append(Interval(low, incl_low,
+                                                   high, incl_high))
+
+            # move on from the sub-interval that ends first
+            if (first.get_high_bound(), first.is_high_inclusive()) < \
+                    (second.get_high_bound(), second.is_high_inclusive()):
                 i += 1
-                if i >= len(self.intervals):
-                    break
-
-                interval = self.intervals[i]
-
-                # see if the current interval is completely to the left of
-                # the uniend
-                if interval.get_high_bound() < low:
-                    continue
-
-                # see if the current interval supersedes the uniend
-                if interval.get_high_bound() >= high:
-                    # if the uniend is strictly below the current interval
-                    # we insert the uniend directly below the current interval
-                    if interval.get_low_bound() > high:
-                        self.intervals.insert(i, Interval(low, incl_low,
-                                                          high, incl_high))
-                        inserted = True
-                        i += 1
-                        break
-
-                    # if the upper bound is overlapping
-                    # we simply need to assert that if either one
-                    # is inclusive, the interval will reflect this
-                    if interval.get_high_bound() == high:
-                        if incl_high:
-                            interval.set_incl_high(incl_high)
-
-                    # if the lower bound is overlapping
-                    # we need to assert whether or not either one is inclusive
-                    if interval.get_low_bound() == high:
-                        if incl_high or interval.is_low_inclusive():
-                            high = interval.get_high_bound()
-                            incl_high = interval.is_high_inclusive()
-                            self.intervals.pop(i)
-                            self.intervals.insert(i, Interval(low, incl_low,
-                                                              high, incl_high))
-                            inserted = True
-                            break
-                        else:
-                            self.intervals.insert(i, Interval(low, incl_low,
-                                                              high, incl_high))
-                            inserted = True
-                            break
-
-                    # the uniend extends the current interval in the lower
-                    # direction update the interval to reflect this
-                    if interval.get_low_bound() > low:
-                        interval.update_low(low, incl_low)
-
-                    # if the lower bound is overlapping
-                    # we simply need to assert that if either one
-                    # is inclusive, the interval will reflect this
-                    elif interval.get_low_bound() == low:
-                        if incl_low:
-                            interval.set_incl_low(incl_low)
-
-                    inserted = True
-                    break
-
-                # see if the uniend supersedes the current interval
-                elif interval.get_high_bound() < high:
-                    # verify whether or not the two intervals connect
-                    if interval.get_high_bound() == low:
-                        if interval.is_high_inclusive() or incl_low:
-                            low = interval.get_low_bound()
-                            incl_low = interval.is_low_inclusive()
-                        else:
-                            continue
-
-                    # if the current interval extends the uniend in the lower
-                    # direction update the uniend to reflect this
-                    if interval.get_low_bound() < low:
-                        low = interval.get_low_bound()
-                        incl_low = interval.is_low_inclusive()
-
-                    # if the lower bound is overlapping
-                    # assure that the incl_low variable correctly reflects this
-                    elif interval.get_low_bound() == low:
-                        incl_low |= interval.is_low_inclusive()
-
-                    self.intervals.pop(i)
-                    i -= 1
+            else:
+                j += 1
 
-        if not inserted:
-            self.intervals.append(Interval(low, incl_low, high, incl_high))
+        # the pairs that do not overlap leave empty sub-intervals behind
+        result.normalise()
+        return result
 
     def rescale_reach(self, lower_bound, upper_bound):
+        # no value lies within an empty range
+        if lower_bound > upper_bound:
+            self.intervals = list()
+            return
+
         i = -1
         while True:
             i += 1
@@ -148,6 +161,36 @@ class Intervals:
 
             interval.rescale_reach(lower_bound, upper_bound)
 
+    # bound the number of sub-intervals by replacing the neighbouring
+    # sub-intervals with the smallest gaps by their hull
+    # merging two neighbours leaves the other gaps as they are, so the gaps
+    # to close are picked at once and merged in a single pass
+    # this over-approximates the reach, trading precision for speed
+    def limit_fragments(self, max_fragments):
+        merges = len(self.intervals) - max(max_fragments, 1)
+        if merges <= 0:
+            return
+
+        # the gap i lies between the sub-intervals i and i + 1, equal gaps
+        # are closed from the left
+        def gap(i):
+            return self.intervals[i + 1].get_low_bound() - \
+                self.intervals[i].get_high_bound()
+
+        gaps = sorted(range(len(self.intervals) - 1),
+                      key=lambda i: (gap(i), i))
+        closed = set(gaps[:merges])
+
+        merged = [self.intervals[0]]
+        for i in range(1, len(self.intervals)):
+            upper = self.intervals[i]
+            if i - 1 in closed:
+                merged[-1].update_high(upper.get_high_bound(),
+                                       upper.is_high_inclusive())
+            else:
+                merged.append(upper)
+        self.intervals = merged
+
     def is_expansion_of(self, other_intervals):
         # check if the absolute size of the new interval is equal or larger
         # than the other preceding interval
@@ -219,6 +262,9 @@ class Intervals:
         return j == len(self.intervals)
 
     def equals(self, other_intervals):
+        if self is other_intervals:
+            return True
+
         if len(self.intervals) != len(other_intervals.get_intervals()):
             return False
 
@@ -230,6 +276,18 @@ class Intervals:
 
         return True
 
+    def contains(self, value) -> bool:
+        for interval in self.intervals:
+            if interval.get_low_bound() < value < interval.get_high_bound():
+                return True
+            if value == interval.get_low_bound() and \
+                    interval.is_low_inclusive():
+                return True
+            if value == interval.get_high_bound() and \
+                    interval.is_high_inclusive():
+                return True
+        return False
+
     def get_inf(self):
         return self.intervals[0].get_low_bound()
 
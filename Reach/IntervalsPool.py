@@ -0,0 +1,38 @@
+from typing import Tuple
+from weakref import WeakValueDictionary
+
+from Reach.Interval import Interval
+from Reach.Intervals import Intervals
+
+
+class IntervalsPool:
+    def __init__(self):
+        # map the key of every interned set to its shared instance
+        # a shared instance is dropped once nothing refers to it anymore
+        self.pool = WeakValueDictionary()
+
+    # get the shared instance equal to the given set, creating it if needed
+    # the shared instances may never be altered, as they are referred to
+    # from multiple places
+    def intern(self, intervals) -> Intervals:
+        key = intervals.get_key()
+        shared = self.pool.get(key)
+        if shared is None:
+            shared = self.create_intervals(key)
+            self.pool[key] = shared
+        return shared
+
+    # get the shared instance equal to the given set, None if there is none
+    def find(self, intervals) -> Intervals:
+        return self.pool.get(intervals.get_key())
+
+    @staticmethod
+    def create_intervals(key: Tuple) -> Intervals:
+        intervals = Intervals()
+        for low, incl_low, high, incl_high in key:
+            intervals.get_intervals().append(Interval(low, incl_low,
+                                                      high, incl_high))
+        return intervals
+
+    def __len__(self):
+        return len(self.pool)
@@ -4,6 +4,8 @@ from typing import Dict
 
 
 class Reach:
+    __slots__ = ("node", "reachable_set")
+
     def __init__(self, node):
         self.node = node
         self.reachable_set: Dict[str, Intervals] = dict()
@@ -34,6 +36,10 @@ class Reach:
         if state in self.reachable_set:
             self.reachable_set[state].rescale_reach(lower_bound, higher_bound)
 
+    def limit_fragments(self, state, max_fragments):
+        if state in self.reachable_set:
+            self.reachable_set[state].limit_fragments(max_fragments)
+
     def ensure_reach_in_node_bounds(self, state):
         if self.node is not None:
             condition = self.node.get_condition()
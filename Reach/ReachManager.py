@@ -1,21 +1,31 @@
-from typing import Dict
-from copy import deepcopy
+from typing import Dict, List, Set, Tuple
 from math import isnan
 
 from Reach.Reach import Reach
 from Reach.Intervals import Intervals
+from Reach.IntervalsPool import IntervalsPool
+from Reach.Transfer import Transfer
 
 from Automaton.Automaton import Automaton
 
+# the origin under which all reaches are joined in collapsed mode
+JOINED_ORIGIN = "*"
+
 
 class ReachManager:
-    def __init__(self, automaton, debug=False):
+    def __init__(self, automaton, debug=False, collapsed=False,
+                 max_fragments=None, transfers=None, initial_intervals=None):
         self.automaton: Automaton = automaton
 
         self.upper_bound = automaton.get_upper_bound()
         self.lower_bound = automaton.get_lower_bound()
         self.initial_value = automaton.get_initial_value()
 
+        # the values the counter can take in the initial node, these are
+        # restricted to the bounds of the initial node
+        # if None, this is only the initial value of the automaton
+        self.initial_intervals: Intervals = initial_intervals
+
         # the reaches dict tracks the reachability data for each state
         # this data will always be up to date and will be directly
         # updated during the post
@@ -24,7 +34,9 @@ class ReachManager:
         # the intervals dict will track the reachability data at the start
         # of each post update the dict will be updated at the end of every
         # post operation, rather than during
+        # the snapshots are interned, so equal sets share a single instance
         self.intervals: Dict[str, Dict[str, Intervals]] = dict()
+        self.pool = IntervalsPool()
 
         # keep track of the number of steps we have encountered
         self.n = 0
@@ -42,8 +54,42 @@ class ReachManager:
         # if so, output additional info for each loop
         self.debug = debug
 
+        # track whether collapsed mode is on
+        # if so, each state joins the reaches of all its origins into one
+        # set, only the edges within a loop keep their own origin as the
+        # loop acceleration requires these
+        self.collapsed = collapsed
+
+        # the maximal number of sub-intervals in a single reach
+        # if exceeded, the closest sub-intervals are merged
+        # if None, the number of sub-intervals is unbounded
+        self.max_fragments = max_fragments
+
+        # the nodes whose reachability the caller is interested in
+        # if None, the analysis runs until the global fixpoint
+        # otherwise it stops as soon as all targets are reachable or
+        # the nodes that can still influence a target reach a fixpoint
+        self.targets: Set[str] = None
+        self.reached_targets: Set[str] = set()
+        self.relevant: Set[str] = set()
+
+        # map every node to the nodes with an edge towards it
+        self.predecessors: Dict[str, Set[str]] = dict()
+        self.initialise_predecessors()
+
+        # map every node to the compiled transfers of its incoming edges
+        # these do not depend on the initial value or bounds, so they can
+        # be shared with another manager for the same automaton and mode
+        self.transfers: Dict[str, List[Transfer]] = transfers
+
+        # map every node to the bounds the counter must respect within it
+        self.node_bounds: Dict[str, Tuple[float, float]] = dict()
+
         self.initialise_intervals()
         self.initialise_reaches()
+        self.initialise_node_bounds()
+        if self.transfers is None:
+            self.initialise_transfers()
         self.update_intervals()
 
     def initialise_reaches(self):
@@ -52,9 +98,116 @@ class ReachManager:
             if self.automaton.is_invisible(node):
                 continue
             self.add_state(node)
-            if self.automaton.is_initial(node):
+            if not self.automaton.is_initial(node):
+                continue
+            if self.initial_intervals is None:
                 self.add_interval(node, node, self.initial_value,
                                   True, self.initial_value, True)
+            else:
+                initial = Intervals()
+                initial.union(self.initial_intervals)
+                initial.rescale_reach(*self.get_node_bounds(node))
+                initial.remove_inconsistencies()
+                self.reaches[node].update_reach(node, initial)
+
+    def initialise_predecessors(self):
+        for node in self.automaton.get_nodes():
+            self.predecessors[node] = set()
+
+        for start in self.automaton.get_nodes():
+            for end in self.automaton.get_outgoing_edges(start):
+                self.predecessors[end].add(start)
+
+    def initialise_node_bounds(self):
+        for node in self.reaches:
+            self.node_bounds[node] = self.get_node_bounds(node)
+
+    def initialise_transfers(self):
+        self.transfers = dict()
+
+        loop_edges = set()
+        for loop in self.loops:
+            nodes = loop.get_nodes()
+            for i in range(len(nodes)):
+                loop_edges.add((nodes[i], nodes[(i + 1) % len(nodes)]))
+
+        for node in self.reaches:
+            self.transfers[node] = list()
+
+            proceeding_edges = self.automaton.get_proceeding_edges(node)
+            for p in proceeding_edges:
+                if self.automaton.is_invisible(p):
+                    continue
+                for edge in proceeding_edges[p]:
+                    op = edge.get_operation()
+                    if op is not None:
+                        z = op.get_value()
+                    else:
+                        z = 0
+                    key = p
+                    if self.collapsed and (p, node) not in loop_edges:
+                        key = JOINED_ORIGIN
+                    self.transfers[node].append(Transfer(p, z, key))
+
+    def get_transfers(self) -> Dict[str, List[Transfer]]:
+        return self.transfers
+
+    # get the bounds the counter must respect within the given node
+    # these are the bounds of the automaton restricted by the node condition
+    def get_node_bounds(self, node):
+        lower_bound = self.lower_bound
+        upper_bound = self.upper_bound
+
+        condition = self.automaton.get_node_condition(node)
+        if condition is not None:
+            operation = condition.get_operation()
+            value = condition.get_value()
+            if operation in ["<=", "="]:
+                upper_bound = min(upper_bound, value)
+            if operation in [">=", "="]:
+                lower_bound = max(lower_bound, value)
+
+        return lower_bound, upper_bound
+
+    def set_targets(self, targets):
+        self.targets = {target for target in targets if target in self.reaches}
+        self.reached_targets = set()
+        self.update_targets()
+
+    def get_reached_targets(self) -> Set[str]:
+        return self.reached_targets
+
+    def update_targets(self):
+        if self.targets is None:
+            return
+
+        newly_reached = False
+        for target in self.targets - self.reached_targets:
+            if self.is_reachable(target):
+                self.reached_targets.add(target)
+                newly_reached = True
+
+        if self.reached_targets == self.targets:
+            self.finished = True
+            return
+
+        if newly_reached or not self.relevant:
+            self.update_relevant()
+
+    # only nodes from which an undecided target can be reached
+    # can still influence the outcome of the analysis
+    def update_relevant(self):
+        self.relevant = set()
+        stack = list(self.targets - self.reached_targets)
+        while stack:
+            node = stack.pop()
+            if node in self.relevant:
+                continue
+            self.relevant.add(node)
+            stack += self.predecessors[node]
+
+    def is_relevant(self, node) -> bool:
+        return self.targets is None or node in self.relevant
 
     def initialise_intervals(self):
         for node in self.automaton.get_nodes():
@@ -64,9 +217,12 @@ class ReachManager:
 
     def update_intervals(self):
         for node in self.reaches:
-            for node2 in self.reaches:
-                interval = self.reaches[node].get_reachable_set(node2)
-                self.intervals[node][node2] = deepcopy(interval)
+            if not self.is_relevant(node):
+                continue
+            reach = self.reaches[node]
+            for origin in reach.get_preceding_nodes():
+                interval = reach.get_reachable_set(origin)
+                self.intervals[node][origin] = self.pool.intern(interval)
 
     def add_state(self, state):
         nodes = self.automaton.get_nodes()
@@ -199,6 +355,11 @@ class ReachManager:
         for loop in self.loops:
             nodes = loop.get_nodes()
 
+            # a loop lies either entirely inside or entirely outside of
+            # the relevant nodes, as all of its nodes reach each other
+            if not self.is_relevant(nodes[0]):
+                continue
+
             top_bound_dif = None
             top_bound = None
             top_bounded_node = None
@@ -318,8 +479,10 @@ class ReachManager:
 
     def verify_end_condition(self):
         for node in self.reaches:
+            if not self.is_relevant(node):
+                continue
             reach = self.reaches[node]
-            for origin in self.automaton.get_nodes():
+            for origin in reach.get_preceding_nodes():
                 reachable_set = reach.get_reachable_set(origin)
 
                 # this means implies that there are no reaches from
@@ -327,7 +490,7 @@ class ReachManager:
                 if reachable_set is None:
                     continue
 
-                previous_set = self.intervals[node][origin]
+                previous_set = self.intervals[node].get(origin)
 
                 if reachable_set is None:
                     continue
@@ -335,7 +498,8 @@ class ReachManager:
                 if previous_set is None:
                     return
 
-                if not reachable_set.equals(previous_set):
+                # the snapshot is interned, so an unchanged set maps to it
+                if self.pool.find(reachable_set) is not previous_set:
                     return
 
         self.finished = True
@@ -349,6 +513,8 @@ class ReachManager:
         for state in self.reaches.keys():
             if self.automaton.is_invisible(state):
                 continue
+            if not self.is_relevant(state):
+                continue
             self.update_state(state)
 
         self.check_for_accelerations()
@@ -357,6 +523,7 @@ class ReachManager:
             print(self)
 
         self.verify_end_condition()
+        self.update_targets()
         if self.finished:
             return
 
@@ -364,45 +531,35 @@ class ReachManager:
         self.n += 1
 
     def update_state(self, q):
-        proceeding_edges = self.automaton.get_proceeding_edges(q)
-
-        for p in proceeding_edges:
-            for edge in proceeding_edges[p]:
-                if self.automaton.is_invisible(p):
+        reach = self.reaches[q]
+        updated = set()
+
+        for transfer in self.transfers[q]:
+            origin = transfer.get_origin()
+            key = transfer.get_key()
+            for sub_interval in self.intervals[origin].values():
+                if sub_interval is None:
                     continue
 
-                for sub_interval in self.intervals[p].values():
-                    if sub_interval is None:
-                        continue
-
-                    if sub_interval.is_empty():
-                        continue
-
-                    op = edge.get_operation()
-                    if op is not None:
-                        z = edge.get_operation().get_value()
-                    else:
-                        z = 0
-
-                    new_interval = deepcopy(sub_interval)
+                if sub_interval.is_empty():
+                    continue
 
-                    if z > 0:
-                        addend = Intervals(0, False, z, True)
-                        new_interval.add(addend)
-                    elif z < 0:
-                        addend = Intervals(z, True, 0, False)
-                        new_interval.add(addend)
+                reach.update_reach(key, transfer.apply(sub_interval))
+                updated.add(key)
 
-                    self.reaches[q].update_reach(p, new_interval)
-                    self.reaches[q].rescale_reach(p, self.lower_bound,
-                                                  self.upper_bound)
-                    self.reaches[q].ensure_reach_in_node_bounds(p)
-                    self.reaches[q].remove_inconsistencies()
+        # normalise every updated reach once, rather than after every union
+        if updated:
+            lower_bound, upper_bound = self.node_bounds[q]
+            for key in updated:
+                reach.rescale_reach(key, lower_bound, upper_bound)
+                if self.max_fragments is not None:
+                    reach.limit_fragments(key, self.max_fragments)
+            reach.remove_inconsistencies()
 
     def is_reachable(self, node):
         reach = self.reaches[node]
 
-        for node in self.automaton.get_nodes():
+        for node in reach.get_preceding_nodes():
             reachable_set = reach.get_reachable_set(node)
             if reachable_set is None:
                 continue
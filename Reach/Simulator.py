@@ -0,0 +1,182 @@
+from collections import deque
+from typing import Deque, Dict, List, Set, Tuple
+
+from Automaton.Automaton import Automaton
+
+# a value of the counter, as integer and number of infinitesimal steps
+Value = Tuple[int, int]
+
+
+# explores concrete values of the counter to find nodes that are reachable
+# along short runs, before the interval analysis or the formula is needed
+# the counter is continuous as in the interval analysis, an increment by z
+# allows any increase in (0, z] and a decrement by z any decrease in (0, z]
+# as these intervals are open at one end, a value is a pair of an integer
+# and a number of infinitesimal steps above it, (2, -1) lies just below 2
+# the pairs compare lexicographically, which is how the values compare for
+# a small enough step, so every run found has a run over the reals
+# every visited node is reachable, but a node that is not visited within
+# the budget can still be reachable
+class Simulator:
+    def __init__(self, automaton, budget=10000, strict_bounds=False):
+        self.automaton: Automaton = automaton
+
+        # the maximal number of states, pairs of node and value, to explore
+        self.budget = budget
+
+        self.lower_bound = automaton.get_lower_bound()
+        self.upper_bound = automaton.get_upper_bound()
+
+        # whether the counter must stay strictly within the bounds of the
+        # automaton, as in the formula, rather than also take the bounds
+        # themselves, as in the interval analysis
+        self.strict_bounds = strict_bounds
+
+        # the nodes visited by some run
+        self.reached: Set[str] = set()
+
+        # the number of states visited within each node
+        self.visits: Dict[str, int] = dict()
+
+        # the nodes whose reachability the caller is interested in
+        # if None, the exploration only stops when the budget is spent or
+        # no new states are found
+        self.targets: Set[str] = None
+
+        # the number of states explored so far
+        self.explored = 0
+
+    def set_targets(self, targets):
+        self.targets = set(targets)
+
+    def get_reached_nodes(self) -> Set[str]:
+        return self.reached
+
+    def is_reachable(self, node) -> bool:
+        return node in self.reached
+
+    def get_visit_counts(self) -> Dict[str, int]:
+        return self.visits
+
+    def visit(self, node):
+        self.reached.add(node)
+        self.visits[node] = self.visits.get(node, 0) + 1
+
+    # explore the states breadth first, so that short runs come first
+    def run(self) -> Set[str]:
+        initial = self.automaton.get_initial_node()
+        value = (self.automaton.get_initial_value(), 0)
+        if not self.is_allowed(initial, value):
+            return self.reached
+
+        visited: Set[Tuple[str, Value]] = {(initial, value)}
+        queue: Deque[Tuple[str, Value]] = deque(visited)
+        self.visit(initial)
+
+        while queue and self.explored < self.budget:
+            if self.targets is not None and self.targets <= self.reached:
+                break
+
+            node, value = queue.popleft()
+            self.explored += 1
+
+            outgoing = self.automaton.get_outgoing_edges(node)
+            for end, edge in outgoing.items():
+                if self.automaton.is_invisible(end):
+                    continue
+
+                for successor in self.get_successors(value, edge, end):
+                    if (end, successor) in visited:
+                        continue
+                    visited.add((end, successor))
+                    queue.append((end, successor))
+                    self.visit(end)
+
+        return self.reached
+
+    # check whether the counter can hold the value within the node
+    def is_allowed(self, node, value) -> bool:
+        if not self.is_in_bounds(value):
+            return False
+
+        condition = self.automaton.get_node_condition(node)
+        if condition is None:
+            return True
+
+        # a parameter can not be decided by a concrete run
+        bound = condition.get_value()
+        if type(bound) is not int:
+            return False
+        return self.satisfies(condition.get_operation(), value, bound)
+
+    def is_in_bounds(self, value) -> bool:
+        if self.strict_bounds:
+            return (self.lower_bound, 0) < value < (self.upper_bound, 0)
+        return (self.lower_bound, 0) <= value <= (self.upper_bound, 0)
+
+    @staticmethod
+    def satisfies(operation, value, bound) -> bool:
+        if operation == "<=":
+            return value <= (bound, 0)
+        if operation == ">=":
+            return value >= (bound, 0)
+        return value == (bound, 0)
+
+    # pick the values worth exploring after taking the edge from the given
+    # value, these are the furthest value the edge allows, the value one
+    # step away and every value within reach at which the end node or the
+    # automaton puts a bound, with strict bounds the automaton bounds are
+    # replaced by the values one step within them
+    def get_successors(self, value, edge, end) -> List[Value]:
+        operation = edge.get_operation()
+        shift = 0 if operation is None else operation.get_value()
+
+        # a parameter can not be decided by a concrete run
+        if type(shift) is not int:
+            return list()
+
+        number, steps = value
+        if shift == 0:
+            candidates = {value}
+        elif shift > 0:
+            furthest = (number + shift, steps)
+            candidates = {furthest, (number, steps + 1)}
+            for bound in self.get_bounds(end):
+                if value < bound <= furthest:
+                    candidates.add(bound)
+        else:
+            furthest = (number + shift, steps)
+            candidates = {furthest, (number, steps - 1)}
+            for bound in self.get_bounds(end):
+                if furthest <= bound < value:
+                    candidates.add(bound)
+
+        return sorted(candidate for candidate in candidates
+                      if self.is_allowed(end, candidate))
+
+    def get_bounds(self, node) -> List[Value]:
+        bounds = list()
+        steps = 1 if self.strict_bounds else 0
+        if self.lower_bound != -float('inf'):
+            bounds.append((int(self.lower_bound), steps))
+        if self.upper_bound != float('inf'):
+            bounds.append((int(self.upper_bound), -steps))
+
+        condition = self.automaton.get_node_condition(node)
+        if condition is not None and type(condition.get_value()) is int:
+            bounds.append((condition.get_value(), 0))
+        return bounds
+
+
+# the vectorised simulator requires numpy, its random runs are drawn from
+# the given seed so that its results can be reproduced
+def create_simulator(automaton, budget, kind="breadth-first",
+                     strict_bounds=False, random_seed=0):
+    if kind == "vectorised":
+        # imported here so that numpy is only needed when it is used
+        from Reach.VectorSimulator import VectorSimulator
+        return VectorSimulator(automaton, budget, random_seed=random_seed,
+                               strict_bounds=strict_bounds)
+    if kind != "breadth-first":
+        raise ValueError("unknown simulator {}".format(kind))
+    return Simulator(automaton, budget, strict_bounds)
@@ -0,0 +1,121 @@
+import operator
+
+from typing import Dict
+
+from Automaton.Automaton import Automaton
+from Automaton.Expression import Expression
+
+from Reach.Intervals import Intervals
+from Reach.ReachManager import ReachManager
+from Reach.Transfer import Transfer
+
+
+class SummaryManager:
+    def __init__(self, automaton, collapsed=False, max_fragments=None):
+        self.automaton: Automaton = automaton
+
+        self.upper_bound = automaton.get_upper_bound()
+        self.lower_bound = automaton.get_lower_bound()
+
+        self.collapsed = collapsed
+        self.max_fragments = max_fragments
+
+        # the automaton with all edges reversed and all operations negated
+        # a reach within this automaton holds the values from which
+        # the initial node of the reversed automaton can be reached
+        self.reversed: Automaton = self.build_reversed_automaton()
+
+        # map every target to the initial values from which it is reachable
+        # these only depend on the bounds of the automaton, so any initial
+        # value can be checked against them
+        # as the loop acceleration includes the bound it accelerates to,
+        # an initial value on a bound can be reported reachable while it is
+        # not, all other initial values match the result of a ReachManager
+        self.summaries: Dict[str, Intervals] = dict()
+
+    def build_reversed_automaton(self) -> Automaton:
+        reversed_automaton = Automaton(self.automaton.name,
+                                       self.lower_bound, self.upper_bound)
+
+        for node_name in self.automaton.get_visible_nodes():
+            node = self.automaton.get_node(node_name)
+            reversed_automaton.create_new_node(node_name)
+            reversed_automaton.add_label_to_node(node_name, node.get_label())
+            reversed_automaton.add_condition_to_node(node_name,
+                                                     node.get_condition())
+
+        for start in self.automaton.get_visible_nodes():
+            for end, edge in self.automaton.get_outgoing_edges(start).items():
+                if self.automaton.is_invisible(end):
+                    continue
+                reversed_automaton.create_new_edge(end, start)
+                reversed_automaton.add_operation_to_edge(
+                    end, start, self.negate(edge.get_operation()))
+
+        return reversed_automaton
+
+    @staticmethod
+    def negate(operation):
+        if operation is None:
+            return None
+        value = operation.get_value()
+        if value > 0:
+            return Expression(operator.sub, value)
+        else:
+            return Expression(operator.add, -value)
+
+    def get_summary(self, target) -> Intervals:
+        if target not in self.summaries:
+            self.summaries[target] = self.compute_summary(target)
+        return self.summaries[target]
+
+    def is_reachable(self, target, initial_value) -> bool:
+        return self.get_summary(target).contains(initial_value)
+
+    # the initial values within the given intervals from which the target
+    # is reachable
+    def get_reachable_part(self, target, initial_values) -> Intervals:
+        return initial_values.intersect(self.get_summary(target))
+
+    def is_reachable_from(self, target, initial_values) -> bool:
+        return not self.get_reachable_part(target,
+                                           initial_values).is_empty()
+
+    def compute_summary(self, target) -> Intervals:
+        initial = self.automaton.get_initial_node()
+        summary = Intervals(self.lower_bound, True,
+                            self.upper_bound, True)
+        if target == initial:
+            return summary
+
+        # find the values in each node from which the target is reachable
+        self.reversed.set_initial_node(target)
+        self.reversed.initialize_loops()
+        manager = ReachManager(self.reversed, collapsed=self.collapsed,
+                               max_fragments=self.max_fragments,
+                               initial_intervals=summary)
+        while not manager.is_finished():
+            manager.update_automaton()
+
+        # the initial value is not restricted by the condition of the
+        # initial node, so take the final step back manually
+        summary = Intervals()
+        outgoing_edges = self.automaton.get_outgoing_edges(initial)
+        for successor, edge in outgoing_edges.items():
+            reach = manager.get_reach(successor)
+            if reach is None:
+                continue
+
+            operation = edge.get_operation()
+            shift = 0
+            if operation is not None:
+                shift = -operation.get_value()
+            transfer = Transfer(successor, shift)
+
+            for origin in reach.get_preceding_nodes():
+                values = reach.get_reachable_set(origin)
+                summary.union(transfer.apply(values))
+
+        summary.rescale_reach(self.lower_bound, self.upper_bound)
+        summary.remove_inconsistencies()
+        return summary
@@ -0,0 +1,53 @@
+from Reach.Interval import Interval
+from Reach.Intervals import Intervals
+
+
+class Transfer:
+    __slots__ = ("origin", "shift", "key")
+
+    def __init__(self, origin, shift, key=None):
+        # the node at the start of the edge
+        self.origin = origin
+
+        # the value of the operation on the edge, 0 if there is none
+        self.shift = shift
+
+        # the origin under which the result is tracked in the reach of the
+        # end node, by default this is the start of the edge
+        if key is None:
+            key = origin
+        self.key = key
+
+    def get_origin(self):
+        return self.origin
+
+    def get_key(self):
+        return self.key
+
+    # compute the values the counter can take after taking the edge
+    # this equals adding the edge operation to a copy of the intervals,
+    # but builds the result in one pass without copying first
+    def apply(self, intervals) -> Intervals:
+        result = Intervals()
+
+        for interval in intervals.get_intervals():
+            low = interval.get_low_bound()
+            incl_low = interval.is_low_inclusive()
+            high = interval.get_high_bound()
+            incl_high = interval.is_high_inclusive()
+
+            # an increment by z allows any increase in (0, z]
+            # a decrement by z allows any decrease in (0, z]
+            if self.shift > 0:
+                high += self.shift
+                incl_low = False
+            elif self.shift < 0:
+                low += self.shift
+                incl_high = False
+
+            result.get_intervals().append(Interval(low, incl_low,
+                                                   high, incl_high))
+
+        # the shifted sub-intervals can overlap each other
+        result.normalise()
+        return result
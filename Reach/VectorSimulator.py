@@ -0,0 +1,307 @@
+from fractions import Fraction
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
+
+from Automaton.Automaton import Automaton
+
+# the kinds of node conditions, as stored per node
+NO_GUARD = 0
+AT_MOST = 1
+AT_LEAST = 2
+EQUAL = 3
+
+GUARD_KINDS = {"<=": AT_MOST, ">=": AT_LEAST, "=": EQUAL}
+
+
+# follows many random runs of the automaton at once, each step moves every
+# run along a random outgoing edge of its node
+# the counter is continuous as in the interval analysis, an increment by z
+# allows any increase in (0, z] and a decrement by z any decrease in (0, z]
+# a run either takes the whole step, a random part of it, or stops at a
+# bound of the end node within reach, as equality guards are only met there
+# a run that violates a guard or bound starts over from the initial node
+# the values are floats, so a run could exist only by rounding, a node is
+# therefore only reported reachable once a run to it is replayed with
+# exact arithmetic, every reported node is reachable, but a node that is
+# not reported within the budget can still be reachable
+class VectorSimulator:
+    def __init__(self, automaton, budget=10000, trajectories=1024,
+                 random_seed=None, strict_bounds=False):
+        self.automaton: Automaton = automaton
+
+        # the maximal number of states, pairs of node and value, to explore
+        # these are spread over steps of the given number of runs, with
+        # fewer runs for a small budget so that every run takes a few steps
+        self.budget = budget
+        self.trajectories = max(1, min(trajectories, budget // 8))
+
+        self.random = np.random.default_rng(random_seed)
+
+        self.lower_bound = automaton.get_lower_bound()
+        self.upper_bound = automaton.get_upper_bound()
+
+        # whether the counter must stay strictly within the bounds of the
+        # automaton, as in the formula, rather than also take the bounds
+        # themselves, as in the interval analysis
+        self.strict_bounds = strict_bounds
+
+        self.nodes: List[str] = list(automaton.get_visible_nodes().keys())
+        self.node_indexes: Dict[str, int] = \
+            {node: i for i, node in enumerate(self.nodes)}
+
+        # the nodes whose reachability the caller is interested in
+        # if None, the runs only stop when the budget is spent
+        self.targets: Set[str] = None
+
+        # the number of runs that visited each node, by node index
+        self.visits = np.zeros(len(self.nodes), dtype=np.int64)
+
+        # the nodes reached by a run that was replayed exactly
+        self.reached: Set[str] = set()
+
+        # the nodes and values of all runs after each step, and which runs
+        # started over in that step, so that a run can be traced back
+        self.history: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = \
+            list()
+
+        # the number of states explored so far
+        self.explored = 0
+
+        self.initialise_guards()
+        self.initialise_edges()
+
+    # store the condition of every node as kind and value
+    # a parameter can not be decided by a concrete run, so its node is
+    # never entered
+    def initialise_guards(self):
+        self.guard_kinds = np.full(len(self.nodes), NO_GUARD, dtype=np.int8)
+        self.guard_values = np.zeros(len(self.nodes))
+        self.blocked = np.zeros(len(self.nodes), dtype=bool)
+
+        for i, node in enumerate(self.nodes):
+            condition = self.automaton.get_node_condition(node)
+            if condition is None:
+                continue
+            value = condition.get_value()
+            if type(value) is not int:
+                self.blocked[i] = True
+                continue
+            self.guard_kinds[i] = GUARD_KINDS[condition.get_operation()]
+            self.guard_values[i] = value
+
+    # store the outgoing edges of all nodes consecutively, ordered by their
+    # start node, so that the edges of a node can be indexed by an offset
+    # edges with parameters are left out, as are nodes that are never
+    # entered
+    def initialise_edges(self):
+        self.edge_offsets = np.zeros(len(self.nodes), dtype=np.int64)
+        self.edge_counts = np.zeros(len(self.nodes), dtype=np.int64)
+        ends = list()
+        shifts = list()
+
+        for i, node in enumerate(self.nodes):
+            self.edge_offsets[i] = len(ends)
+            outgoing = self.automaton.get_outgoing_edges(node)
+            for end, edge in outgoing.items():
+                if end not in self.node_indexes:
+                    continue
+                if self.blocked[self.node_indexes[end]]:
+                    continue
+
+                operation = edge.get_operation()
+                shift = 0 if operation is None else operation.get_value()
+                if type(shift) is not int:
+                    continue
+
+                ends.append(self.node_indexes[end])
+                shifts.append(shift)
+            self.edge_counts[i] = len(ends) - self.edge_offsets[i]
+
+        self.edge_ends = np.array(ends, dtype=np.int64)
+        self.edge_shifts = np.array(shifts, dtype=float)
+
+        # the exact shift of the edge between two nodes, by node index
+        self.shifts: Dict[Tuple[int, int], int] = dict()
+        for i in range(len(self.nodes)):
+            for k in range(self.edge_offsets[i],
+                           self.edge_offsets[i] + self.edge_counts[i]):
+                self.shifts[(i, int(self.edge_ends[k]))] = shifts[k]
+
+    def set_targets(self, targets):
+        self.targets = {target for target in targets
+                        if target in self.node_indexes}
+
+    def get_reached_nodes(self) -> Set[str]:
+        return self.reached
+
+    def is_reachable(self, node) -> bool:
+        return node in self.reached
+
+    # the number of states within each node that the runs visited, these
+    # are counted before the runs are replayed exactly
+    def get_visit_counts(self) -> Dict[str, int]:
+        return {node: int(self.visits[i]) for i, node in enumerate(self.nodes)}
+
+    def is_allowed(self, nodes, values):
+        if self.strict_bounds:
+            allowed = (values > self.lower_bound) & \
+                (values < self.upper_bound)
+        else:
+            allowed = (values >= self.lower_bound) & \
+                (values <= self.upper_bound)
+
+        kinds = self.guard_kinds[nodes]
+        bounds = self.guard_values[nodes]
+        allowed &= (kinds != AT_MOST) | (values <= bounds)
+        allowed &= (kinds != AT_LEAST) | (values >= bounds)
+        allowed &= (kinds != EQUAL) | (values == bounds)
+        return allowed & ~self.blocked[nodes]
+
+    def run(self) -> Set[str]:
+        initial = self.node_indexes.get(self.automaton.get_initial_node())
+        value = self.automaton.get_initial_value()
+        if initial is None or \
+                not self.is_allowed(np.array([initial]),
+                                    np.array([float(value)]))[0]:
+            return self.get_reached_nodes()
+
+        nodes = np.full(self.trajectories, initial, dtype=np.int64)
+        values = np.full(self.trajectories, float(value))
+        self.visits[initial] += self.trajectories
+        self.explored += self.trajectories
+        self.history.append((nodes, values,
+                             np.ones(self.trajectories, dtype=bool)))
+        self.confirm(nodes)
+
+        # no run can leave the initial node
+        if len(self.edge_ends) == 0:
+            return self.get_reached_nodes()
+
+        while self.explored < self.budget:
+            if self.targets is not None and \
+                    all(self.is_reachable(node) for node in self.targets):
+                break
+
+            # the last step only moves as many runs as the budget allows
+            remaining = self.budget - self.explored
+            if remaining < len(nodes):
+                nodes, values = nodes[:remaining], values[:remaining]
+
+            nodes, values, alive = self.step(nodes, values)
+            self.visits += np.bincount(nodes, minlength=len(self.nodes))
+            self.explored += len(nodes)
+            self.history.append((nodes, values, ~alive))
+            self.confirm(nodes)
+
+        return self.get_reached_nodes()
+
+    # replay a run to every node that the runs entered in the last step but
+    # that is not confirmed yet, one run per node and step
+    def confirm(self, nodes):
+        for index in np.unique(nodes):
+            node = self.nodes[index]
+            if node in self.reached:
+                continue
+            run = int(np.flatnonzero(nodes == index)[0])
+            if self.is_exact(self.trace(run)):
+                self.reached.add(node)
+
+    # the nodes and values of the given run since it last started over
+    def trace(self, run) -> List[Tuple[int, float]]:
+        states = list()
+        for nodes, values, restarted in reversed(self.history):
+            states.append((int(nodes[run]), float(values[run])))
+            if restarted[run]:
+                break
+        states.reverse()
+        return states
+
+    # replay the run with exact arithmetic, every float is a rational number
+    # the float of a whole step can be rounded past the end of the step, so
+    # the replay keeps each value within the step the edge allows and then
+    # checks the guards and bounds on the exact values
+    def is_exact(self, states) -> bool:
+        node, _ = states[0]
+        value = Fraction(self.automaton.get_initial_value())
+        if not self.is_allowed_exactly(node, value):
+            return False
+
+        for end, next_value in states[1:]:
+            shift = self.shifts.get((node, end))
+            if shift is None:
+                return False
+
+            next_value = Fraction(next_value)
+            if shift > 0:
+                next_value = min(next_value, value + shift)
+                if next_value <= value:
+                    return False
+            elif shift < 0:
+                next_value = max(next_value, value + shift)
+                if next_value >= value:
+                    return False
+            else:
+                next_value = value
+
+            if not self.is_allowed_exactly(end, next_value):
+                return False
+            node = end
+            value = next_value
+        return True
+
+    def is_allowed_exactly(self, node, value) -> bool:
+        if self.strict_bounds:
+            if not self.lower_bound < value < self.upper_bound:
+                return False
+        elif not self.lower_bound <= value <= self.upper_bound:
+            return False
+
+        if self.blocked[node]:
+            return False
+        kind = self.guard_kinds[node]
+        bound = int(self.guard_values[node])
+        if kind == AT_MOST:
+            return value <= bound
+        if kind == AT_LEAST:
+            return value >= bound
+        if kind == EQUAL:
+            return value == bound
+        return True
+
+    # move every run along a random outgoing edge of its node
+    def step(self, nodes, values):
+        counts = self.edge_counts[nodes]
+        alive = counts > 0
+
+        # pick an edge per run, runs without outgoing edges take the first
+        # edge and are started over below
+        picks = np.floor(self.random.random(len(nodes)) *
+                         np.maximum(counts, 1)).astype(np.int64)
+        edges = np.where(alive, self.edge_offsets[nodes] + picks, 0)
+        ends = self.edge_ends[edges]
+        shifts = self.edge_shifts[edges]
+
+        # take the whole step, a random part of it in (0, 1], or stop at
+        # the bound of the end node if it lies within reach
+        parts = 1.0 - self.random.random(len(nodes))
+        parts = np.where(self.random.random(len(nodes)) < 0.5, 1.0, parts)
+        moved = values + shifts * parts
+
+        bounds = self.guard_values[ends]
+        low = np.minimum(values, values + shifts)
+        high = np.maximum(values, values + shifts)
+        in_reach = (self.guard_kinds[ends] != NO_GUARD) & (shifts != 0) & \
+            (bounds >= low) & (bounds <= high) & (bounds != values)
+        snap = in_reach & (self.random.random(len(nodes)) < 0.5)
+        moved = np.where(snap, bounds, moved)
+
+        # a part so small that the value does not change is no step
+        alive &= (shifts == 0) | (moved != values)
+        alive &= self.is_allowed(ends, moved)
+
+        # start the other runs over from the initial node
+        initial = self.node_indexes[self.automaton.get_initial_node()]
+        value = float(self.automaton.get_initial_value())
+        return np.where(alive, ends, initial), \
+            np.where(alive, moved, value), alive
@@ -0,0 +1,187 @@
+import argparse
+import operator
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from statistics import median
+
+# the modules main.py loads for each op/method pair once it dispatches
+# c-code and grammar only hand over to the c-dead-code-analyser submodule
+STARTUP_CASES = [
+    ("reachability", "interval", ["Reach.ReachManager"]),
+    ("reachability", "formula", ["Equations.EquationSolver"]),
+    ("full", "interval", ["Reach.ReachManager"]),
+    ("full", "formula", ["Equations.EquationSolver"]),
+    ("c-code", None, []),
+    ("grammar", None, []),
+]
+
+
+def time_interpreter(code, repeats):
+    # time a fresh interpreter so that no module is cached between runs
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    timings = list()
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.check_call([sys.executable, "-c", code], cwd=cwd)
+        timings.append(time.perf_counter() - start)
+    return median(timings)
+
+
+def benchmark_startup(repeats):
+    print("Startup time per op (median of {} runs)".format(repeats))
+
+    baseline = time_interpreter("pass", repeats)
+    print("\t{:<14}{:<10}{:>10.1f} ms".format("interpreter", "",
+                                              baseline * 1000))
+
+    for op, method, modules in STARTUP_CASES:
+        code = "import main"
+        for module in modules:
+            code += "; import {}".format(module)
+
+        duration = time_interpreter(code, repeats)
+        print("\t{:<14}{:<10}{:>10.1f} ms".format(op, method or "",
+                                                  duration * 1000))
+
+
+def create_chain_automaton(nr_of_nodes, with_edges=True):
+    from Automaton.Automaton import Automaton
+    from Automaton.Expression import Expression
+
+    automaton = Automaton("chain", -200000, 200000)
+    for i in range(nr_of_nodes):
+        automaton.create_new_node("Q{}".format(i))
+        automaton.add_label_to_node("Q{}".format(i), str(i))
+    automaton.set_initial_node("Q0")
+
+    if not with_edges:
+        return automaton
+
+    for i in range(nr_of_nodes - 1):
+        start = "Q{}".format(i)
+        end = "Q{}".format(i + 1)
+        automaton.create_new_edge(start, end)
+        automaton.add_operation_to_edge(start, end,
+                                        Expression(operator.add, 1))
+    return automaton
+
+
+def measure_allocation(create):
+    # the memory that remains allocated for the created objects
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    created = create()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return created, after - before
+
+
+def benchmark_memory(nr_of_nodes):
+    from Reach.ReachManager import ReachManager
+
+    print("Memory footprint of a chain of {} nodes".format(nr_of_nodes))
+
+    _, nodes = measure_allocation(
+        lambda: create_chain_automaton(nr_of_nodes, False))
+    automaton, total = measure_allocation(
+        lambda: create_chain_automaton(nr_of_nodes))
+    _, manager = measure_allocation(lambda: ReachManager(automaton))
+
+    print("\t{:<14}{:>10.1f} bytes".format("per node", nodes / nr_of_nodes))
+    print("\t{:<14}{:>10.1f} bytes".format("per edge", (total - nodes) /
+                                           (nr_of_nodes - 1)))
+    print("\t{:<14}{:>10.1f} bytes".format("per reach",
+                                           manager / nr_of_nodes))
+
+
+def encode_formula(automaton, encoding):
+    from Equations.EquationSolver import EquationSolver
+
+    solver = EquationSolver(automaton, encoding=encoding)
+    solver.build_transitions()
+    solver.build_node_conditions()
+    solver.build_intervals()
+    solver.analyse_loops()
+    solver.add_successor_condition()
+    solver.add_reachability_condition()
+
+    # the text encoding only hands its constraints to z3 when the solver is
+    # first used, which is part of its encoding time
+    if encoding == "smtlib":
+        solver.s.flush()
+
+
+def benchmark_encoding(nr_of_nodes, repeats):
+    print("Formula encoding time of a chain of {} nodes (median of {} runs)"
+          .format(nr_of_nodes, repeats))
+
+    automaton = create_chain_automaton(nr_of_nodes)
+    for encoding in ["z3", "smtlib"]:
+        timings = list()
+        for _ in range(repeats):
+            start = time.perf_counter()
+            encode_formula(automaton, encoding)
+            timings.append(time.perf_counter() - start)
+        print("\t{:<14}{:>10.1f} ms".format(encoding,
+                                            median(timings) * 1000))
+
+
+# count the operator applications of a term given as SMT-LIB text
+def count_terms(term):
+    return str(term).count("(")
+
+
+def benchmark_terms(nr_of_nodes):
+    from Automaton.Automaton import Automaton
+    from Equations.EquationSolver import EquationSolver
+
+    print("Formula size in operator applications")
+
+    solver = EquationSolver(Automaton("terms", -10, 10), encoding="smtlib")
+    x = solver.encoder.Vector("x", 4)
+    y = solver.encoder.Vector("y", 4)
+    z = solver.encoder.Vector("z", 4)
+    operations = [
+        ("overlaps", solver.overlaps(x, y)),
+        ("no_overlaps", solver.no_overlaps(x, y)),
+        ("intersect_vec", solver.intersect_vec(x, y, z)),
+        ("union_vec", solver.union_vec(x, y, z)),
+    ]
+    for name, term in operations:
+        print("\t{:<14}{:>10}".format(name, count_terms(term)))
+
+    solver = EquationSolver(create_chain_automaton(nr_of_nodes),
+                            encoding="smtlib")
+    solver.build_formula()
+    print("\t{:<14}{:>10}".format("chain of {}".format(nr_of_nodes),
+                                  count_terms(solver.s.buffer.getvalue())))
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Benchmark the different '
+                                                 'stages of the reachability '
+                                                 'analysis.')
+    parser.add_argument('--repeats', type=int, default=5,
+                        help='The number of runs per measurement (default 5)')
+    parser.add_argument('--nodes', type=int, default=20000,
+                        help='The number of nodes of the automaton used to '
+                             'measure the memory footprint (default 20 000)')
+    parser.add_argument('--formula-nodes', type=int, default=8,
+                        help='The number of nodes of the automaton used to '
+                             'measure the formula encoding time (default 8)')
+    parser.add_argument('--terms-nodes', type=int, default=4,
+                        help='The number of nodes of the automaton used to '
+                             'count the terms of the formula (default 4)')
+    return vars(parser.parse_args())
+
+
+if __name__ == '__main__':
+    args = parse_arguments()
+    benchmark_startup(args['repeats'])
+    benchmark_memory(args['nodes'])
+    benchmark_encoding(args['formula_nodes'], args['repeats'])
+    benchmark_terms(args['terms_nodes'])
@@ -1,15 +1,25 @@
 import argparse
+import importlib.util
+import json
 import subprocess
 import os
 import shutil
+import sys
 
-from typing import Dict
+from contextlib import redirect_stdout
+from itertools import product
+from typing import Dict, List, Tuple
 
 from Automaton.DotReader import DotReader
+from Automaton.Slicer import Slicer
+from Automaton.Simplifier import Simplifier
 
-from Reach.ReachManager import ReachManager
+from Analysis.VerdictWriter import VerdictWriter
+from Analysis.BatchAnalyser import BatchAnalyser
 
-from Equations.EquationSolver import EquationSolver
+# the stream to which machine-readable verdicts are written
+# this is the real stdout, even while other output is redirected
+verdict_stream = sys.stdout
 
 
 def grammar():
@@ -18,7 +28,7 @@ def grammar():
 
     command = ["python", "./Compiler.py",
                "grammar", grammar_file]
-    subprocess.call(command, env=os.environ, cwd=cwd)
+    subprocess.call(command, env=os.environ, cwd=cwd, stdout=sys.stdout)
 
 
 def find_correct_path(path):
@@ -58,7 +68,7 @@ def analyze_code():
     command = ["python", "./Compiler.py",
                "analysis", code_file,
                bool2str(args["trace"]), bool2str(args["image"])]
-    subprocess.call(command, env=os.environ, cwd=cwd)
+    subprocess.call(command, env=os.environ, cwd=cwd, stdout=sys.stdout)
 
     # copy the generated file to the reachability input dir
     # track the copied files as those are relevant
@@ -76,7 +86,7 @@ def analyze_code():
     return generated_files
 
 
-def analyze_reachability_with_interval(dot_file):
+def load_automaton(dot_file):
     reader = DotReader(dot_file)
 
     automaton = reader.create_automaton()
@@ -88,54 +98,277 @@ def analyze_reachability_with_interval(dot_file):
     automaton.set_upper_bound(args['high'])
     automaton.set_initial_value(args['start'])
 
-    manager = ReachManager(automaton)
+    return automaton
+
+
+# the visible Q nodes represent the lines of code
+# these are the only nodes of which the reachability matters
+def get_targets(automaton):
+    return [node for node in automaton.get_visible_nodes() if node[0] == "Q"]
+
+
+# drop the nodes that can not influence the reachability of the targets
+def slice_automaton(automaton, targets):
+    if not args['slice']:
+        return automaton
+
+    sliced = Slicer(automaton).slice(targets)
+
+    if args['debug']:
+        print("Sliced the automaton from {} to {} nodes".format(
+            automaton.get_nr_of_nodes(), sliced.get_nr_of_nodes()))
+
+    return sliced
+
+
+# merge chains of nodes that do not restrict the counter
+def simplify_automaton(automaton, targets):
+    if not args['simplify']:
+        return automaton, None
+
+    simplifier = Simplifier(automaton, targets)
+    simplified = simplifier.simplify()
+
+    if args['debug']:
+        print("Simplified the automaton from {} to {} nodes".format(
+            automaton.get_nr_of_nodes(), simplified.get_nr_of_nodes()))
+
+    return simplified, simplifier
+
+
+# get the node of the analysed automaton that decides the reachability of
+# the given node, None if the node got sliced away
+def get_analysed_node(analysed, simplifier, node):
+    if simplifier is not None:
+        node = simplifier.get_representative(node)
+    if node is None or not analysed.node_exists(node):
+        return None
+    return node
+
+
+def get_original_nodes(simplifier, node):
+    if simplifier is not None:
+        return simplifier.get_represented_nodes(node)
+    return [node]
+
+
+# run short concrete runs first, the nodes these reach are reachable
+# whatever the analysis would find, so only the others are left to it
+def simulate(analysed, targets):
+    if args['simulation_budget'] <= 0:
+        return set()
+
+    # imported here so that the other ops and methods do not pay for it
+    from Reach.Simulator import create_simulator
+
+    # the formula excludes the bounds of the automaton, the simulation
+    # must not reach a node only by taking these
+    simulator = create_simulator(analysed, args['simulation_budget'],
+                                 args['simulator'],
+                                 args['method'] == 'formula',
+                                 args['simulation_seed'])
+
+    simulator.set_targets(target for target in targets if target is not None)
+    reached = simulator.run()
+
+    if args['debug']:
+        print("The simulation reached {} nodes in {} states".format(
+            len(reached), simulator.explored))
+        for node, visits in simulator.get_visit_counts().items():
+            print("\t{}: {}".format(node, visits))
+
+    return reached
+
+
+def report_simulated(simulated, simplifier, writer):
+    if writer is None:
+        return
+    for node in simulated:
+        for original in get_original_nodes(simplifier, node):
+            writer.node_reachable(original)
+
+
+def analyze_reachability_with_interval(dot_file):
+    # imported here so that the other ops and methods do not pay for it
+    from Reach.ReachManager import ReachManager
+
+    automaton = load_automaton(dot_file)
+    targets = get_targets(automaton)
+    analysed = slice_automaton(automaton, targets)
+    analysed, simplifier = simplify_automaton(analysed, targets)
+
+    writer = create_verdict_writer(dot_file, automaton)
+
+    analysed_targets = [get_analysed_node(analysed, simplifier, target)
+                        for target in targets]
+    simulated = simulate(analysed, analysed_targets)
+    report_simulated(simulated, simplifier, writer)
+
+    manager = ReachManager(analysed, collapsed=args['collapsed'],
+                           max_fragments=args['max_fragments'])
     manager.set_debug(args['debug'])
 
+    # only the lines of code matter, stop as soon as they are decided
+    manager.set_targets([target for target in analysed_targets
+                         if target not in simulated])
+
     while not manager.is_finished():
         manager.update_automaton()
 
-    fully_reachable = True
-    not_reachable = list()
-    is_reachable = list()
+        # reach sets only grow, so a line that is reachable now stays
+        # reachable and can be reported before the analysis finishes
+        if writer is not None:
+            for node in manager.get_reached_targets():
+                for original in get_original_nodes(simplifier, node):
+                    writer.node_reachable(original)
 
-    for node in automaton.get_nodes():
-        if automaton.is_invisible(node):
-            continue
-        if node[0] != "Q":
-            continue
-        node_obj = automaton.get_node(node)
-        label = node_obj.get_label().split(".")[0]
-        if not manager.is_reachable(node) and label not in is_reachable:
-            fully_reachable = False
-            if label not in not_reachable:
-                not_reachable.append(label)
-                print('Line {} was found to be not '
-                      'reachable.'.format(label))
-        else:
-            if label not in is_reachable:
-                is_reachable.append(label)
+    def is_reachable(node):
+        node = get_analysed_node(analysed, simplifier, node)
+        return node is not None and \
+            (node in simulated or manager.is_reachable(node))
 
-    return fully_reachable
+    return report_verdicts(automaton, is_reachable, writer)
 
 
 def analyze_reachability_with_formula(dot_file):
-    reader = DotReader(dot_file)
+    # the solver stack pulls in z3, only load it when formula mode is used
+    from Equations.EquationSolver import EquationSolver
+
+    automaton = load_automaton(dot_file)
+    targets = get_targets(automaton)
+    analysed = slice_automaton(automaton, targets)
+    analysed, simplifier = simplify_automaton(analysed, targets)
+
+    writer = create_verdict_writer(dot_file, automaton)
+
+    analysed_targets = [get_analysed_node(analysed, simplifier, target)
+                        for target in targets]
+    simulated = simulate(analysed, analysed_targets)
+
+    def on_reachable(node):
+        if writer is not None:
+            for original in get_original_nodes(simplifier, node):
+                writer.node_reachable(original)
+
+    try:
+        solver = EquationSolver(
+            analysed, args['debug'], encoding=args['encoding'],
+            solvers=args['solvers'], disjunctive=args['disjunctive'],
+            real=args['real'], booleans=args['booleans'], seed=args['seed'],
+            bounded_steps=args['bounded_steps'])
+    except ValueError as error:
+        print("Error: {}".format(error))
+        exit(-1)
+
+    if args['dump_formula'] is not None:
+        solver.dump_formula(args['dump_formula'])
+
+    # the formula is only needed if the simulation left a line undecided
+    if all(target is None or target in simulated
+           for target in analysed_targets):
+        report_simulated(simulated, simplifier, writer)
+        reachable_nodes = simulated
+    else:
+        reachable_nodes = solver.analyse(on_reachable, simulated)
+
+    def is_reachable(node):
+        node = get_analysed_node(analysed, simplifier, node)
+        return node is not None and node in reachable_nodes
+
+    return report_verdicts(automaton, is_reachable, writer)
+
 
+# analyse the automaton for every requested configuration at once
+def analyze_reachability_in_batch(dot_file):
+    reader = DotReader(dot_file)
     automaton = reader.create_automaton()
 
     if args['debug']:
         print(automaton)
 
-    automaton.set_lower_bound(args['low'])
-    automaton.set_upper_bound(args['high'])
-    automaton.set_initial_value(args['start'])
+    analyser = BatchAnalyser(
+        automaton, method=args['method'], slice=args['slice'],
+        simplify=args['simplify'], collapsed=args['collapsed'],
+        max_fragments=args['max_fragments'], summaries=args['summaries'],
+        encoding=args['encoding'], solvers=args['solvers'],
+        disjunctive=args['disjunctive'], real=args['real'],
+        booleans=args['booleans'], seed=args['seed'],
+        simulation_budget=args['simulation_budget'],
+        simulator=args['simulator'], simulation_seed=args['simulation_seed'],
+        bounded_steps=args['bounded_steps'])
+    table = analyser.analyse(args['configurations'])
+
+    if args['output'] == 'jsonl':
+        report_batch_verdicts_as_jsonl(dot_file, automaton, table)
+    else:
+        report_batch_verdicts(analyser.get_lines(), table)
+
+    return all(all(verdicts.values()) for verdicts in table.values())
+
+
+def report_batch_verdicts(lines, table):
+    header = "{:<8}".format("Line")
+    for start, low, high in table:
+        header += "{:>20}".format("{}:{}:{}".format(start, low, high))
+    print(header)
+
+    for line in lines:
+        row = "{:<8}".format(line)
+        for configuration in table:
+            reachable = table[configuration][line]
+            row += "{:>20}".format("reachable" if reachable else "-")
+        print(row)
+
+
+def report_batch_verdicts_as_jsonl(dot_file, automaton, table):
+    code_file, function = split_automaton_file_name(dot_file)
+    if function is None:
+        function = automaton.name
+
+    for (start, low, high), verdicts in table.items():
+        for line, reachable in verdicts.items():
+            verdict_stream.write(json.dumps({
+                "file": code_file,
+                "function": function,
+                "start": start,
+                "low": low,
+                "high": high,
+                "line": line,
+                "reachable": reachable
+            }) + "\n")
+    verdict_stream.flush()
+
+
+def analyze_reachability(dot_file):
+    if args['configurations'] is not None:
+        return analyze_reachability_in_batch(dot_file)
+    if args['method'] == 'interval':
+        return analyze_reachability_with_interval(dot_file)
+    return analyze_reachability_with_formula(dot_file)
+
 
-    solver = EquationSolver(automaton, args['debug'])
-    reachable_nodes = solver.analyse()
+def create_verdict_writer(dot_file, automaton):
+    if args['output'] != 'jsonl':
+        return None
+
+    code_file, function = split_automaton_file_name(dot_file)
+    if function is None:
+        function = automaton.name
+
+    return VerdictWriter(verdict_stream, automaton, code_file, function)
+
+
+def report_verdicts(automaton, is_reachable, writer):
+    if writer is not None:
+        for node in writer.get_undecided_nodes():
+            if is_reachable(node):
+                writer.node_reachable(node)
+        writer.finish()
+        return writer.is_fully_reachable()
 
     fully_reachable = True
     not_reachable = list()
-    is_reachable = list()
+    is_reachable_lines = list()
 
     for node in automaton.get_nodes():
         if automaton.is_invisible(node):
@@ -144,19 +377,73 @@ def analyze_reachability_with_formula(dot_file):
             continue
         node_obj = automaton.get_node(node)
         label = node_obj.get_label().split(".")[0]
-        if node not in reachable_nodes and label not in is_reachable:
+        if not is_reachable(node) and label not in is_reachable_lines:
             fully_reachable = False
             if label not in not_reachable:
                 not_reachable.append(label)
                 print('Line {} was found to be not '
                       'reachable.'.format(label))
         else:
-            if label not in is_reachable:
-                is_reachable.append(label)
+            if label not in is_reachable_lines:
+                is_reachable_lines.append(label)
 
     return fully_reachable
 
 
+# split the name of a generated automaton file of the form
+# <code file>_reachability_automaton_<function>.dot into its code file
+# and function, files that do not follow this format are returned as is
+def split_automaton_file_name(file_name):
+    tokens = file_name.split("_")
+    if "reachability" not in tokens:
+        return file_name, None
+
+    code_file = ""
+    # retrieve the code file name
+    while tokens[0] != "reachability":
+        code_file += "{}_".format(tokens.pop(0))
+    if "/" in code_file:
+        sep = "/"
+    else:
+        sep = "\\"
+    code_file = code_file.split("automaton-input" + sep)[-1]
+    code_file = code_file[:-1]
+
+    # pop the tokens 'reachability' and 'automaton'
+    tokens.pop(0)
+    tokens.pop(0)
+
+    # retrieve the function name
+    function = "_".join(tokens).split(".dot")[0]
+
+    return code_file, function
+
+
+# expand comma separated configurations of the form start:low:high into
+# (start, low, high) tuples, each field can also be a range first..last,
+# in which case every combination of the values of the fields is taken
+def parse_configurations(configurations) -> List[Tuple[int, int, int]]:
+    result = list()
+    for configuration in configurations.split(","):
+        fields = configuration.split(":")
+        if len(fields) != 3:
+            raise ValueError("configuration {} is not of the form "
+                             "start:low:high".format(configuration))
+
+        values = list()
+        for field in fields:
+            if ".." in field:
+                first, last = field.split("..")
+                values.append(range(int(first), int(last) + 1))
+            else:
+                values.append([int(field)])
+
+        for start, low, high in product(*values):
+            if (start, low, high) not in result:
+                result.append((start, low, high))
+    return result
+
+
 def str2bool(v):
     if isinstance(v, bool):
         return v
@@ -175,95 +462,241 @@ def bool2str(b):
         return 'false'
 
 
-parser = argparse.ArgumentParser(description='Process to analyze reachability '
-                                             'of lines of c code.')
-parser.add_argument('input', type=str,
-                    help='.dot file in case reach is the desired op, c file in'
-                         ' case c code or full is the desired op, g4 '
-                         'file in case grammar is the desired op')
-parser.add_argument('op', default='c-code',
-                    help="select the desired operation out of {'reachability',"
-                         " 'c-code', 'full', 'grammar'}")
-parser.add_argument('--start', type=int, default=0,
-                    help='The initial value for the counter (default 0)')
-parser.add_argument('--low', type=int, default=-200000,
-                    help='The lower bound for the counter (default -200 000)')
-parser.add_argument('--high', type=int, default=200000,
-                    help='The upper bound for the counter (default 200 000)')
-parser.add_argument('--debug', type=str2bool, default=False,
-                    help='The debug mode adds additional output when '
-                         'running the tool (default False)')
-parser.add_argument('--trace', type=str2bool, default=False,
-                    help='Enable debug for the c code to '
-                         'automaton implementation')
-parser.add_argument('--image', type=str2bool, default=False,
-                    help='Output all images representing the generated '
-                         'automata (default false)')
-parser.add_argument('--method', type=str, default='interval',
-                    help='Select the method desired to analyse reachability. '
-                         'Method must be either interval or formula '
-                         '(default interval)')
-args = vars(parser.parse_args())
-
-if args['op'] not in ['reachability', 'c-code', 'full', 'grammar']:
-    print("Error: op must be in ['reachability', 'c-code', "
-          "'full', 'grammar'] but is {}".format(args['op']))
-    exit(-1)
-
-if 'method' in args and args['method'] not in ['interval', 'formula']:
-    print("Error: method must be in ['interval', 'formula'] but is {}"
-          .format(args['method']))
-    exit(-1)
-
-if args['op'] == "grammar":
-    grammar()
-
-if args['op'] == "reachability":
-    if args['method'] == 'interval':
-        analyze_reachability_with_interval(args["input"])
-    if args['method'] == 'formula':
-        analyze_reachability_with_formula(args["input"])
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Process to analyze '
+                                                 'reachability of lines of '
+                                                 'c code.')
+    parser.add_argument('input', type=str,
+                        help='.dot file in case reach is the desired op, c '
+                             'file in case c code or full is the desired op, '
+                             'g4 file in case grammar is the desired op')
+    parser.add_argument('op', default='c-code',
+                        help="select the desired operation out of "
+                             "{'reachability', 'c-code', 'full', 'grammar'}")
+    parser.add_argument('--start', type=int, default=0,
+                        help='The initial value for the counter (default 0)')
+    parser.add_argument('--low', type=int, default=-200000,
+                        help='The lower bound for the counter '
+                             '(default -200 000)')
+    parser.add_argument('--high', type=int, default=200000,
+                        help='The upper bound for the counter '
+                             '(default 200 000)')
+    parser.add_argument('--debug', type=str2bool, default=False,
+                        help='The debug mode adds additional output when '
+                             'running the tool (default False)')
+    parser.add_argument('--trace', type=str2bool, default=False,
+                        help='Enable debug for the c code to '
+                             'automaton implementation')
+    parser.add_argument('--image', type=str2bool, default=False,
+                        help='Output all images representing the generated '
+                             'automata (default false)')
+    parser.add_argument('--method', type=str, default='interval',
+                        help='Select the method desired to analyse '
+                             'reachability. Method must be either interval '
+                             'or formula (default interval)')
+    parser.add_argument('--output', type=str, default='text',
+                        help='Select the output format. Either text or jsonl, '
+                             'the latter writes one JSON object per line '
+                             'verdict to stdout as soon as it is known '
+                             '(default text)')
+    parser.add_argument('--slice', type=str2bool, default=True,
+                        help='Only analyse the nodes that lie on a path from '
+                             'the initial node to a line of code '
+                             '(default True)')
+    parser.add_argument('--simplify', type=str2bool, default=False,
+                        help='Merge chains of unguarded nodes and fold edges '
+                             'that leave the counter unchanged before the '
+                             'analysis (default False)')
+    parser.add_argument('--collapsed', type=str2bool, default=True,
+                        help='Join the reaches of all origins of a node into '
+                             'a single set, only loops keep a set per origin '
+                             'for their acceleration (default True)')
+    parser.add_argument('--max-fragments', type=int, default=None,
+                        help='The maximal number of disjoint intervals '
+                             'tracked per reach, the closest intervals are '
+                             'merged beyond this, which may cause unreachable '
+                             'lines to be reported as reachable '
+                             '(default unbounded)')
+    parser.add_argument('--configurations', type=str, default=None,
+                        help='Analyse several comma separated configurations '
+                             'at once, each of the form start:low:high, '
+                             'where every field can be a range first..last '
+                             'to analyse all combinations. This overrides '
+                             '--start, --low and --high and prints a verdict '
+                             'per line and configuration. Use '
+                             '--configurations=... if the first value is '
+                             'negative')
+    parser.add_argument('--summaries', type=str2bool, default=False,
+                        help='Answer the configurations sharing their bounds '
+                             'from the initial values each line is '
+                             'reachable from, found by a single backward '
+                             'analysis per line. Only applies to the '
+                             'interval method with --configurations. '
+                             'An initial value on a bound can be reported '
+                             'reachable while it is not (default False)')
+    parser.add_argument('--encoding', type=str, default='z3',
+                        help='How the formula method builds its constraints, '
+                             'either z3 to build z3 expressions or smtlib '
+                             'to write SMT-LIB text that is parsed at once '
+                             '(default z3)')
+    parser.add_argument('--solvers', type=str, default=None,
+                        help='Solve the formula with external solver '
+                             'processes rather than with z3 in this process, '
+                             'given as comma separated list of z3, cvc5 and '
+                             'yices. With several solvers these race and the '
+                             'first answer is used. This implies the smtlib '
+                             'encoding (default none)')
+    parser.add_argument('--dump-formula', type=str, default=None,
+                        help='Write the formula of the formula method to the '
+                             'given file as SMT-LIB2 script')
+    parser.add_argument('--disjunctive', type=str2bool, default=False,
+                        help='Let the formula method ask whether any of the '
+                             'unchecked nodes is reachable at once instead '
+                             'of checking each node separately, every model '
+                             'marks all nodes it reaches (default False)')
+    parser.add_argument('--real', type=str2bool, default=False,
+                        help='Let the formula method use real rather than '
+                             'integer variables, which keeps the formula '
+                             'within linear real arithmetic (default False)')
+    parser.add_argument('--booleans', type=str2bool, default=False,
+                        help='Let the formula method encode the inclusivity '
+                             'flags, the used edges and the reachability of '
+                             'the nodes as booleans rather than integers '
+                             '(default False)')
+    parser.add_argument('--seed', type=str2bool, default=False,
+                        help='Run the interval method before the formula '
+                             'method, the nodes it proves unreachable are not '
+                             'queried and the formula is restricted to the '
+                             'values it found for the other nodes. This is '
+                             'skipped for automata with parameters '
+                             '(default False)')
+    parser.add_argument('--simulation-budget', type=int, default=0,
+                        help='Explore up to this many pairs of node and '
+                             'counter value by concrete runs before the '
+                             'analysis, the lines these reach are reported '
+                             'reachable right away and are left out of the '
+                             'analysis (default 0, no simulation)')
+    parser.add_argument('--simulator', type=str, default='breadth-first',
+                        help='How the simulation explores the runs, either '
+                             'breadth-first to explore the shortest runs '
+                             'first or vectorised to follow many random runs '
+                             'at once with numpy (default breadth-first)')
+    parser.add_argument('--simulation-seed', type=int, default=0,
+                        help='The seed from which the vectorised simulator '
+                             'draws its random runs, so that its results '
+                             'can be reproduced (default 0)')
+    parser.add_argument('--bounded-steps', type=int, default=0,
+                        help='Let the formula method first search for runs '
+                             'of at most this many steps, unrolling the '
+                             'automaton with a bound that doubles from 1. '
+                             'Only the nodes these runs miss are checked '
+                             'with the full formula (default 0, no search)')
+    return vars(parser.parse_args())
+
+
+def main():
+    global args
+    args = parse_arguments()
+
+    if args['op'] not in ['reachability', 'c-code', 'full', 'grammar']:
+        print("Error: op must be in ['reachability', 'c-code', "
+              "'full', 'grammar'] but is {}".format(args['op']))
+        exit(-1)
 
-if args['op'] == "c-code":
-    analyze_code()
+    if 'method' in args and args['method'] not in ['interval', 'formula']:
+        print("Error: method must be in ['interval', 'formula'] but is {}"
+              .format(args['method']))
+        exit(-1)
 
-if args['op'] == "full":
-    files = analyze_code()
+    if args['output'] not in ['text', 'jsonl']:
+        print("Error: output must be in ['text', 'jsonl'] but is {}"
+              .format(args['output']))
+        exit(-1)
 
-    reachabilities: Dict[str, bool] = dict()
+    if args['encoding'] not in ['z3', 'smtlib']:
+        print("Error: encoding must be in ['z3', 'smtlib'] but is {}"
+              .format(args['encoding']))
+        exit(-1)
 
-    print()
-    for file in files:
-        print("Starting to analyze: {}".format(file))
+    if args['simulator'] not in ['breadth-first', 'vectorised']:
+        print("Error: simulator must be in ['breadth-first', 'vectorised'] "
+              "but is {}".format(args['simulator']))
+        exit(-1)
 
-        if args['method'] == "interval":
-            result = analyze_reachability_with_interval(file)
-        else:
-            result = analyze_reachability_with_formula(file)
-
-        reachabilities[file] = result
-
-    for file_name in reachabilities:
-        tokens = file_name.split("_")
-        reachable = reachabilities[file_name]
-        function = ""
-        code_file = ""
-        # retrieve the code file name
-        while tokens[0] != "reachability":
-            code_file += "{}_".format(tokens.pop(0))
-        if "/" in code_file:
-            sep = "/"
-        else:
-            sep = "\\"
-        code_file = code_file.split("automaton-input" + sep)[-1]
-        code_file = code_file[:-1]
+    if args['simulator'] == 'vectorised' and args['simulation_budget'] > 0 \
+            and importlib.util.find_spec("numpy") is None:
+        print("Error: the vectorised simulator requires numpy")
+        exit(-1)
+
+    if args['bounded_steps'] < 0:
+        print("Error: bounded-steps must be at least 0 but is {}"
+              .format(args['bounded_steps']))
+        exit(-1)
+
+    if args['solvers'] is not None:
+        args['solvers'] = args['solvers'].split(',')
+        args['encoding'] = 'smtlib'
+
+        # imported here so that the other methods do not pay for z3
+        from Equations.ProcessSolver import get_solver_command
+        try:
+            for solver in args['solvers']:
+                get_solver_command(solver)
+        except ValueError as error:
+            print("Error: {}".format(error))
+            exit(-1)
+
+    if args['max_fragments'] is not None and args['max_fragments'] < 1:
+        print("Error: max-fragments must be at least 1 but is {}"
+              .format(args['max_fragments']))
+        exit(-1)
+
+    if args['configurations'] is not None:
+        try:
+            args['configurations'] = \
+                parse_configurations(args['configurations'])
+        except ValueError as error:
+            print("Error: {}".format(error))
+            exit(-1)
+
+    if args['output'] == 'jsonl':
+        # keep stdout clean for the verdicts, all other output goes to stderr
+        with redirect_stdout(sys.stderr):
+            run_op()
+    else:
+        run_op()
+
+
+def run_op():
+    if args['op'] == "grammar":
+        grammar()
+
+    if args['op'] == "reachability":
+        analyze_reachability(args["input"])
+
+    if args['op'] == "c-code":
+        analyze_code()
+
+    if args['op'] == "full":
+        files = analyze_code()
+
+        reachabilities: Dict[str, bool] = dict()
+
+        print()
+        for file in files:
+            print("Starting to analyze: {}".format(file))
+
+            result = analyze_reachability(file)
+
+            reachabilities[file] = result
+
+        for file_name in reachabilities:
+            reachable = reachabilities[file_name]
+            code_file, function = split_automaton_file_name(file_name)
 
-        # pop the tokens 'reachability' and 'automaton'
-        tokens.pop(0)
-        tokens.pop(0)
+            print("Reachability was found to be {} for the function {} in "
+                  "the file {}".format(reachable, function, code_file))
 
-        # retrieve the function name
-        function = "_".join(tokens).split(".dot")[0]
 
-        print("Reachability was found to be {} for the function {} in the "
-              "file {}".format(reachable, function, code_file))
+if __name__ == '__main__':
+    main()
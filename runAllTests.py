@@ -2,6 +2,8 @@ import unittest
 
 from test.Automaton.TestCreateAutomaton import TestCreateAutomaton
 from test.Automaton.TestLoopFinder import TestLoopFinder
+from test.Automaton.TestSlicer import TestSlicer
+from test.Automaton.TestSimplifier import TestSimplifier
 
 from test.Reach.TestIntervals import TestIntervals
 from test.Reach.TestNewReachConfiguration import TestNewReachConfiguration
@@ -9,6 +11,13 @@ from test.Reach.TestPostUpdate import TestPostUpdate
 from test.Reach.TestLoopAcceleration import TestLoopAcceleration
 from test.Reach.TestIntervalUnion import TestIntervalUnion
 from test.Reach.TestFullScenarioWithoutParameters import TestFullScenarioWithoutParamters
+from test.Reach.TestTargets import TestTargets
+from test.Reach.TestTransfer import TestTransfer
+from test.Reach.TestCollapsedReach import TestCollapsedReach
+from test.Reach.TestIntervalsPool import TestIntervalsPool
+from test.Reach.TestSummaryManager import TestSummaryManager
+from test.Reach.TestSimulator import TestSimulator
+from test.Reach.TestVectorSimulator import TestVectorSimulator
 
 from test.Equations.TestUnion import TestUnion
 from test.Equations.TestAdd import TestAdd
@@ -17,6 +26,16 @@ from test.Equations.TestOverlaps import TestOverlaps
 from test.Equations.TestNoOverlaps import TestNoOverlaps
 from test.Equations.TestFullAnalysis import TestFullAnalysis
 from test.Equations.TestParitallySatisfiable import TestPartiallySatisfiable
+from test.Equations.TestSmtLibEncoding import TestSmtLibEncoding
+from test.Equations.TestProcessSolver import TestProcessSolver
+from test.Equations.TestDisjunctiveAnalysis import TestDisjunctiveAnalysis
+from test.Equations.TestRealEncoding import TestRealEncoding
+from test.Equations.TestBooleanEncoding import TestBooleanEncoding
+from test.Equations.TestSeededAnalysis import TestSeededAnalysis
+from test.Equations.TestBoundedModelChecker import TestBoundedModelChecker
+
+from test.Analysis.TestVerdictWriter import TestVerdictWriter
+from test.Analysis.TestBatchAnalyser import TestBatchAnalyser
 
 if __name__ == '__main__':
     unittest.main()
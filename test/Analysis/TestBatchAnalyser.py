@@ -0,0 +1,85 @@
+import unittest
+import os
+
+from Automaton.DotReader import DotReader
+
+from Analysis.BatchAnalyser import BatchAnalyser
+
+
+class TestBatchAnalyser(unittest.TestCase):
+    @staticmethod
+    def build_file_path(file):
+        base = os.path.dirname(__file__)
+        return os.path.join(base, file)
+
+    def create_analyser(self, file_name="input/split_lines.dot", **kwargs):
+        file_name = self.build_file_path(file_name)
+        reader = DotReader(file_name)
+        self.automaton = reader.create_automaton()
+
+        self.analyser = BatchAnalyser(self.automaton, **kwargs)
+
+    def test_lines(self):
+        self.create_analyser()
+
+        self.assertEqual(["1", "2", "3", "4"], self.analyser.get_lines())
+
+    def test_verdict_table(self):
+        self.create_analyser()
+
+        configurations = [(0, -10, 10), (0, -10, 3), (-5, -10, 10)]
+        table = self.analyser.analyse(configurations)
+
+        self.assertEqual(configurations, list(table.keys()))
+        self.assertEqual({"1": True, "2": True, "3": True, "4": False},
+                         table[(0, -10, 10)])
+        self.assertEqual({"1": True, "2": True, "3": True, "4": False},
+                         table[(0, -10, 3)])
+        self.assertEqual({"1": True, "2": True, "3": True, "4": True},
+                         table[(-5, -10, 10)])
+
+    def test_initial_value_out_of_bounds(self):
+        self.create_analyser()
+
+        table = self.analyser.analyse([(20, -10, 10)])
+
+        self.assertFalse(any(table[(20, -10, 10)].values()))
+
+    def test_shared_transfers(self):
+        self.create_analyser(simplify=True)
+
+        self.analyser.analyse([(0, -10, 10)])
+        transfers = self.analyser.transfers
+        table = self.analyser.analyse([(-5, -10, 10)])
+
+        self.assertIs(transfers, self.analyser.transfers)
+        self.assertTrue(table[(-5, -10, 10)]["4"])
+
+    def test_summaries(self):
+        self.create_analyser(summaries=True)
+
+        configurations = [(start, -10, 10) for start in range(-6, 2)]
+        table = self.analyser.analyse(configurations)
+
+        self.create_analyser()
+        self.assertEqual(self.analyser.analyse(configurations), table)
+
+    def test_simulation(self):
+        configurations = [(0, -10, 10), (0, -10, 3), (-5, -10, 10)]
+        for method in ["interval", "formula"]:
+            self.create_analyser(method=method, simulation_budget=100)
+            table = self.analyser.analyse(configurations)
+
+            self.create_analyser(method=method)
+            self.assertEqual(self.analyser.analyse(configurations), table)
+
+    def test_simulation_at_bound(self):
+        # line 2 is only reached at the upper bound, which the interval
+        # method includes and the formula method excludes
+        file_name = "input/guard_at_bound.dot"
+        for method, reachable in [("interval", True), ("formula", False)]:
+            self.create_analyser(file_name, method=method,
+                                 simulation_budget=100)
+            table = self.analyser.analyse([(0, -10, 10)])
+
+            self.assertEqual(reachable, table[(0, -10, 10)]["2"])
@@ -0,0 +1,61 @@
+import unittest
+import os
+import json
+
+from io import StringIO
+
+from Automaton.DotReader import DotReader
+
+from Analysis.VerdictWriter import VerdictWriter
+
+
+class TestVerdictWriter(unittest.TestCase):
+    @staticmethod
+    def build_file_path(file):
+        base = os.path.dirname(__file__)
+        return os.path.join(base, file)
+
+    def setUp(self):
+        file_name = self.build_file_path("input/split_lines.dot")
+        reader = DotReader(file_name)
+        self.automaton = reader.create_automaton()
+
+        self.stream = StringIO()
+        self.writer = VerdictWriter(self.stream, self.automaton,
+                                    "file.c", "foo")
+
+    def get_verdicts(self):
+        lines = self.stream.getvalue().splitlines()
+        return [json.loads(line) for line in lines]
+
+    def test_reachable_lines_are_written_immediately(self):
+        self.writer.node_reachable("Q1")
+
+        verdicts = self.get_verdicts()
+        self.assertEqual(1, len(verdicts))
+        self.assertEqual({"file": "file.c", "function": "foo",
+                          "line": "2", "reachable": True}, verdicts[0])
+
+    def test_line_reachable_through_any_node(self):
+        self.writer.node_reachable("Q3")
+        self.writer.finish()
+
+        verdicts = self.get_verdicts()
+        line_3 = [v for v in verdicts if v["line"] == "3"]
+        self.assertEqual(1, len(line_3))
+        self.assertTrue(line_3[0]["reachable"])
+        self.assertNotIn("Q2", self.writer.get_undecided_nodes())
+
+    def test_finish_writes_remaining_lines(self):
+        self.writer.node_reachable("Q0")
+        self.writer.node_reachable("Q0")
+        self.writer.finish()
+
+        verdicts = self.get_verdicts()
+        self.assertEqual(4, len(verdicts))
+        self.assertTrue(verdicts[0]["reachable"])
+        for verdict in verdicts[1:]:
+            self.assertFalse(verdict["reachable"])
+
+        self.assertFalse(self.writer.is_fully_reachable())
+        self.assertFalse(self.writer.get_undecided_nodes())
@@ -0,0 +1,57 @@
+import unittest
+import os
+
+from Automaton.DotReader import DotReader
+from Automaton.Simplifier import Simplifier
+
+
+class TestSimplifier(unittest.TestCase):
+    @staticmethod
+    def build_file_path(file):
+        base = os.path.dirname(__file__)
+        return os.path.join(base, file)
+
+    def create_simplifier(self, file_name, targets=None):
+        file_name = self.build_file_path(file_name)
+        reader = DotReader(file_name)
+        self.automaton = reader.create_automaton()
+
+        self.simplifier = Simplifier(self.automaton, targets)
+        self.simplified = self.simplifier.simplify()
+
+    def test_chain_compression(self):
+        self.create_simplifier("input/chain_graph.dot")
+
+        self.assertEqual(5, self.simplified.get_nr_of_nodes())
+        self.assertEqual(4, self.simplified.get_nr_of_edges())
+        self.assertEqual("+3", str(self.simplified.get_edge_operation("Q0",
+                                                                     "Q3")))
+        self.assertEqual("-1", str(self.simplified.get_edge_operation("_0",
+                                                                     "Q5")))
+
+    def test_representatives(self):
+        self.create_simplifier("input/chain_graph.dot")
+
+        self.assertEqual("Q0", self.simplifier.get_representative("Q0"))
+        self.assertEqual("Q0", self.simplifier.get_representative("Q1"))
+        self.assertEqual("Q3", self.simplifier.get_representative("Q2"))
+        self.assertEqual("_0", self.simplifier.get_representative("Q4"))
+
+        self.assertEqual(["Q0", "Q1"],
+                         self.simplifier.get_represented_nodes("Q0"))
+        self.assertEqual(["Q4", "_0"],
+                         self.simplifier.get_represented_nodes("_0"))
+
+    def test_guarded_nodes_are_kept(self):
+        self.create_simplifier("input/conditional_edge_graph.dot")
+
+        for node in self.automaton.get_nodes():
+            if self.automaton.get_node_condition(node) is not None:
+                self.assertTrue(self.simplified.node_exists(node))
+
+    def test_mixed_signs_are_not_merged(self):
+        self.create_simplifier("input/sliceable_graph.dot")
+
+        self.assertTrue(self.simplified.node_exists("Q1"))
+        self.assertTrue(self.simplified.node_exists("Q2"))
+        self.assertEqual(2, len(self.simplified.get_loops()))
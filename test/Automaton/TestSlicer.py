@@ -0,0 +1,54 @@
+import unittest
+import os
+
+from Automaton.DotReader import DotReader
+from Automaton.Slicer import Slicer
+
+
+class TestSlicer(unittest.TestCase):
+    @staticmethod
+    def build_file_path(file):
+        base = os.path.dirname(__file__)
+        return os.path.join(base, file)
+
+    def setUp(self):
+        file_name = self.build_file_path("input/sliceable_graph.dot")
+        reader = DotReader(file_name)
+        self.automaton = reader.create_automaton()
+        self.automaton.set_lower_bound(-10)
+        self.automaton.set_upper_bound(10)
+        self.automaton.set_initial_value(3)
+
+        self.slicer = Slicer(self.automaton)
+        self.targets = ["Q0", "Q1", "Q2", "Q3"]
+
+    def test_relevant_nodes(self):
+        relevant = self.slicer.find_relevant_nodes(self.targets)
+
+        self.assertEqual({"Q0", "Q1", "Q2"}, relevant)
+
+    def test_relevant_nodes_single_target(self):
+        relevant = self.slicer.find_relevant_nodes(["Q0"])
+
+        self.assertEqual({"Q0"}, relevant)
+
+    def test_sliced_automaton(self):
+        sliced = self.slicer.slice(self.targets)
+
+        self.assertEqual(["Qi", "Q0", "Q1", "Q2"],
+                         list(sliced.get_nodes().keys()))
+        self.assertEqual(4, sliced.get_nr_of_edges())
+        self.assertEqual("Q0", sliced.get_initial_node())
+        self.assertEqual("2", sliced.get_node_label("Q1"))
+        self.assertEqual("-1", str(sliced.get_edge_operation("Q1", "Q2")))
+
+        self.assertEqual(-10, sliced.get_lower_bound())
+        self.assertEqual(10, sliced.get_upper_bound())
+        self.assertEqual(3, sliced.get_initial_value())
+
+    def test_sliced_loops(self):
+        sliced = self.slicer.slice(self.targets)
+
+        self.assertEqual(2, len(self.automaton.get_loops()))
+        self.assertEqual(1, len(sliced.get_loops()))
+        self.assertEqual({"Q1", "Q2"}, set(sliced.get_loops()[0].get_nodes()))
@@ -0,0 +1,91 @@
+import contextlib
+import io
+import operator
+import unittest
+import os
+
+from z3 import Solver, sat
+
+from Automaton.DotReader import DotReader
+
+from Equations.BooleanFlag import BooleanFlag
+from Equations.EdgeSelector import EdgeSelector
+from Equations.EquationSolver import EquationSolver
+from Equations.Z3Encoder import Z3Encoder
+
+
+class TestBooleanEncoding(unittest.TestCase):
+    @staticmethod
+    def build_file_path(file):
+        base = os.path.dirname(__file__)
+        return os.path.join(base, file)
+
+    def setUp(self):
+        self.encoder = Z3Encoder()
+        self.solver = Solver()
+
+    def holds(self, condition):
+        self.solver.push()
+        self.solver.add(condition)
+        result = self.solver.check()
+        self.solver.pop()
+        return result == sat
+
+    def test_flag_comparisons(self):
+        x = BooleanFlag(self.encoder, "x")
+        y = BooleanFlag(self.encoder, "y")
+        operations = [operator.eq, operator.ne, operator.lt, operator.le,
+                      operator.gt, operator.ge]
+
+        # every comparison matches the one of the integer flags
+        for x_value in range(3):
+            for y_value in range(3):
+                self.solver.push()
+                self.solver.add(x == x_value, y == y_value)
+                for operation in operations:
+                    expected = operation(x_value, y_value)
+                    self.assertEqual(expected,
+                                     self.holds(operation(x, y)))
+                    self.assertEqual(expected,
+                                     self.holds(operation(x, y_value)))
+                    self.assertEqual(expected,
+                                     self.holds(operation(x_value, y)))
+                self.solver.pop()
+
+    def test_flag_evaluation(self):
+        x = BooleanFlag(self.encoder, "x")
+        self.solver.add(x == 1)
+        self.solver.check()
+
+        self.assertEqual(1, x.evaluate(self.solver.model()))
+
+    def test_edge_selector(self):
+        x = EdgeSelector(self.encoder, "x", [-2, -1, 3])
+        y = EdgeSelector(self.encoder, "y", [-2, 4])
+        self.solver.add(x.is_one_hot(), y.is_one_hot())
+
+        self.assertFalse(self.holds(x == 4))
+        self.assertFalse(self.holds(self.encoder.And(x == -2, x == 3)))
+        self.assertFalse(self.holds(self.encoder.And(x == y, x != -2)))
+
+        self.solver.add(x == 3)
+        self.assertEqual(sat, self.solver.check())
+        self.assertEqual(3, x.evaluate(self.solver.model()))
+
+    def test_same_result_as_integers(self):
+        def analyse(file_name, encoding, booleans):
+            reader = DotReader(self.build_file_path(file_name))
+            automaton = reader.create_automaton()
+            automaton.set_lower_bound(-10)
+            automaton.set_upper_bound(10)
+
+            eq_solver = EquationSolver(automaton, encoding=encoding,
+                                       booleans=booleans)
+            with contextlib.redirect_stdout(io.StringIO()):
+                return set(eq_solver.analyse())
+
+        for file_name in ["input/single_path_with_conditions.dot",
+                          "input/partially_satisfiable.dot"]:
+            expected = analyse(file_name, "smtlib", False)
+            self.assertEqual(expected, analyse(file_name, "smtlib", True))
+            self.assertEqual(expected, analyse(file_name, "z3", True))
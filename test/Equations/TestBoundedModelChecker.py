@@ -0,0 +1,86 @@
+import contextlib
+import io
+import shutil
+import unittest
+import os
+
+from Automaton.DotReader import DotReader
+
+from Equations.BoundedModelChecker import BoundedModelChecker
+from Equations.EquationSolver import EquationSolver
+from Equations.ProcessSolver import ProcessSolver, get_solver_command
+from Equations.SmtLibEncoder import SmtLibEncoder
+from Equations.Z3Encoder import Z3Encoder
+
+
+class TestBoundedModelChecker(unittest.TestCase):
+    @staticmethod
+    def build_file_path(file):
+        base = os.path.dirname(__file__)
+        return os.path.join(base, file)
+
+    def create_automaton(self, file_name):
+        reader = DotReader(self.build_file_path(file_name))
+        automaton = reader.create_automaton()
+        automaton.set_lower_bound(-10)
+        automaton.set_upper_bound(10)
+        automaton.set_initial_value(0)
+        return automaton
+
+    def analyse(self, eq_solver):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return set(eq_solver.analyse())
+
+    def test_short_runs(self):
+        automaton = self.create_automaton("input/single_path.dot")
+        checker = BoundedModelChecker(automaton, Z3Encoder(True))
+
+        self.assertEqual({"s0", "s1", "s2", "s3"}, set(checker.analyse()))
+        # the bound doubles from 1 until it covers the three edges
+        self.assertEqual(5, len(checker.positions))
+
+    def test_bound_limits_runs(self):
+        # Q2 is only reached after the loop is taken twice, Q3 is never
+        # reached as Q0 only holds values below 1
+        automaton = self.create_automaton("input/loop_with_exit.dot")
+
+        checker = BoundedModelChecker(automaton, SmtLibEncoder(True),
+                                      max_steps=2)
+        self.assertEqual({"Q0", "Q1"}, set(checker.analyse()))
+
+        checker = BoundedModelChecker(automaton, SmtLibEncoder(True),
+                                      max_steps=8)
+        self.assertEqual({"Q0", "Q1", "Q2"}, set(checker.analyse()))
+
+    def test_unsatisfiable_guards(self):
+        automaton = self.create_automaton("input/partially_satisfiable.dot")
+        checker = BoundedModelChecker(automaton, Z3Encoder(True))
+
+        self.assertEqual({"s0", "s1"}, set(checker.analyse()))
+
+    def test_same_result_as_full_encoding(self):
+        for file_name in ["input/single_path.dot",
+                          "input/partially_satisfiable.dot",
+                          "input/multi_path.dot",
+                          "input/loop_with_exit.dot"]:
+            automaton = self.create_automaton(file_name)
+            full = self.analyse(EquationSolver(automaton, encoding="smtlib"))
+
+            automaton = self.create_automaton(file_name)
+            bounded = self.analyse(EquationSolver(automaton,
+                                                  encoding="smtlib",
+                                                  bounded_steps=2))
+
+            self.assertEqual(full, bounded)
+
+    @unittest.skipIf(shutil.which("z3") is None,
+                     "the z3 binary is not installed")
+    def test_external_solver(self):
+        automaton = self.create_automaton("input/loop_with_exit.dot")
+        encoder = SmtLibEncoder(True)
+        solver = ProcessSolver(encoder, [get_solver_command("z3")])
+        checker = BoundedModelChecker(automaton, encoder, max_steps=8,
+                                      solver=solver)
+
+        self.assertIs(solver, checker.s)
+        self.assertEqual({"Q0", "Q1", "Q2"}, set(checker.analyse()))
@@ -0,0 +1,88 @@
+import contextlib
+import io
+import unittest
+import os
+
+from z3 import unknown
+
+from Automaton.DotReader import DotReader
+
+from Equations.EquationSolver import EquationSolver
+
+
+class TestDisjunctiveAnalysis(unittest.TestCase):
+    @staticmethod
+    def build_file_path(file):
+        base = os.path.dirname(__file__)
+        return os.path.join(base, file)
+
+    def analyse(self, file_name, disjunctive, low=-10, high=10):
+        reader = DotReader(self.build_file_path(file_name))
+        automaton = reader.create_automaton()
+        automaton.set_lower_bound(low)
+        automaton.set_upper_bound(high)
+        automaton.set_initial_value(0)
+
+        eq_solver = EquationSolver(automaton, encoding="smtlib",
+                                   disjunctive=disjunctive)
+
+        # count the checks the analysis issues
+        checks = list()
+        check = eq_solver.s.check
+
+        def counted_check():
+            checks.append(True)
+            return check()
+
+        eq_solver.s.check = counted_check
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            reachable = set(eq_solver.analyse())
+        return reachable, len(checks)
+
+    def test_all_reachable(self):
+        reachable, checks = self.analyse("input/single_path.dot", True)
+
+        self.assertEqual({"s0", "s1", "s2", "s3"}, reachable)
+        self.assertLessEqual(checks, 4)
+
+    def test_same_result_as_per_node(self):
+        for file_name in ["input/single_path_with_conditions.dot",
+                          "input/partially_satisfiable.dot"]:
+            per_node, _ = self.analyse(file_name, False)
+            at_once, at_once_checks = self.analyse(file_name, True)
+
+            # every sat check marks a new node, a final check is unsat
+            self.assertEqual(per_node, at_once)
+            self.assertLessEqual(at_once_checks, len(at_once) + 1)
+
+    def test_unknown_falls_back_to_per_node(self):
+        reader = DotReader(self.build_file_path(
+            "input/partially_satisfiable.dot"))
+        automaton = reader.create_automaton()
+        automaton.set_lower_bound(-10)
+        automaton.set_upper_bound(10)
+        automaton.set_initial_value(0)
+
+        eq_solver = EquationSolver(automaton, encoding="smtlib",
+                                   disjunctive=True)
+
+        # the first check gives up, as on a timeout
+        checks = list()
+        check = eq_solver.s.check
+
+        def failing_check():
+            checks.append(True)
+            if len(checks) == 1:
+                return unknown
+            return check()
+
+        eq_solver.s.check = failing_check
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            reachable = set(eq_solver.analyse())
+        self.assertEqual({"s0", "s1"}, reachable)
+
+        # the nodes are then checked one by one, the unreachable s2 and s3
+        # each need a check of their own
+        self.assertGreaterEqual(len(checks), 3)
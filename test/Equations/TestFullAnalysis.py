@@ -1,3 +1,5 @@
+import contextlib
+import io
 import unittest
 import os
 
@@ -179,3 +181,14 @@ class TestFullAnalysis(unittest.TestCase):
         self.eq_solver.add_final_condition(nodes.index("s5"))
         self.assertEqual(self.solver.check(), unsat)
         self.solver.pop()
+
+    def test_loop_with_exit(self):
+        self.create_solver("input/loop_with_exit.dot", -10, 10)
+
+        # Q2 is only reached by going through the loop several times
+        # Q3 is a known over-approximation, Q0 only holds values below 1 so
+        # Q3 can not be reached, but the loop encoding over-approximates
+        # the values of Q0
+        with contextlib.redirect_stdout(io.StringIO()):
+            reachable = set(self.eq_solver.analyse())
+        self.assertEqual({"Q0", "Q1", "Q2", "Q3"}, reachable)
@@ -170,3 +170,25 @@ class TestIntersection(unittest.TestCase):
                                                 self.result))
 
         self.verify_result(0, 0, 0, 0)
+
+    # regression, the intersection of [-1, 0) and (-1, 0) is not empty
+    def test_intersect_same_bounds_lower_included(self):
+        self.assign_to_vec(self.vector1, -1, 0, 1, 0)
+        self.assign_to_vec(self.vector2, -1, 0, 0, 0)
+
+        self.s.add(self.eq_solver.intersect_vec(self.vector1,
+                                                self.vector2,
+                                                self.result))
+
+        self.verify_result(-1, 0, 0, 0)
+
+    # regression, (-inf, 1) excludes 1 so it does not intersect [1, 1]
+    def test_no_intersect_inf_low_excluded_match(self):
+        self.assign_to_vec(self.vector1, 0, 1, 2, 0)
+        self.assign_to_vec(self.vector2, 1, 1, 1, 1)
+
+        self.s.add(self.eq_solver.intersect_vec(self.vector1,
+                                                self.vector2,
+                                                self.result))
+
+        self.verify_result(0, 0, 0, 0)
@@ -180,3 +180,21 @@ class TestNoOverlaps(unittest.TestCase):
                                                    self.vector2))
 
         self.assertEqual(self.solver.check(), sat)
+
+    def test_no_overlap_same_bounds_lower_included(self):
+        self.assign_to_vec(self.vector1, -1, 0, 1, 0)
+        self.assign_to_vec(self.vector2, -1, 0, 0, 0)
+
+        self.solver.add(self.eq_solver.no_overlaps(self.vector1,
+                                                   self.vector2))
+
+        self.assertEqual(self.solver.check(), unsat)
+
+    def test_no_overlap_infinity_bound_lower_excluded_match(self):
+        self.assign_to_vec(self.vector1, 0, 1, 2, 0)
+        self.assign_to_vec(self.vector2, 1, 1, 1, 1)
+
+        self.solver.add(self.eq_solver.no_overlaps(self.vector1,
+                                                   self.vector2))
+
+        self.assertEqual(self.solver.check(), sat)
@@ -171,3 +171,25 @@ class TestOverlaps(unittest.TestCase):
                                                 self.vector2))
 
         self.assertEqual(self.solver.check(), unsat)
+
+    # [-1, 0) and (-1, 0) share the values in between, whereas the
+    # enumeration of flag cases before the compact encoding missed this
+    def test_overlap_same_bounds_lower_included(self):
+        self.assign_to_vec(self.vector1, -1, 0, 1, 0)
+        self.assign_to_vec(self.vector2, -1, 0, 0, 0)
+
+        self.solver.add(self.eq_solver.overlaps(self.vector1,
+                                                self.vector2))
+
+        self.assertEqual(self.solver.check(), sat)
+
+    # (-inf, 1) excludes 1, whereas the enumeration of flag cases before the
+    # compact encoding let it overlap [1, 1]
+    def test_overlap_infinity_bound_lower_excluded_match(self):
+        self.assign_to_vec(self.vector1, 0, 1, 2, 0)
+        self.assign_to_vec(self.vector2, 1, 1, 1, 1)
+
+        self.solver.add(self.eq_solver.overlaps(self.vector1,
+                                                self.vector2))
+
+        self.assertEqual(self.solver.check(), unsat)
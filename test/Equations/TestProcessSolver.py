@@ -0,0 +1,85 @@
+import contextlib
+import io
+import shutil
+import unittest
+import os
+
+from z3 import sat, unsat
+
+from Automaton.DotReader import DotReader
+
+from Equations.EquationSolver import EquationSolver
+from Equations.ProcessSolver import ProcessSolver, get_solver_command, \
+    parse_model
+from Equations.SmtLibEncoder import SmtLibEncoder
+
+
+@unittest.skipIf(shutil.which("z3") is None, "the z3 binary is not installed")
+class TestProcessSolver(unittest.TestCase):
+    @staticmethod
+    def build_file_path(file):
+        base = os.path.dirname(__file__)
+        return os.path.join(base, file)
+
+    def create_solver(self, commands):
+        self.encoder = SmtLibEncoder()
+        self.solver = ProcessSolver(self.encoder, commands)
+
+    def test_parse_model(self):
+        output = "(\n  (define-fun x () Int\n    (- 4))\n" \
+                 "  (define-fun |y.1| () Int 3)\n)"
+
+        self.assertEqual({"x": -4, "y.1": 3}, parse_model(output))
+
+    def test_parse_real_model(self):
+        output = "((define-fun x () Real (- (/ 3 2)))\n" \
+                 " (define-fun y () Real 2.0))"
+
+        self.assertEqual({"x": -1.5, "y": 2}, parse_model(output))
+
+    def test_parse_boolean_model(self):
+        output = "((define-fun r_0 () Bool true)\n" \
+                 " (define-fun r_1 () Bool false))"
+
+        self.assertEqual({"r_0": True, "r_1": False}, parse_model(output))
+
+    def test_unknown_solver(self):
+        with self.assertRaises(ValueError):
+            get_solver_command("unknown")
+
+    def test_scopes(self):
+        self.create_solver([get_solver_command("z3")])
+        x = self.encoder.Variable("x")
+        self.solver.add(x > 2)
+
+        self.solver.push()
+        self.solver.add(x < 2)
+        self.assertEqual(unsat, self.solver.check())
+        self.solver.pop()
+
+        self.solver.add(x < 4)
+        self.assertEqual(sat, self.solver.check())
+        self.assertEqual(3, self.solver.model()[x].as_long())
+
+    def test_race_takes_definite_answer(self):
+        # a solver that fails does not decide the race
+        self.create_solver([["false"], get_solver_command("z3")])
+        x = self.encoder.Variable("x")
+        self.solver.add(x == 5)
+
+        self.assertEqual(sat, self.solver.check())
+        self.assertEqual(5, self.solver.model()[x].as_long())
+
+    def test_same_result_as_z3(self):
+        def analyse(solvers):
+            reader = DotReader(self.build_file_path("input/single_path.dot"))
+            automaton = reader.create_automaton()
+            automaton.set_lower_bound(-10)
+            automaton.set_upper_bound(10)
+
+            eq_solver = EquationSolver(automaton, encoding="smtlib",
+                                       solvers=solvers)
+            with contextlib.redirect_stdout(io.StringIO()):
+                return set(eq_solver.analyse())
+
+        self.assertEqual(analyse(None), analyse(["z3"]))
@@ -0,0 +1,45 @@
+import contextlib
+import io
+import unittest
+import os
+
+from z3 import is_real
+
+from Automaton.Automaton import Automaton
+from Automaton.DotReader import DotReader
+
+from Equations.EquationSolver import EquationSolver
+
+
+class TestRealEncoding(unittest.TestCase):
+    @staticmethod
+    def build_file_path(file):
+        base = os.path.dirname(__file__)
+        return os.path.join(base, file)
+
+    def analyse(self, file_name, encoding, real):
+        reader = DotReader(self.build_file_path(file_name))
+        automaton = reader.create_automaton()
+        automaton.set_lower_bound(-10)
+        automaton.set_upper_bound(10)
+        automaton.set_initial_value(0)
+
+        eq_solver = EquationSolver(automaton, encoding=encoding, real=real)
+        with contextlib.redirect_stdout(io.StringIO()):
+            return set(eq_solver.analyse())
+
+    def test_real_variables(self):
+        automaton = Automaton("automaton", float('inf'), float('inf'))
+        eq_solver = EquationSolver(automaton, real=True)
+
+        self.assertTrue(is_real(eq_solver.encoder.Variable("x")))
+        self.assertTrue(all(is_real(x)
+                            for x in eq_solver.encoder.Vector("y", 4)))
+
+    def test_same_result_as_integers(self):
+        for file_name in ["input/single_path_with_conditions.dot",
+                          "input/partially_satisfiable.dot"]:
+            expected = self.analyse(file_name, "smtlib", False)
+            self.assertEqual(expected,
+                             self.analyse(file_name, "smtlib", True))
+            self.assertEqual(expected, self.analyse(file_name, "z3", True))
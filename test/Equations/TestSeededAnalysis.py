@@ -0,0 +1,68 @@
+import contextlib
+import io
+import unittest
+import os
+
+from Automaton.DotReader import DotReader
+
+from Equations.EquationSolver import EquationSolver
+
+
+class TestSeededAnalysis(unittest.TestCase):
+    @staticmethod
+    def build_file_path(file):
+        base = os.path.dirname(__file__)
+        return os.path.join(base, file)
+
+    def create_solver(self, file_name, seed):
+        reader = DotReader(self.build_file_path(file_name))
+        automaton = reader.create_automaton()
+        automaton.set_lower_bound(-10)
+        automaton.set_upper_bound(10)
+        automaton.set_initial_value(0)
+
+        return EquationSolver(automaton, encoding="smtlib", seed=seed)
+
+    def analyse(self, eq_solver):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return set(eq_solver.analyse())
+
+    def test_same_result_as_unseeded(self):
+        for file_name in ["input/single_path.dot",
+                          "input/partially_satisfiable.dot",
+                          "input/multi_path.dot"]:
+            unseeded = self.analyse(self.create_solver(file_name, False))
+            seeded = self.analyse(self.create_solver(file_name, True))
+
+            self.assertEqual(unseeded, seeded)
+
+    def test_unreachable_nodes_not_queried(self):
+        eq_solver = self.create_solver("input/partially_satisfiable.dot",
+                                       True)
+
+        queried = list()
+        add_final_condition = eq_solver.add_final_condition
+
+        def counted_final_condition(node):
+            queried.append(eq_solver.nodes[node])
+            add_final_condition(node)
+
+        eq_solver.add_final_condition = counted_final_condition
+
+        self.assertEqual({"s0", "s1"}, self.analyse(eq_solver))
+        self.assertEqual({"s2", "s3"}, eq_solver.unreachable)
+        self.assertFalse(eq_solver.unreachable & set(queried))
+
+    def test_prunes_loop_approximation(self):
+        # Q0 only holds even values below 1, so Q3 can not reach 3
+        eq_solver = self.create_solver("input/loop_with_exit.dot", True)
+
+        self.assertEqual({"Q0", "Q1", "Q2"}, self.analyse(eq_solver))
+
+    def test_parameters_not_seeded(self):
+        eq_solver = self.create_solver(
+            "input/simple_func_reachability_automaton_foo.dot", True)
+        eq_solver.build_transitions()
+        eq_solver.build_node_conditions()
+
+        self.assertIsNone(eq_solver.compute_hulls())
@@ -0,0 +1,132 @@
+import contextlib
+import io
+import unittest
+import os
+
+from z3 import sat, unsat
+
+from Automaton.Automaton import Automaton
+from Automaton.DotReader import DotReader
+
+from Equations.EquationSolver import EquationSolver
+from Equations.SmtLibEncoder import SmtLibEncoder
+
+
+class TestSmtLibEncoding(unittest.TestCase):
+    @staticmethod
+    def build_file_path(file):
+        base = os.path.dirname(__file__)
+        return os.path.join(base, file)
+
+    def setUp(self):
+        self.encoder = SmtLibEncoder()
+        self.solver = self.encoder.create_solver()
+
+    def analyse(self, file_name, encoding):
+        reader = DotReader(self.build_file_path(file_name))
+        automaton = reader.create_automaton()
+        automaton.set_lower_bound(-10)
+        automaton.set_upper_bound(10)
+        automaton.set_initial_value(0)
+
+        eq_solver = EquationSolver(automaton, encoding=encoding)
+        with contextlib.redirect_stdout(io.StringIO()):
+            return set(eq_solver.analyse())
+
+    def test_term_text(self):
+        x = self.encoder.Variable("x")
+        y = self.encoder.Variable("y.1")
+
+        self.assertEqual("(= x (- 2))", str(x == -2))
+        self.assertEqual("(distinct x |y.1|)", str(x != y))
+        self.assertEqual("(> x 3)", str(3 < x))
+        self.assertEqual("(+ 1 x)", str(1 + x))
+        self.assertEqual("(and (<= x 1) (> x 0))",
+                         str(self.encoder.And(x <= 1, x > 0)))
+        self.assertEqual("(or (> x 1) (>= x 0))",
+                         str(self.encoder.Or([x > 1, x >= 0])))
+        self.assertEqual("false", str(self.encoder.Or([])))
+        self.assertEqual("(ite (= x 1) true false)",
+                         str(self.encoder.If(x == 1, True, False)))
+
+    def test_constants_folded(self):
+        x = self.encoder.Variable("x")
+
+        self.assertEqual("(<= x 1)", str(self.encoder.And(x <= 1, True)))
+        self.assertEqual("false", str(self.encoder.And(x <= 1, False)))
+        self.assertEqual("true", str(self.encoder.Or(False, True, x > 1)))
+        self.assertEqual("false", str(self.encoder.Not(True)))
+        self.assertEqual("x", str(self.encoder.If(True, x, 0)))
+
+    def test_terms_have_no_truth_value(self):
+        x = self.encoder.Variable("x")
+
+        with self.assertRaises(TypeError):
+            bool(x == 1)
+
+    def test_declared_once(self):
+        self.encoder.Variable("x")
+        self.encoder.Variable("x")
+        self.encoder.Vector("v", 2)
+
+        self.encoder.Bool("b")
+        self.assertEqual([("x", "Int"), ("v__0", "Int"), ("v__1", "Int"),
+                          ("b", "Bool")], self.encoder.take_pending())
+        self.assertEqual([], self.encoder.take_pending())
+
+    def test_solver_scopes(self):
+        x = self.encoder.Variable("x")
+        self.solver.add(x > 2)
+
+        self.solver.push()
+        self.solver.add(x < 2)
+        self.assertEqual(unsat, self.solver.check())
+        self.solver.pop()
+
+        # variables declared in an earlier parse are shared with later ones
+        self.solver.add(x < 4)
+        self.assertEqual(sat, self.solver.check())
+        self.assertEqual(3, self.solver.model()[x].as_long())
+
+    def test_overlaps(self):
+        eq_solver = EquationSolver(Automaton("automaton", float('inf'),
+                                             float('inf')),
+                                   encoding="smtlib")
+        vector1 = eq_solver.encoder.Vector("a", 4)
+        vector2 = eq_solver.encoder.Vector("b", 4)
+
+        eq_solver.s.add(eq_solver.encoder.And(
+            eq_solver.assign(vector1, 0, 9, 1, 1)))
+        eq_solver.s.add(eq_solver.encoder.And(
+            eq_solver.assign(vector2, 9, 12, 0, 1)))
+
+        eq_solver.s.push()
+        eq_solver.s.add(eq_solver.overlaps(vector1, vector2))
+        self.assertEqual(unsat, eq_solver.s.check())
+        eq_solver.s.pop()
+
+        eq_solver.s.add(eq_solver.no_overlaps(vector1, vector2))
+        self.assertEqual(sat, eq_solver.s.check())
+
+    def test_same_result_as_z3(self):
+        for file_name in ["input/single_path.dot",
+                          "input/single_path_with_conditions.dot"]:
+            self.assertEqual(self.analyse(file_name, "z3"),
+                             self.analyse(file_name, "smtlib"))
+
+    def test_unknown_encoding(self):
+        automaton = Automaton("automaton", float('inf'), float('inf'))
+
+        with self.assertRaises(ValueError):
+            EquationSolver(automaton, encoding="unknown")
+
+    def test_shared_conditions_defined_once(self):
+        reader = DotReader(self.build_file_path("input/single_path.dot"))
+        automaton = reader.create_automaton()
+        eq_solver = EquationSolver(automaton, encoding="smtlib")
+        eq_solver.build_formula()
+
+        # the sub interval conditions are referenced by name
+        self.assertIs(eq_solver.is_filled(1, 2), eq_solver.is_filled(1, 2))
+        formula = eq_solver.s.buffer.getvalue()
+        self.assertEqual(1, formula.count("(assert (= f_1_2 "))
@@ -0,0 +1,57 @@
+import unittest
+import os
+
+from Automaton.DotReader import DotReader
+
+from Reach.ReachManager import ReachManager, JOINED_ORIGIN
+
+
+class TestCollapsedReach(unittest.TestCase):
+    @staticmethod
+    def build_file_path(file):
+        base = os.path.dirname(__file__)
+        return os.path.join(base, file)
+
+    def run_manager(self, file_name, collapsed,
+                    min=-float('inf'), max=float('inf'), initial=0):
+        file_name = self.build_file_path(file_name)
+        reader = DotReader(file_name)
+        automaton = reader.create_automaton()
+        automaton.set_lower_bound(min)
+        automaton.set_upper_bound(max)
+        automaton.set_initial_value(initial)
+
+        manager = ReachManager(automaton, collapsed=collapsed)
+        while not manager.is_finished():
+            manager.update_automaton()
+        return manager
+
+    def test_joined_origins(self):
+        manager = self.run_manager("input/downwards_acceleration_example.dot",
+                                   True)
+
+        self.assertEqual(["Q0"], manager.get_reach("Q0").get_preceding_nodes())
+        self.assertEqual([JOINED_ORIGIN],
+                         manager.get_reach("Q13").get_preceding_nodes())
+        self.assertEqual("(-inf, 5) (5, inf)",
+                         str(manager.get_interval("Q13", JOINED_ORIGIN)))
+
+    def test_loop_origins_are_kept(self):
+        manager = self.run_manager("input/downwards_acceleration_example.dot",
+                                   True)
+
+        self.assertEqual([JOINED_ORIGIN, "Q15"],
+                         manager.get_reach("Q2").get_preceding_nodes())
+        self.assertEqual(["Q2"],
+                         manager.get_reach("Q15").get_preceding_nodes())
+
+    def test_same_reachability(self):
+        files = ["input/downwards_acceleration_example.dot",
+                 "input/simple_double_loop_up_down.dot",
+                 "input/bounded_automaton.dot"]
+        for file_name in files:
+            full = self.run_manager(file_name, False, -10, 10, 2)
+            collapsed = self.run_manager(file_name, True, -10, 10, 2)
+            for node in full.reaches:
+                self.assertEqual(full.is_reachable(node),
+                                 collapsed.is_reachable(node))
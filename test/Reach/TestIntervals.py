@@ -53,10 +53,27 @@ class TestIntervals(unittest.TestCase):
         intervals.union(uniend)
         self.assertEqual("[0, 15)", str(intervals))
 
+        # an empty uniend does not close the upper bound
         uniend = Intervals(15, False, 15, True)
         intervals.union(uniend)
+        self.assertEqual("[0, 15)", str(intervals))
+
+        uniend = Intervals(15, True, 15, True)
+        intervals.union(uniend)
         self.assertEqual("[0, 15]", str(intervals))
 
+    def test_normalise_drops_empty(self):
+        for incl_low, incl_high in [(False, True), (True, False),
+                                    (False, False)]:
+            intervals = Intervals(3, incl_low, 3, incl_high)
+            intervals.normalise()
+            self.assertEqual([], intervals.get_intervals())
+
+        intervals = Intervals(0, True, 3, False)
+        intervals.union(Intervals(3, False, 3, True))
+        intervals.add(Intervals(0, True, 0, True))
+        self.assertEqual("[0, 3)", str(intervals))
+
     def test_new_interval_union(self):
         intervals = Intervals(0, True, 10, True)
         self.assertEqual("[0, 10]", str(intervals))
@@ -158,3 +175,64 @@ class TestIntervals(unittest.TestCase):
         self.assertTrue(is_expansion)
         is_expansion = original.is_expansion_of(expansion)
         self.assertTrue(is_expansion)
+
+    def test_limit_fragments(self):
+        intervals = Intervals(0, True, 1, True)
+        intervals.union(Intervals(3, False, 4, True))
+        intervals.union(Intervals(10, True, 12, False))
+        intervals.union(Intervals(5, True, 6, True))
+        self.assertEqual("[0, 1] (3, 4] [5, 6] [10, 12)", str(intervals))
+
+        intervals.limit_fragments(3)
+        self.assertEqual("[0, 1] (3, 6] [10, 12)", str(intervals))
+
+        intervals.limit_fragments(1)
+        self.assertEqual("[0, 12)", str(intervals))
+
+    def test_limit_fragments_equal_gaps(self):
+        # equal gaps are closed from the left
+        intervals = Intervals(0, True, 1, True)
+        for low in [3, 6, 9]:
+            intervals.union(Intervals(low, True, low + 1, True))
+
+        intervals.limit_fragments(2)
+        self.assertEqual("[0, 7] [9, 10]", str(intervals))
+
+    def test_intersect(self):
+        intervals = Intervals(0, True, 3, True)
+        intervals.union(Intervals(5, False, 8, True))
+        intervals.union(Intervals(10, True, 12, True))
+
+        other = Intervals(3, True, 5, True)
+        other.union(Intervals(6, True, 11, False))
+        self.assertEqual("[3, 3] [6, 8] [10, 11)",
+                         str(intervals.intersect(other)))
+
+        self.assertTrue(intervals.intersect(Intervals(3, False, 5, True))
+                        .is_empty())
+
+    def test_overlapping_add(self):
+        intervals = Intervals(0, True, 1, True)
+        intervals.union(Intervals(3, True, 4, True))
+        intervals.union(Intervals(10, True, 12, True))
+        self.assertEqual("[0, 1] [3, 4] [10, 12]", str(intervals))
+
+        intervals.add(Intervals(0, False, 5, True))
+        self.assertEqual("(0, 9] (10, 17]", str(intervals))
+
+    def test_multiple_addends(self):
+        intervals = Intervals(0, True, 1, True)
+
+        addends = Intervals(0, True, 0, True)
+        addends.union(Intervals(10, False, 11, True))
+        intervals.add(addends)
+        self.assertEqual("[0, 1] (10, 12]", str(intervals))
+
+    def test_canonical_equality(self):
+        intervals = Intervals(5, True, 6, False)
+        intervals.union(Intervals(0, True, 2, True))
+        intervals.union(Intervals(2, False, 5, False))
+
+        other = Intervals(0, True, 6, False)
+        self.assertTrue(intervals.equals(other))
+        self.assertEqual("[0, 6)", str(intervals))
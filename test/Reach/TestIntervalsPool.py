@@ -0,0 +1,55 @@
+import unittest
+import os
+
+from Automaton.DotReader import DotReader
+
+from Reach.Intervals import Intervals
+from Reach.IntervalsPool import IntervalsPool
+from Reach.ReachManager import ReachManager
+
+
+class TestIntervalsPool(unittest.TestCase):
+    @staticmethod
+    def build_file_path(file):
+        base = os.path.dirname(__file__)
+        return os.path.join(base, file)
+
+    def test_equal_sets_are_shared(self):
+        pool = IntervalsPool()
+
+        intervals = Intervals(0, True, 2, True)
+        intervals.union(Intervals(2, False, 5, False))
+        shared = pool.intern(intervals)
+
+        self.assertIsNot(intervals, shared)
+        self.assertEqual("[0, 5)", str(shared))
+        self.assertIs(shared, pool.intern(Intervals(0, True, 5, False)))
+        self.assertIs(shared, pool.find(Intervals(0, True, 5, False)))
+        self.assertIsNone(pool.find(Intervals(0, True, 5, True)))
+
+    def test_unused_sets_are_dropped(self):
+        pool = IntervalsPool()
+
+        shared = pool.intern(Intervals(0, True, 5, False))
+        self.assertEqual(1, len(pool))
+
+        del shared
+        self.assertEqual(0, len(pool))
+
+    def test_shared_snapshots(self):
+        file_name = self.build_file_path("input/simple_automaton.dot")
+        reader = DotReader(file_name)
+        automaton = reader.create_automaton()
+        automaton.set_lower_bound(-float('inf'))
+        automaton.set_upper_bound(float('inf'))
+        automaton.set_initial_value(0)
+
+        manager = ReachManager(automaton)
+        while not manager.is_finished():
+            manager.update_automaton()
+
+        snapshots = [snapshot for node in manager.intervals
+                     for snapshot in manager.intervals[node].values()]
+        for snapshot in snapshots:
+            self.assertIs(snapshot, manager.pool.find(snapshot))
+        self.assertLessEqual(len(manager.pool), len(snapshots))
@@ -0,0 +1,93 @@
+import unittest
+import os
+
+from Automaton.DotReader import DotReader
+
+from Reach.ReachManager import ReachManager
+from Reach.Simulator import Simulator, create_simulator
+
+
+class TestSimulator(unittest.TestCase):
+    @staticmethod
+    def build_file_path(file):
+        base = os.path.dirname(__file__)
+        return os.path.join(base, file)
+
+    def create_automaton(self, file_name, low=-10, high=10, initial=0):
+        reader = DotReader(self.build_file_path(file_name))
+        automaton = reader.create_automaton()
+        automaton.set_lower_bound(low)
+        automaton.set_upper_bound(high)
+        automaton.set_initial_value(initial)
+        return automaton
+
+    def test_small_steps(self):
+        # Q2 needs a first increase below 1, Q3 is out of reach after it
+        automaton = self.create_automaton("input/small_steps.dot")
+        simulator = Simulator(automaton)
+
+        self.assertEqual({"Q0", "Q1", "Q2"}, simulator.run())
+        self.assertFalse(simulator.is_reachable("Q3"))
+
+    def test_bounds(self):
+        automaton = self.create_automaton("input/small_steps.dot", high=0)
+
+        self.assertEqual({"Q0"}, Simulator(automaton).run())
+
+    def test_strict_bounds(self):
+        # the values stay below the upper bound of 1, as in the formula
+        automaton = self.create_automaton("input/small_steps.dot", high=1)
+        simulator = Simulator(automaton, strict_bounds=True)
+        self.assertEqual({"Q0", "Q1", "Q2"}, simulator.run())
+
+        # the initial value is held to the strict bounds as well
+        automaton = self.create_automaton("input/small_steps.dot", high=0)
+        simulator = Simulator(automaton, strict_bounds=True)
+        self.assertEqual(set(), simulator.run())
+
+    def test_initial_value_out_of_bounds(self):
+        automaton = self.create_automaton("input/small_steps.dot",
+                                          initial=20)
+
+        self.assertEqual(set(), Simulator(automaton).run())
+
+    def test_budget(self):
+        automaton = self.create_automaton("input/small_steps.dot")
+        simulator = Simulator(automaton, budget=1)
+
+        self.assertEqual({"Q0", "Q1"}, simulator.run())
+        self.assertEqual(1, simulator.explored)
+
+    def test_stops_at_targets(self):
+        automaton = self.create_automaton(
+            "input/simple_double_loop_up_down.dot")
+        simulator = Simulator(automaton)
+        simulator.set_targets(["Q1"])
+
+        simulator.run()
+        self.assertTrue(simulator.is_reachable("Q1"))
+        self.assertLess(simulator.explored, 10)
+
+    def test_within_interval_analysis(self):
+        files = ["input/downwards_acceleration_example.dot",
+                 "input/simple_double_loop_up_down.dot",
+                 "input/simple_unbounded_upwards_downwards_loop.dot",
+                 "input/bounded_automaton.dot",
+                 "input/small_steps.dot"]
+
+        for file_name in files:
+            automaton = self.create_automaton(file_name)
+            reached = Simulator(automaton, budget=1000).run()
+
+            manager = ReachManager(automaton)
+            while not manager.is_finished():
+                manager.update_automaton()
+
+            for node in reached:
+                self.assertTrue(manager.is_reachable(node))
+
+    def test_unknown_simulator(self):
+        automaton = self.create_automaton("input/small_steps.dot")
+
+        with self.assertRaises(ValueError):
+            create_simulator(automaton, 100, "unknown")
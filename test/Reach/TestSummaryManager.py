@@ -0,0 +1,87 @@
+import unittest
+import os
+
+from Automaton.DotReader import DotReader
+
+from Reach.Intervals import Intervals
+from Reach.ReachManager import ReachManager
+from Reach.SummaryManager import SummaryManager
+
+
+class TestSummaryManager(unittest.TestCase):
+    @staticmethod
+    def build_file_path(file):
+        base = os.path.dirname(__file__)
+        return os.path.join(base, file)
+
+    def create_automaton(self, file_name, min, max, initial=0):
+        file_name = self.build_file_path(file_name)
+        reader = DotReader(file_name)
+        automaton = reader.create_automaton()
+        automaton.set_lower_bound(min)
+        automaton.set_upper_bound(max)
+        automaton.set_initial_value(initial)
+        return automaton
+
+    def test_reversed_automaton(self):
+        automaton = self.create_automaton("input/simple_automaton.dot",
+                                          -10, 10)
+        manager = SummaryManager(automaton)
+
+        reversed_automaton = manager.reversed
+        self.assertEqual(3, reversed_automaton.get_nr_of_nodes())
+        for start in automaton.get_visible_nodes():
+            for end, edge in automaton.get_outgoing_edges(start).items():
+                operation = reversed_automaton.get_edge_operation(end, start)
+                if edge.get_operation() is None:
+                    self.assertIsNone(operation)
+                else:
+                    self.assertEqual(-edge.get_operation().get_value(),
+                                     operation.get_value())
+
+    def test_guarded_summary(self):
+        automaton = self.create_automaton(
+            "input/downwards_acceleration_example.dot", -10, 10)
+        manager = SummaryManager(automaton)
+
+        self.assertEqual("[-10, 10]", str(manager.get_summary("Q0")))
+        self.assertTrue(manager.is_reachable("Q7", 5))
+        self.assertTrue(manager.is_reachable("Q7", -5))
+        self.assertFalse(manager.is_reachable("Q7", 11))
+
+    def test_initial_intervals(self):
+        # s1 is only reachable from initial values below 2
+        automaton = self.create_automaton("input/bounded_automaton.dot",
+                                          -10, 10)
+        manager = SummaryManager(automaton)
+
+        initial_values = Intervals(0, False, 5, True)
+        self.assertEqual("(0, 2)", str(manager.get_reachable_part(
+            "s1", initial_values)))
+        self.assertTrue(manager.is_reachable_from("s1", initial_values))
+        self.assertFalse(manager.is_reachable_from(
+            "s1", Intervals(2, True, 5, True)))
+
+        initial_values.union(Intervals(-6, True, -4, False))
+        self.assertEqual("[-6, -4) (0, 2)", str(manager.get_reachable_part(
+            "s1", initial_values)))
+
+    def test_matches_forward_analysis(self):
+        files = ["input/downwards_acceleration_example.dot",
+                 "input/simple_double_loop_up_down.dot",
+                 "input/bounded_automaton.dot",
+                 "input/one_node_bounded_automaton.dot"]
+        for file_name in files:
+            automaton = self.create_automaton(file_name, -10, 10)
+            summaries = SummaryManager(automaton)
+
+            for initial in [-9, -4, 0, 3, 9]:
+                automaton = self.create_automaton(file_name, -10, 10,
+                                                  initial)
+                manager = ReachManager(automaton)
+                while not manager.is_finished():
+                    manager.update_automaton()
+
+                for node in automaton.get_visible_nodes():
+                    self.assertEqual(manager.is_reachable(node),
+                                     summaries.is_reachable(node, initial))
@@ -0,0 +1,75 @@
+import unittest
+import os
+
+from Automaton.DotReader import DotReader
+
+from Reach.ReachManager import ReachManager
+
+
+class TestTargets(unittest.TestCase):
+    @staticmethod
+    def build_file_path(file):
+        base = os.path.dirname(__file__)
+        return os.path.join(base, file)
+
+    def initialise_automaton(self, file_name,
+                             min=-float('inf'), max=float('inf'), initial=0):
+        file_name = self.build_file_path(file_name)
+        reader = DotReader(file_name)
+        automaton = reader.create_automaton()
+        automaton.set_lower_bound(min)
+        automaton.set_upper_bound(max)
+        automaton.set_initial_value(initial)
+
+        self.manager = ReachManager(automaton)
+
+    def run_manager(self):
+        while not self.manager.is_finished():
+            self.manager.update_automaton()
+
+    def test_initial_target(self):
+        self.initialise_automaton("input/simple_automaton.dot")
+
+        self.manager.set_targets(["s0"])
+
+        self.assertTrue(self.manager.is_finished())
+        self.assertEqual({"s0"}, self.manager.get_reached_targets())
+
+    def test_stop_when_targets_reached(self):
+        self.initialise_automaton("input/simple_automaton.dot")
+
+        self.manager.set_targets(["s1", "s2"])
+        self.run_manager()
+
+        self.assertEqual({"s1", "s2"}, self.manager.get_reached_targets())
+        self.assertEqual(1, self.manager.n)
+
+    def test_unreachable_target(self):
+        self.initialise_automaton("input/one_node_bounded_automaton.dot",
+                                  50, 150)
+
+        self.manager.set_targets(["s1", "s2"])
+        self.run_manager()
+
+        self.assertFalse(self.manager.get_reached_targets())
+        self.assertFalse(self.manager.is_reachable("s1"))
+        self.assertFalse(self.manager.is_reachable("s2"))
+
+    def test_partially_reachable_targets(self):
+        self.initialise_automaton("input/downwards_acceleration_example.dot")
+
+        targets = ["Q8", "Q13", "Q14"]
+        self.manager.set_targets(targets)
+        self.run_manager()
+
+        self.assertEqual(set(targets), self.manager.get_reached_targets())
+
+    def test_relevant_nodes(self):
+        self.initialise_automaton("input/downwards_acceleration_example.dot")
+
+        self.manager.set_targets(["Q8"])
+
+        self.assertTrue(self.manager.is_relevant("Q7"))
+        self.assertTrue(self.manager.is_relevant("Q15"))
+        self.assertFalse(self.manager.is_relevant("Q13"))
+        self.assertFalse(self.manager.is_relevant("Q14"))
@@ -0,0 +1,41 @@
+import unittest
+
+from Reach.Intervals import Intervals
+from Reach.Transfer import Transfer
+
+
+class TestTransfer(unittest.TestCase):
+    def test_increment(self):
+        intervals = Intervals(0, True, 10, True)
+        intervals.union(Intervals(20, True, 30, False))
+
+        result = Transfer("q0", 5).apply(intervals)
+        self.assertEqual("(0, 15] (20, 35)", str(result))
+        self.assertEqual("[0, 10] [20, 30)", str(intervals))
+
+    def test_decrement(self):
+        intervals = Intervals(0, True, 10, True)
+
+        result = Transfer("q0", -5).apply(intervals)
+        self.assertEqual("[-5, 10)", str(result))
+
+    def test_no_operation(self):
+        intervals = Intervals(0, False, 10, True)
+
+        result = Transfer("q0", 0).apply(intervals)
+        self.assertEqual("(0, 10]", str(result))
+        self.assertIsNot(intervals.get_intervals()[0],
+                         result.get_intervals()[0])
+
+    def test_empty_rescale(self):
+        intervals = Intervals(0, True, 100, True)
+        intervals.rescale_reach(50, 10)
+
+        self.assertTrue(intervals.is_empty())
+
+    def test_overlapping_shift(self):
+        intervals = Intervals(0, True, 1, True)
+        intervals.union(Intervals(3, True, 4, True))
+
+        result = Transfer("q0", 5).apply(intervals)
+        self.assertEqual("(0, 9]", str(result))
@@ -0,0 +1,146 @@
+import importlib.util
+import unittest
+import os
+
+from fractions import Fraction
+
+from Automaton.DotReader import DotReader
+
+from Reach.ReachManager import ReachManager
+from Reach.Simulator import create_simulator
+
+
+@unittest.skipIf(importlib.util.find_spec("numpy") is None,
+                 "numpy is not installed")
+class TestVectorSimulator(unittest.TestCase):
+    @staticmethod
+    def build_file_path(file):
+        base = os.path.dirname(__file__)
+        return os.path.join(base, file)
+
+    def create_simulator(self, file_name, budget=10000, low=-10, high=10,
+                         initial=0, strict_bounds=False):
+        reader = DotReader(self.build_file_path(file_name))
+        automaton = reader.create_automaton()
+        automaton.set_lower_bound(low)
+        automaton.set_upper_bound(high)
+        automaton.set_initial_value(initial)
+        self.automaton = automaton
+
+        from Reach.VectorSimulator import VectorSimulator
+        return VectorSimulator(automaton, budget, trajectories=100,
+                               random_seed=0, strict_bounds=strict_bounds)
+
+    def test_small_steps(self):
+        simulator = self.create_simulator("input/small_steps.dot")
+
+        self.assertEqual({"Q0", "Q1", "Q2"}, simulator.run())
+        self.assertFalse(simulator.is_reachable("Q3"))
+
+    def test_visit_counts(self):
+        simulator = self.create_simulator("input/small_steps.dot", 1000)
+        simulator.run()
+
+        visits = simulator.get_visit_counts()
+        self.assertEqual(1000, simulator.explored)
+        self.assertEqual(1000, sum(visits.values()))
+        self.assertEqual(0, visits["Q3"])
+
+    def test_budget(self):
+        # the last step only moves part of the runs
+        simulator = self.create_simulator("input/small_steps.dot", 1050)
+        simulator.run()
+
+        self.assertEqual(1050, simulator.explored)
+
+    def test_equality_guard(self):
+        # Q8 is only entered with the counter at exactly 5
+        simulator = self.create_simulator(
+            "input/downwards_acceleration_example.dot", 100000, initial=5)
+
+        self.assertTrue(simulator.run() >= {"Q7", "Q8"})
+
+    def test_strict_bounds(self):
+        # Q1 and Q2 are only entered below the upper bound of 1
+        simulator = self.create_simulator("input/small_steps.dot", high=1,
+                                          strict_bounds=True)
+        self.assertEqual({"Q0", "Q1", "Q2"}, simulator.run())
+
+        simulator = self.create_simulator("input/small_steps.dot", high=0,
+                                          strict_bounds=True)
+        self.assertEqual(set(), simulator.run())
+
+    def test_exact_replay(self):
+        simulator = self.create_simulator("input/small_steps.dot")
+        q0, q1, q2, q3 = [simulator.node_indexes[node]
+                          for node in ["Q0", "Q1", "Q2", "Q3"]]
+
+        self.assertTrue(simulator.is_exact([(q0, 0.0), (q1, 0.1),
+                                            (q2, 0.1 + 0.9)]))
+
+        # the increase must be positive and the guard of Q2 holds exactly
+        self.assertFalse(simulator.is_exact([(q0, 0.0), (q1, 1.0),
+                                             (q2, 1.0)]))
+        self.assertFalse(simulator.is_exact([(q0, 0.0), (q1, 0.5),
+                                             (q2, 1.0000000000000002)]))
+
+        # there is no edge from Q0 to Q3
+        self.assertFalse(simulator.is_exact([(q0, 0.0), (q3, 1.0)]))
+
+    def test_exact_replay_of_rounded_step(self):
+        simulator = self.create_simulator("input/simple_automaton.dot")
+        s0, s1, s2 = [simulator.node_indexes[node]
+                      for node in ["s0", "s1", "s2"]]
+
+        # the float 0.1 + 1 lies above 0.1 + 1 in exact arithmetic, the
+        # replay keeps the value at the end of the step
+        self.assertGreater(Fraction(0.1 + 1), Fraction(0.1) + 1)
+        self.assertTrue(simulator.is_exact([(s0, 0.0), (s1, 0.0),
+                                            (s2, 0.1), (s1, 0.1 + 1)]))
+
+    def test_initial_value_out_of_bounds(self):
+        simulator = self.create_simulator("input/small_steps.dot",
+                                          initial=20)
+
+        self.assertEqual(set(), simulator.run())
+
+    def test_stops_at_targets(self):
+        simulator = self.create_simulator("input/small_steps.dot")
+        simulator.set_targets(["Q1"])
+
+        simulator.run()
+        self.assertEqual(200, simulator.explored)
+
+    def test_within_interval_analysis(self):
+        files = ["input/downwards_acceleration_example.dot",
+                 "input/simple_double_loop_up_down.dot",
+                 "input/bounded_automaton.dot",
+                 "input/small_steps.dot"]
+
+        for file_name in files:
+            reached = self.create_simulator(file_name).run()
+
+            manager = ReachManager(self.automaton)
+            while not manager.is_finished():
+                manager.update_automaton()
+
+            for node in reached:
+                self.assertTrue(manager.is_reachable(node))
+
+    def test_created_by_kind(self):
+        self.create_simulator("input/small_steps.dot")
+        simulator = create_simulator(self.automaton, 1000, "vectorised")
+
+        self.assertEqual({"Q0", "Q1", "Q2"}, simulator.run())
+
+    def test_reproducible_from_seed(self):
+        self.create_simulator("input/simple_double_loop_up_down.dot")
+
+        visits = list()
+        for _ in range(2):
+            simulator = create_simulator(self.automaton, 1000, "vectorised",
+                                         random_seed=3)
+            simulator.run()
+            visits.append(simulator.get_visit_counts())
+
+        self.assertEqual(visits[0], visits[1])